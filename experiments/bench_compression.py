@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Response compression benchmark.
+
+Measures bytes on the wire and CPU cost of the monolith's response
+compression for task-list pages of increasing size:
+
+- codings: every page body (as served by GET /tasks/) is compressed with
+  gzip and brotli at several levels using the encoders of
+  app.core.compression. Reported per level: compressed size, ratio, and
+  the CPU time to compress (server) and decompress (client).
+- requests: full GET /tasks/?limit=N requests through the ASGI app and its
+  CompressionMiddleware, as configured by COMPRESSION_* settings, with
+  Accept-Encoding identity, gzip and br. Reported per coding: wire bytes
+  (Content-Length) and request latency. Authentication is bypassed so
+  only the task path is timed.
+
+Usage:
+    python bench_compression.py
+    python bench_compression.py --sizes 10 100 1000 --iterations 50
+"""
+import argparse
+import gzip
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "tasktracker-mono"))
+
+import brotli
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from experiments.lib.io_utils import create_results_dir, write_json
+from app.main import app
+from app.core.compression import BrotliEncoder, GzipEncoder
+from app.core.config import settings
+from app.core.database import Base, get_db
+from app.core.dependencies import get_current_active_user
+from app.core.responses import ModelResponse
+from app.models.task import Task, TaskStatus, TaskPriority
+from app.models.user import User
+from app.schemas.task import TaskOutList, TaskListResponse
+
+# (name, encoder factory, decoder) per compression level measured
+CODECS = [
+    ("gzip-1", lambda: GzipEncoder(1), gzip.decompress),
+    ("gzip-6", lambda: GzipEncoder(6), gzip.decompress),
+    ("gzip-9", lambda: GzipEncoder(9), gzip.decompress),
+    ("br-1", lambda: BrotliEncoder(1), brotli.decompress),
+    ("br-4", lambda: BrotliEncoder(4), brotli.decompress),
+    ("br-6", lambda: BrotliEncoder(6), brotli.decompress),
+    ("br-11", lambda: BrotliEncoder(11), brotli.decompress),
+]
+
+ACCEPT_ENCODINGS = ["identity", "gzip", "br"]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Benchmark bytes on the wire and CPU cost of response compression"
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1, 10, 100, 500, 1000],
+        help="Tasks per page to measure (default: 1 10 100 500 1000)"
+    )
+    parser.add_argument(
+        "--iterations", type=int, default=50,
+        help="Timed runs per coding and page size (default: 50)"
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=5,
+        help="Untimed runs before each measurement (default: 5)"
+    )
+    parser.add_argument(
+        "--output-dir", type=str, default=None,
+        help="Output directory (default: experiments/results/compression_<timestamp>)"
+    )
+    return parser.parse_args()
+
+
+def make_tasks(count: int, owner_id: int) -> List[Task]:
+    """Build varied transient Task rows shaped like real data."""
+    now = datetime.now(timezone.utc)
+    statuses = list(TaskStatus)
+    priorities = list(TaskPriority)
+    return [
+        Task(
+            id=index + 1,
+            title=f"Task {index} - benchmark payload",
+            description=None if index % 3 == 0 else f"Description for task {index}, with some detail.",
+            status=statuses[index % len(statuses)],
+            priority=priorities[index % len(priorities)],
+            is_completed=statuses[index % len(statuses)] == TaskStatus.DONE,
+            due_date=None if index % 2 else now + timedelta(days=index % 30),
+            created_at=now - timedelta(minutes=index),
+            updated_at=now - timedelta(minutes=index // 2),
+            owner_id=owner_id,
+        )
+        for index in range(count)
+    ]
+
+
+def page_body(tasks: List[Task]) -> bytes:
+    """JSON body of a task-list page, encoded as the fast response mode serves it."""
+    page = TaskListResponse(
+        tasks=TaskOutList.validate_python(tasks, from_attributes=True),
+        total=len(tasks), skip=0, limit=len(tasks)
+    )
+    return ModelResponse(page).body
+
+
+def cpu_ms(fn: Callable[[], object], iterations: int, warmup: int) -> float:
+    """Median process CPU time of fn in milliseconds."""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(iterations):
+        start = time.process_time_ns()
+        fn()
+        samples.append((time.process_time_ns() - start) / 1e6)
+    return statistics.median(samples)
+
+
+def measure_codings(sizes: List[int], args) -> Dict[int, Dict[str, Dict[str, float]]]:
+    """Compress each page size with every codec and level."""
+    results = {}
+    for size in sizes:
+        body = page_body(make_tasks(size, owner_id=1))
+        per_codec = {"identity": {"bytes": len(body), "ratio": 1.0, "compress_cpu_ms": 0.0, "decompress_cpu_ms": 0.0}}
+        for name, make_encoder, decode in CODECS:
+            def compress() -> bytes:
+                encoder = make_encoder()
+                return encoder.compress(body) + encoder.finish()
+
+            compressed = compress()
+            if decode(compressed) != body:
+                raise RuntimeError(f"{name} round trip failed")
+            per_codec[name] = {
+                "bytes": len(compressed),
+                "ratio": len(body) / len(compressed),
+                "compress_cpu_ms": cpu_ms(compress, args.iterations, args.warmup),
+                "decompress_cpu_ms": cpu_ms(lambda: decode(compressed), args.iterations, args.warmup),
+            }
+        results[size] = per_codec
+    return results
+
+
+def measure_requests(sizes: List[int], args, db_path: Path) -> Dict[int, Dict[str, Dict[str, float]]]:
+    """Time GET /tasks/ for each page size and Accept-Encoding against a seeded SQLite database."""
+    engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    with SessionLocal() as db:
+        user = User(id=1, email="bench@example.com", username="bench", hashed_password="x")
+        db.add(user)
+        db.add_all(make_tasks(max(sizes), owner_id=1))
+        db.commit()
+        db.refresh(user)
+        db.expunge(user)
+
+    def override_get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_active_user] = lambda: user
+    results = {}
+    try:
+        with TestClient(app) as client:
+            for size in sizes:
+                url = f"{settings.API_V1_PREFIX}/tasks/?limit={size}"
+                results[size] = {}
+                for accept_encoding in ACCEPT_ENCODINGS:
+                    headers = {"Accept-Encoding": accept_encoding}
+                    response = client.get(url, headers=headers)
+                    response.raise_for_status()
+                    wire_bytes = int(response.headers["content-length"])
+
+                    def request():
+                        client.get(url, headers=headers).raise_for_status()
+
+                    for _ in range(args.warmup):
+                        request()
+                    samples = []
+                    for _ in range(args.iterations):
+                        start = time.perf_counter()
+                        request()
+                        samples.append((time.perf_counter() - start) * 1000)
+                    results[size][accept_encoding] = {
+                        "coding": response.headers.get("content-encoding", "identity"),
+                        "wire_bytes": wire_bytes,
+                        "p50_ms": statistics.median(samples),
+                    }
+    finally:
+        app.dependency_overrides.clear()
+        engine.dispose()
+    return results
+
+
+def main():
+    args = parse_args()
+
+    if args.output_dir:
+        results_dir = Path(args.output_dir)
+        results_dir.mkdir(parents=True, exist_ok=True)
+    else:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        results_dir = create_results_dir(timestamp=f"compression_{timestamp}")
+
+    print(f"Compressing task-list pages of {args.sizes} tasks, {args.iterations} runs each\n")
+
+    codings = measure_codings(args.sizes, args)
+    with tempfile.TemporaryDirectory() as tmp:
+        requests = measure_requests(args.sizes, args, Path(tmp) / "bench.db")
+
+    print(f"{'Tasks':>6} {'Codec':<9} {'Bytes':>10} {'Ratio':>7} {'Compress CPU (ms)':>18} {'Decompress CPU (ms)':>20}")
+    for size, per_codec in codings.items():
+        for name, result in per_codec.items():
+            print(f"{size:>6} {name:<9} {result['bytes']:>10} {result['ratio']:>7.1f} "
+                  f"{result['compress_cpu_ms']:>18.3f} {result['decompress_cpu_ms']:>20.3f}")
+
+    print(f"\nRequests (minimum size {settings.COMPRESSION_MINIMUM_SIZE} B, gzip level "
+          f"{settings.COMPRESSION_GZIP_LEVEL}, brotli quality {settings.COMPRESSION_BROTLI_QUALITY})")
+    print(f"{'Tasks':>6} {'Accept':<9} {'Coding':<9} {'Wire bytes':>10} {'p50 (ms)':>10}")
+    for size, per_accept in requests.items():
+        for accept_encoding, result in per_accept.items():
+            print(f"{size:>6} {accept_encoding:<9} {result['coding']:<9} {result['wire_bytes']:>10} {result['p50_ms']:>10.2f}")
+
+    write_json({
+        "config": vars(args),
+        "timestamp": datetime.now().isoformat(),
+        "settings": {
+            "minimum_size": settings.COMPRESSION_MINIMUM_SIZE,
+            "gzip_level": settings.COMPRESSION_GZIP_LEVEL,
+            "brotli_quality": settings.COMPRESSION_BROTLI_QUALITY,
+        },
+        "codings": codings,
+        "requests": requests,
+    }, results_dir / "results.json")
+    print(f"\nResults saved to: {results_dir}")
+
+
+if __name__ == "__main__":
+    main()
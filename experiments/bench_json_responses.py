@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Task list response encoding benchmark.
+
+Compares the monolith's two JSON response modes for GET /tasks/?limit=1000:
+
+- default (FAST_JSON_RESPONSES=False): rows validated one by one into
+  TaskOut, then re-validated against the response_model by FastAPI and
+  encoded with jsonable_encoder and the stdlib json module
+- fast (FAST_JSON_RESPONSES=True): rows validated in one TaskOutList call
+  and serialized once by pydantic-core into a ModelResponse
+
+Two measurements are taken per mode. The stage measurement times
+validation and encoding of an in-memory page in isolation. The request
+measurement issues full GET requests through the ASGI app against a seeded
+SQLite database; authentication is bypassed so only the task path is timed.
+
+Usage:
+    python bench_json_responses.py
+    python bench_json_responses.py --tasks 1000 --iterations 200
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "tasktracker-mono"))
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from experiments.lib.io_utils import create_results_dir, write_json
+from app.main import app
+from app.core.config import settings
+from app.core.database import Base, get_db
+from app.core.dependencies import get_current_active_user
+from app.core.responses import ModelResponse
+from app.models.task import Task, TaskStatus, TaskPriority
+from app.models.user import User
+from app.schemas.task import TaskOut, TaskOutList, TaskListResponse
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Benchmark default and fast JSON encoding of task list responses"
+    )
+    parser.add_argument(
+        "--tasks", type=int, default=1000,
+        help="Tasks per page, i.e. the limit query parameter (default: 1000)"
+    )
+    parser.add_argument(
+        "--iterations", type=int, default=100,
+        help="Timed runs per mode and measurement (default: 100)"
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=10,
+        help="Untimed runs before each mode (default: 10)"
+    )
+    parser.add_argument(
+        "--output-dir", type=str, default=None,
+        help="Output directory (default: experiments/results/json_responses_<timestamp>)"
+    )
+    return parser.parse_args()
+
+
+def make_tasks(count: int, owner_id: int) -> List[Task]:
+    """Build varied transient Task rows shaped like real data."""
+    now = datetime.now(timezone.utc)
+    statuses = list(TaskStatus)
+    priorities = list(TaskPriority)
+    return [
+        Task(
+            id=index + 1,
+            title=f"Task {index} - benchmark payload",
+            description=None if index % 3 == 0 else f"Description for task {index}, with some detail.",
+            status=statuses[index % len(statuses)],
+            priority=priorities[index % len(priorities)],
+            is_completed=statuses[index % len(statuses)] == TaskStatus.DONE,
+            due_date=None if index % 2 else now + timedelta(days=index % 30),
+            created_at=now - timedelta(minutes=index),
+            updated_at=now - timedelta(minutes=index // 2),
+            owner_id=owner_id,
+        )
+        for index in range(count)
+    ]
+
+
+def time_runs(fn: Callable[[], object], iterations: int, warmup: int) -> Dict[str, float]:
+    """Run fn repeatedly and return latency statistics in milliseconds."""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "p50_ms": statistics.median(samples),
+        "p95_ms": samples[max(0, int(round(0.95 * len(samples))) - 1)],
+        "mean_ms": statistics.fmean(samples),
+    }
+
+
+def list_route() -> APIRoute:
+    """Find the GET /tasks/ route to reuse FastAPI's response field for it."""
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.path.endswith("/tasks/") and "GET" in route.methods:
+            return route
+    raise RuntimeError("GET /tasks/ route not found")
+
+
+def measure_stages(tasks: List[Task], args) -> Dict[str, Dict[str, float]]:
+    """Time validation plus encoding of one page, without the database or HTTP."""
+    field = list_route().secure_cloned_response_field
+    loop = asyncio.new_event_loop()
+
+    def default_mode() -> bytes:
+        page = TaskListResponse(
+            tasks=[TaskOut.model_validate(task) for task in tasks],
+            total=len(tasks), skip=0, limit=len(tasks)
+        )
+        content = loop.run_until_complete(serialize_response(field=field, response_content=page))
+        return JSONResponse(content).body
+
+    def fast_mode() -> bytes:
+        page = TaskListResponse(
+            tasks=TaskOutList.validate_python(tasks, from_attributes=True),
+            total=len(tasks), skip=0, limit=len(tasks)
+        )
+        return ModelResponse(page).body
+
+    if json.loads(default_mode()) != json.loads(fast_mode()):
+        raise RuntimeError("Default and fast encodings differ")
+    try:
+        return {
+            "default": time_runs(default_mode, args.iterations, args.warmup),
+            "fast": time_runs(fast_mode, args.iterations, args.warmup),
+            "body_bytes": {"default": len(default_mode()), "fast": len(fast_mode())},
+        }
+    finally:
+        loop.close()
+
+
+def measure_requests(tasks: List[Task], args, db_path: Path) -> Dict[str, Dict[str, float]]:
+    """Time full GET /tasks/ requests against a seeded SQLite database in both modes."""
+    engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    with SessionLocal() as db:
+        user = User(id=1, email="bench@example.com", username="bench", hashed_password="x")
+        db.add(user)
+        db.add_all(tasks)
+        db.commit()
+        db.refresh(user)
+        db.expunge(user)
+
+    def override_get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_active_user] = lambda: user
+    url = f"{settings.API_V1_PREFIX}/tasks/?limit={args.tasks}"
+    results = {}
+    original_mode = settings.FAST_JSON_RESPONSES
+    try:
+        with TestClient(app) as client:
+            for mode, enabled in (("default", False), ("fast", True)):
+                settings.FAST_JSON_RESPONSES = enabled
+
+                def request():
+                    response = client.get(url)
+                    response.raise_for_status()
+
+                results[mode] = time_runs(request, args.iterations, args.warmup)
+    finally:
+        settings.FAST_JSON_RESPONSES = original_mode
+        app.dependency_overrides.clear()
+        engine.dispose()
+    return results
+
+
+def main():
+    args = parse_args()
+
+    if args.output_dir:
+        results_dir = Path(args.output_dir)
+        results_dir.mkdir(parents=True, exist_ok=True)
+    else:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        results_dir = create_results_dir(timestamp=f"json_responses_{timestamp}")
+
+    print(f"Encoding pages of {args.tasks} tasks, {args.iterations} runs per mode\n")
+
+    stages = measure_stages(make_tasks(args.tasks, owner_id=1), args)
+    with tempfile.TemporaryDirectory() as tmp:
+        requests = measure_requests(make_tasks(args.tasks, owner_id=1), args, Path(tmp) / "bench.db")
+
+    print(f"{'Measurement':<12} {'Mode':<8} {'p50 (ms)':>10} {'p95 (ms)':>10}")
+    for name, results in (("stages", stages), ("requests", requests)):
+        for mode in ("default", "fast"):
+            print(f"{name:<12} {mode:<8} {results[mode]['p50_ms']:>10.2f} {results[mode]['p95_ms']:>10.2f}")
+
+    speedups = {
+        name: results["default"]["p50_ms"] / results["fast"]["p50_ms"]
+        for name, results in (("stages", stages), ("requests", requests))
+    }
+    print(f"\nSpeedup (p50): stages {speedups['stages']:.1f}x, requests {speedups['requests']:.1f}x")
+
+    write_json({
+        "config": vars(args),
+        "timestamp": datetime.now().isoformat(),
+        "stages": stages,
+        "requests": requests,
+        "speedup_p50": speedups,
+    }, results_dir / "results.json")
+    print(f"\nResults saved to: {results_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Login password-hash throughput benchmark.
+
+Measures password verification, the CPU-bound part of a login, for a set
+of bcrypt cost factors and argon2id parameter sets. Each setting is timed
+twice:
+
+- serial: one verification at a time, giving per-login latency
+- pool: --workers processes verifying concurrently, as the user-service's
+  password hasher does, giving logins per second
+
+Dividing a target login rate by the per-worker rate gives the number of
+hashing workers (PASSWORD_HASH_WORKERS x user-service replicas) needed for
+that rate.
+
+Usage:
+    python bench_password_hash.py
+    python bench_password_hash.py --bcrypt-rounds 10,12 --argon2 2:19456:1 --workers 4
+    python bench_password_hash.py --target-logins 200
+"""
+import argparse
+import math
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "tasktracker-mono"))
+
+from passlib.hash import argon2
+from experiments.lib.io_utils import create_results_dir, write_json
+from app.core.security import create_password_context
+
+PASSWORD = "benchmark-password-123"
+
+# (scheme, bcrypt rounds, argon2 time cost, argon2 memory cost, argon2 parallelism)
+HashParams = Tuple[str, int, int, int, int]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Benchmark login password verification across hash schemes and costs"
+    )
+    parser.add_argument(
+        "--bcrypt-rounds", type=str, default="10,11,12,13",
+        help="Comma-separated bcrypt cost factors (default: 10,11,12,13)"
+    )
+    parser.add_argument(
+        "--argon2", type=str, default="2:19456:1,3:65536:4",
+        help="Comma-separated argon2id time:memory_kib:parallelism sets; empty to skip "
+             "(default: 2:19456:1,3:65536:4)"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1,
+        help="Worker processes for the pool measurement (default: CPU count)"
+    )
+    parser.add_argument(
+        "--samples", type=int, default=20,
+        help="Serial verifications per setting (default: 20)"
+    )
+    parser.add_argument(
+        "--logins", type=int, default=200,
+        help="Verifications per setting in the pool measurement (default: 200)"
+    )
+    parser.add_argument(
+        "--target-logins", type=float, default=None,
+        help="Login rate to size hashing workers for, in logins per second"
+    )
+    parser.add_argument(
+        "--output-dir", type=str, default=None,
+        help="Output directory (default: experiments/results/password_hash_<timestamp>)"
+    )
+    return parser.parse_args()
+
+
+def build_settings(args) -> List[Tuple[str, HashParams]]:
+    """Expand the command line into labelled hash parameter sets."""
+    settings = []
+    for rounds in filter(None, args.bcrypt_rounds.split(",")):
+        settings.append((f"bcrypt-{rounds}", ("bcrypt", int(rounds), 3, 65536, 4)))
+
+    argon2_sets = [spec for spec in args.argon2.split(",") if spec]
+    if argon2_sets and not argon2.has_backend():
+        print("Warning: argon2-cffi is not installed, skipping argon2id settings")
+        argon2_sets = []
+    for spec in argon2_sets:
+        time_cost, memory_cost, parallelism = (int(part) for part in spec.split(":"))
+        settings.append((
+            f"argon2id-t{time_cost}-m{memory_cost}-p{parallelism}",
+            ("argon2", 12, time_cost, memory_cost, parallelism),
+        ))
+    return settings
+
+
+@lru_cache(maxsize=None)
+def get_context(params: HashParams):
+    """Build (once per process) the CryptContext for a parameter set."""
+    return create_password_context(*params)
+
+
+def verify(params: HashParams, hashed_password: str) -> bool:
+    """Verify the benchmark password; runs in the worker processes."""
+    return get_context(params).verify(PASSWORD, hashed_password)
+
+
+def measure_serial(params: HashParams, hashed_password: str, samples: int) -> Dict[str, float]:
+    """Time verifications one at a time and return latency statistics in milliseconds."""
+    latencies = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        verify(params, hashed_password)
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    return {
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[max(0, int(round(0.95 * len(latencies))) - 1)],
+        "mean_ms": statistics.fmean(latencies),
+    }
+
+
+def measure_pool(executor: ProcessPoolExecutor, params: HashParams, hashed_password: str,
+                 logins: int, workers: int) -> Dict[str, float]:
+    """Run verifications across the pool and return the achieved login rate."""
+    # Warm every worker so context construction is not timed
+    list(executor.map(verify, [params] * workers, [hashed_password] * workers))
+
+    start = time.perf_counter()
+    results = list(executor.map(verify, [params] * logins, [hashed_password] * logins))
+    elapsed = time.perf_counter() - start
+
+    if not all(results):
+        raise RuntimeError("Password verification failed during the benchmark")
+    logins_per_second = logins / elapsed
+    return {
+        "logins_per_second": logins_per_second,
+        "logins_per_second_per_worker": logins_per_second / workers,
+        "elapsed_seconds": elapsed,
+    }
+
+
+def main():
+    args = parse_args()
+
+    if args.output_dir:
+        results_dir = Path(args.output_dir)
+        results_dir.mkdir(parents=True, exist_ok=True)
+    else:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        results_dir = create_results_dir(timestamp=f"password_hash_{timestamp}")
+
+    settings = build_settings(args)
+    results: Dict[str, Dict[str, Any]] = {}
+
+    print(f"Verifying {args.logins} logins per setting on {args.workers} workers\n")
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        for label, params in settings:
+            hashed_password = get_context(params).hash(PASSWORD)
+            verify(params, hashed_password)
+
+            result: Dict[str, Any] = {
+                "scheme": params[0],
+                "bcrypt_rounds": params[1] if params[0] == "bcrypt" else None,
+                "argon2_time_cost": params[2] if params[0] == "argon2" else None,
+                "argon2_memory_cost": params[3] if params[0] == "argon2" else None,
+                "argon2_parallelism": params[4] if params[0] == "argon2" else None,
+                "serial": measure_serial(params, hashed_password, args.samples),
+                "pool": measure_pool(executor, params, hashed_password, args.logins, args.workers),
+            }
+            if args.target_logins:
+                per_worker = result["pool"]["logins_per_second_per_worker"]
+                result["workers_for_target"] = math.ceil(args.target_logins / per_worker)
+            results[label] = result
+
+    print(f"{'Setting':<30} {'p50 (ms)':>10} {'logins/s':>10} {'per worker':>11}"
+          + (f" {'workers':>8}" if args.target_logins else ""))
+    for label, result in results.items():
+        line = (f"{label:<30} {result['serial']['p50_ms']:>10.1f} "
+                f"{result['pool']['logins_per_second']:>10.1f} "
+                f"{result['pool']['logins_per_second_per_worker']:>11.1f}")
+        if args.target_logins:
+            line += f" {result['workers_for_target']:>8}"
+        print(line)
+    if args.target_logins:
+        print(f"\nWorkers = hashing workers needed for {args.target_logins:g} logins/s")
+
+    write_json({
+        "config": vars(args),
+        "timestamp": datetime.now().isoformat(),
+        "cpu_count": os.cpu_count(),
+        "results": results,
+    }, results_dir / "results.json")
+    print(f"\nResults saved to: {results_dir}")
+
+
+if __name__ == "__main__":
+    main()
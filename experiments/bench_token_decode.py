@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Access-token decode microbenchmark.
+
+Times the monolith's JWT decode path the way the auth dependencies use it:
+a small set of tokens decoded over and over, as Locust clients do. Three
+variants are measured per call:
+
+- uncached: decode_access_token (HMAC check and claim parsing every time)
+- cached miss: decode_access_token_cached on a token not yet in the cache
+- cached hit: decode_access_token_cached on a token verified earlier
+
+Usage:
+    python bench_token_decode.py
+    python bench_token_decode.py --tokens 50 --iterations 200000
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from datetime import datetime
+from typing import Callable, Dict, List
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "tasktracker-mono"))
+
+from experiments.lib.io_utils import create_results_dir, write_json
+from app.core.security import create_access_token, decode_access_token, decode_access_token_cached
+from app.core.token_cache import verified_token_cache
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Benchmark JWT decoding with and without the verified-token cache"
+    )
+    parser.add_argument(
+        "--tokens", type=int, default=20,
+        help="Distinct tokens cycled through, e.g. one per simulated user (default: 20)"
+    )
+    parser.add_argument(
+        "--iterations", type=int, default=100000,
+        help="Decode calls per variant (default: 100000)"
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=1000,
+        help="Untimed calls before each variant (default: 1000)"
+    )
+    parser.add_argument(
+        "--output-dir", type=str, default=None,
+        help="Output directory (default: experiments/results/token_decode_<timestamp>)"
+    )
+    return parser.parse_args()
+
+
+def time_calls(fn: Callable[[str], object], tokens: List[str], iterations: int) -> Dict[str, float]:
+    """Call fn over the tokens round-robin and return per-call latency statistics in microseconds."""
+    samples = []
+    count = len(tokens)
+    for i in range(iterations):
+        token = tokens[i % count]
+        start = time.perf_counter_ns()
+        fn(token)
+        samples.append((time.perf_counter_ns() - start) / 1000)
+
+    samples.sort()
+    total_seconds = sum(samples) / 1_000_000
+    return {
+        "p50_us": statistics.median(samples),
+        "p95_us": samples[max(0, int(round(0.95 * len(samples))) - 1)],
+        "p99_us": samples[max(0, int(round(0.99 * len(samples))) - 1)],
+        "mean_us": statistics.fmean(samples),
+        "calls_per_second": len(samples) / total_seconds if total_seconds else 0.0,
+        "calls": len(samples),
+    }
+
+
+def measure_misses(tokens: List[str], iterations: int) -> Dict[str, float]:
+    """Time cached decodes that always miss; the cache is cleared (one entry) after each call."""
+    def decode_after_clear(token: str):
+        decode_access_token_cached(token)
+        verified_token_cache.clear()
+
+    verified_token_cache.clear()
+    return time_calls(decode_after_clear, tokens, iterations)
+
+
+def main():
+    args = parse_args()
+
+    if args.output_dir:
+        results_dir = Path(args.output_dir)
+        results_dir.mkdir(parents=True, exist_ok=True)
+    else:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        results_dir = create_results_dir(timestamp=f"token_decode_{timestamp}")
+
+    tokens = [create_access_token({"sub": str(user_id)}) for user_id in range(1, args.tokens + 1)]
+    if verified_token_cache.maxsize < len(tokens):
+        print(f"Warning: TOKEN_CACHE_SIZE={verified_token_cache.maxsize} is smaller than --tokens")
+
+    results = {}
+
+    print(f"Decoding {args.tokens} tokens, {args.iterations:,} calls per variant\n")
+
+    time_calls(decode_access_token, tokens, args.warmup)
+    results["uncached"] = time_calls(decode_access_token, tokens, args.iterations)
+
+    # Misses include the cache lookup and insert on top of verification
+    results["cached_miss"] = measure_misses(tokens, args.iterations)
+
+    verified_token_cache.clear()
+    time_calls(decode_access_token_cached, tokens, args.warmup)
+    results["cached_hit"] = time_calls(decode_access_token_cached, tokens, args.iterations)
+
+    print(f"{'Variant':<14} {'p50 (us)':>10} {'p95 (us)':>10} {'p99 (us)':>10} {'calls/s':>12}")
+    for variant, stats in results.items():
+        print(f"{variant:<14} {stats['p50_us']:>10.2f} {stats['p95_us']:>10.2f} "
+              f"{stats['p99_us']:>10.2f} {stats['calls_per_second']:>12,.0f}")
+
+    speedup = results["uncached"]["p50_us"] / results["cached_hit"]["p50_us"]
+    print(f"\nCache hit speedup (p50): {speedup:.1f}x")
+
+    write_json({
+        "config": vars(args),
+        "timestamp": datetime.now().isoformat(),
+        "cache_size": verified_token_cache.maxsize,
+        "results": results,
+        "hit_speedup_p50": speedup,
+    }, results_dir / "results.json")
+    print(f"\nResults saved to: {results_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Helpers for database-level benchmarks (query plans and latency).
+"""
+import statistics
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    import psycopg2
+    PSYCOPG2_AVAILABLE = True
+except ImportError:
+    PSYCOPG2_AVAILABLE = False
+
+
+def connect(dsn: str):
+    """Open an autocommit psycopg2 connection (needed for CONCURRENTLY DDL)."""
+    if not PSYCOPG2_AVAILABLE:
+        raise RuntimeError("psycopg2 is required. Install with: pip install psycopg2-binary")
+    conn = psycopg2.connect(dsn)
+    conn.autocommit = True
+    return conn
+
+
+def explain(cursor, sql: str, params: Optional[Sequence[Any]] = None) -> str:
+    """Return the EXPLAIN (ANALYZE, BUFFERS) text plan for a query."""
+    cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {sql}", params)
+    return "\n".join(row[0] for row in cursor.fetchall())
+
+
+def plan_node_types(plan_text: str) -> List[str]:
+    """Extract the node types from a text plan, outermost first."""
+    nodes = []
+    for line in plan_text.splitlines():
+        stripped = line.strip().lstrip("->").strip()
+        if not stripped or stripped.startswith(("Planning", "Execution", "Buffers", "Sort Key",
+                                                "Sort Method", "Filter", "Index Cond", "Recheck",
+                                                "Heap Blocks", "Rows Removed", "Worker", "Output")):
+            continue
+        if "(cost=" in stripped:
+            nodes.append(stripped.split("  (cost=")[0].split(" (cost=")[0])
+    return nodes
+
+
+def time_query(
+    cursor,
+    sql: str,
+    params: Optional[Sequence[Any]] = None,
+    repeat: int = 20,
+    warmup: int = 3
+) -> Dict[str, float]:
+    """
+    Run a query repeatedly and return latency statistics in milliseconds.
+
+    Rows are fetched so that the client-side cost of the result is included.
+    """
+    for _ in range(warmup):
+        cursor.execute(sql, params)
+        cursor.fetchall()
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        cursor.execute(sql, params)
+        cursor.fetchall()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    samples.sort()
+    p95_index = max(0, int(round(0.95 * len(samples))) - 1)
+    return {
+        "p50_ms": statistics.median(samples),
+        "p95_ms": samples[p95_index],
+        "mean_ms": statistics.fmean(samples),
+        "min_ms": samples[0],
+        "max_ms": samples[-1],
+        "runs": len(samples)
+    }
@@ -0,0 +1,192 @@
+"""
+Scraping of the services' Prometheus /metrics endpoints.
+
+Counters and histograms are cumulative since each process started, so a
+run's figures are the difference between a scrape before and after it.
+"""
+from typing import Any, Dict, List, Optional
+
+
+def parse_prometheus_text(text: str) -> Dict[str, float]:
+    """Parse Prometheus text format into {sample name (with labels): value}."""
+    samples: Dict[str, float] = {}
+    for line in text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        name, _, value = line.rpartition(" ")
+        try:
+            samples[name] = float(value)
+        except ValueError:
+            continue
+    return samples
+
+
+def scrape_each(urls: List[str], timeout: int = 5) -> Dict[str, Optional[Dict[str, float]]]:
+    """
+    Scrape several /metrics endpoints.
+
+    Args:
+        urls: Metrics endpoint URLs
+        timeout: Per-request timeout in seconds
+
+    Returns:
+        Samples per URL, None for endpoints that could not be scraped
+    """
+    import requests
+    scrapes: Dict[str, Optional[Dict[str, float]]] = {}
+    for url in urls:
+        try:
+            response = requests.get(url, timeout=timeout)
+            response.raise_for_status()
+        except Exception as e:
+            print(f"  Warning: could not scrape {url}: {e}")
+            scrapes[url] = None
+            continue
+        scrapes[url] = parse_prometheus_text(response.text)
+    return scrapes
+
+
+def sum_scrapes(scrapes: Dict[str, Optional[Dict[str, float]]]) -> Optional[Dict[str, float]]:
+    """Sum samples with the same name across scrapes, None if none succeeded."""
+    totals: Dict[str, float] = {}
+    scraped = False
+    for samples in scrapes.values():
+        if samples is None:
+            continue
+        scraped = True
+        for name, value in samples.items():
+            totals[name] = totals.get(name, 0.0) + value
+    return totals if scraped else None
+
+
+def scrape_metrics(urls: List[str], timeout: int = 5) -> Optional[Dict[str, float]]:
+    """
+    Scrape several /metrics endpoints and sum samples with the same name.
+
+    Args:
+        urls: Metrics endpoint URLs
+        timeout: Per-request timeout in seconds
+
+    Returns:
+        Summed samples, None if no endpoint could be scraped
+    """
+    return sum_scrapes(scrape_each(urls, timeout))
+
+
+def cache_summary(before: Optional[Dict[str, float]], after: Optional[Dict[str, float]],
+                  caches: List[str]) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Summarize result-cache effectiveness between two scrapes.
+
+    The saving estimate charges every hit the mean miss latency (the cost of
+    computing the result) minus the mean hit latency.
+
+    Args:
+        before: Samples scraped before the run
+        after: Samples scraped after the run
+        caches: Result cache names, e.g. ["task_list", "user_stats"]
+
+    Returns:
+        Per-cache hits, misses, errors, hit_ratio, mean_hit_ms, mean_miss_ms
+        and saved_seconds; None if either scrape failed
+    """
+    if before is None or after is None:
+        return None
+
+    def delta(name: str) -> float:
+        return after.get(name, 0.0) - before.get(name, 0.0)
+
+    summary = {}
+    for cache in caches:
+        hits = delta(f"{cache}_cache_hits_total")
+        misses = delta(f"{cache}_cache_misses_total")
+        hit_count = delta(f"{cache}_cache_hit_seconds_count")
+        miss_count = delta(f"{cache}_cache_miss_seconds_count")
+        mean_hit = delta(f"{cache}_cache_hit_seconds_sum") / hit_count if hit_count else 0.0
+        mean_miss = delta(f"{cache}_cache_miss_seconds_sum") / miss_count if miss_count else 0.0
+        summary[cache] = {
+            "hits": int(hits),
+            "misses": int(misses),
+            "errors": int(delta(f"{cache}_cache_errors_total")),
+            "hit_ratio": hits / (hits + misses) if hits + misses else 0.0,
+            "mean_hit_ms": mean_hit * 1000,
+            "mean_miss_ms": mean_miss * 1000,
+            "saved_seconds": hits * max(mean_miss - mean_hit, 0.0),
+        }
+    return summary
+
+
+def histogram_quantile(buckets: Dict[float, float], quantile: float) -> Optional[float]:
+    """
+    Estimate a quantile from cumulative histogram buckets.
+
+    Args:
+        buckets: Cumulative count per upper bound (inf for +Inf)
+        quantile: Quantile between 0 and 1
+
+    Returns:
+        Upper bound of the bucket holding the quantile, None if there are no
+        observations or it falls in the +Inf bucket
+    """
+    bounds = sorted(buckets)
+    if not bounds or buckets[bounds[-1]] <= 0:
+        return None
+    rank = quantile * buckets[bounds[-1]]
+    for bound in bounds:
+        if buckets[bound] >= rank:
+            return bound if bound != float("inf") else None
+    return None
+
+
+def histogram_delta(before: Dict[str, float], after: Dict[str, float], name: str) -> Dict[float, float]:
+    """Cumulative bucket counts of a histogram observed between two scrapes."""
+    prefix = f'{name}_bucket{{le="'
+    return {
+        float(sample[len(prefix):-2]): value - before.get(sample, 0.0)
+        for sample, value in after.items()
+        if sample.startswith(prefix)
+    }
+
+
+def pool_summary(before: Optional[Dict[str, float]],
+                 after: Optional[Dict[str, float]]) -> Optional[Dict[str, Any]]:
+    """
+    Summarize one service's database connection pool between two scrapes.
+
+    Wait quantiles are bucket upper bounds, so they are only as precise as
+    the db_pool_checkout_wait_seconds buckets.
+
+    Args:
+        before: The service's samples scraped before the run
+        after: The service's samples scraped after the run
+
+    Returns:
+        Checkouts, timeouts, wait mean/p95/p99, mean connection lifetime and
+        the pool occupancy at the end of the run; None if either scrape
+        failed or the service has no pool metrics
+    """
+    if before is None or after is None or "db_pool_checkouts_total" not in after:
+        return None
+
+    def delta(name: str) -> float:
+        return after.get(name, 0.0) - before.get(name, 0.0)
+
+    def ms(seconds: Optional[float]) -> Optional[float]:
+        return seconds * 1000 if seconds is not None else None
+
+    wait_count = delta("db_pool_checkout_wait_seconds_count")
+    wait_buckets = histogram_delta(before, after, "db_pool_checkout_wait_seconds")
+    closed = delta("db_pool_connection_lifetime_seconds_count")
+    return {
+        "checkouts": int(delta("db_pool_checkouts_total")),
+        "timeouts": int(delta("db_pool_timeouts_total")),
+        "connects": int(delta("db_pool_connects_total")),
+        "mean_wait_ms": delta("db_pool_checkout_wait_seconds_sum") / wait_count * 1000 if wait_count else 0.0,
+        "p95_wait_ms": ms(histogram_quantile(wait_buckets, 0.95)),
+        "p99_wait_ms": ms(histogram_quantile(wait_buckets, 0.99)),
+        "connections_closed": int(closed),
+        "mean_connection_lifetime_s": delta("db_pool_connection_lifetime_seconds_sum") / closed if closed else None,
+        "size": int(after.get("db_pool_size", 0)),
+        "checked_out": int(after.get("db_pool_checked_out", 0)),
+        "overflow": int(after.get("db_pool_overflow", 0)),
+    }
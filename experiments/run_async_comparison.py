@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Sync vs async database mode comparison for the monolith.
+
+Recreates the monolith container with DB_ASYNC=False and then DB_ASYNC=True,
+runs the existing monolith Locust profile at each concurrency level for both
+modes, and prints a side-by-side throughput/latency table.
+
+Usage:
+    python run_async_comparison.py
+    python run_async_comparison.py --concurrency-levels 50,100,200 --duration-seconds 60
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from datetime import datetime
+from typing import Any, Dict, List
+
+import requests
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from experiments.config import (
+    DEFAULT_CONCURRENCY_LEVELS,
+    DEFAULT_DURATION_SECONDS,
+    DEFAULT_WARMUP_SECONDS,
+    DEFAULT_SPAWN_RATE,
+    DEFAULT_SAMPLE_INTERVAL,
+    MONOLITH_BASE_URL,
+    MICROSERVICES_BASE_URL,
+    MONOLITH_COMPOSE_PATH
+)
+from experiments.lib.io_utils import (
+    write_json,
+    append_jsonl,
+    get_project_root
+)
+from experiments.lib.loadtest_runner import check_service_health
+from experiments.run_sweep import run_single_test
+
+DB_MODES = ["sync", "async"]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Compare the monolith's sync and async database modes"
+    )
+
+    parser.add_argument(
+        "--concurrency-levels",
+        type=str,
+        default=",".join(map(str, DEFAULT_CONCURRENCY_LEVELS)),
+        help=f"Comma-separated concurrency levels (default: {','.join(map(str, DEFAULT_CONCURRENCY_LEVELS))})"
+    )
+
+    parser.add_argument(
+        "--duration-seconds",
+        type=int,
+        default=DEFAULT_DURATION_SECONDS,
+        help=f"Test duration in seconds (default: {DEFAULT_DURATION_SECONDS})"
+    )
+
+    parser.add_argument(
+        "--warmup-seconds",
+        type=int,
+        default=DEFAULT_WARMUP_SECONDS,
+        help=f"Warmup time in seconds (default: {DEFAULT_WARMUP_SECONDS})"
+    )
+
+    parser.add_argument(
+        "--spawn-rate",
+        type=int,
+        default=DEFAULT_SPAWN_RATE,
+        help=f"User spawn rate per second (default: {DEFAULT_SPAWN_RATE})"
+    )
+
+    parser.add_argument(
+        "--base-url-monolith",
+        type=str,
+        default=MONOLITH_BASE_URL,
+        help=f"Monolith base URL (default: {MONOLITH_BASE_URL})"
+    )
+
+    parser.add_argument(
+        "--outdir",
+        type=str,
+        default=None,
+        help="Output directory (default: experiments/results/async_comparison_<timestamp>)"
+    )
+
+    parser.add_argument(
+        "--sample-interval",
+        type=float,
+        default=DEFAULT_SAMPLE_INTERVAL,
+        help=f"Docker stats sample interval in seconds (default: {DEFAULT_SAMPLE_INTERVAL})"
+    )
+
+    parser.add_argument(
+        "--startup-timeout",
+        type=int,
+        default=120,
+        help="Seconds to wait for the monolith to become healthy after a restart (default: 120)"
+    )
+
+    args = parser.parse_args()
+    # run_single_test expects the sweep's full argument set
+    args.base_url_micro = MICROSERVICES_BASE_URL
+    return args
+
+
+def restart_monolith(db_mode: str, base_url: str, timeout: int) -> None:
+    """Recreate the monolith app container in the given DB mode and wait for it."""
+    compose_file = get_project_root() / MONOLITH_COMPOSE_PATH
+    env = {**os.environ, "DB_ASYNC": "True" if db_mode == "async" else "False"}
+
+    print(f"\nRecreating monolith with DB_ASYNC={env['DB_ASYNC']}...")
+    subprocess.run(
+        ["docker", "compose", "-f", str(compose_file), "up", "-d", "--force-recreate", "app"],
+        env=env,
+        check=True
+    )
+
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if check_service_health(base_url):
+            reported = requests.get(f"{base_url}/", timeout=5).json().get("db_mode")
+            if reported != db_mode:
+                raise RuntimeError(f"Monolith reports db_mode={reported!r}, expected {db_mode!r}")
+            print(f"✓ Monolith is healthy in {db_mode} mode")
+            return
+        time.sleep(2)
+
+    raise RuntimeError(f"Monolith did not become healthy within {timeout}s")
+
+
+def print_comparison(results: List[Dict[str, Any]]) -> None:
+    """Print throughput and latency for both modes per concurrency level."""
+    by_key = {(r["db_mode"], r["concurrency"]): r for r in results}
+    levels = sorted({r["concurrency"] for r in results})
+
+    print(f"\n{'Users':>6} | {'Mode':>5} | {'RPS':>9} | {'P50 ms':>8} | {'P95 ms':>8} | {'P99 ms':>8} | {'Err %':>6}")
+    print("-" * 66)
+    for concurrency in levels:
+        for db_mode in DB_MODES:
+            r = by_key.get((db_mode, concurrency))
+            if r is None:
+                continue
+            print(
+                f"{concurrency:>6} | {db_mode:>5} | {r['throughput_rps']:>9.2f} | "
+                f"{r['latency_p50_ms']:>8.2f} | {r['latency_p95_ms']:>8.2f} | "
+                f"{r['latency_p99_ms']:>8.2f} | {r['error_rate']:>6.2f}"
+            )
+
+
+def main():
+    args = parse_args()
+    concurrency_levels = [int(x.strip()) for x in args.concurrency_levels.split(",")]
+
+    if args.outdir:
+        results_dir = Path(args.outdir)
+    else:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        results_dir = get_project_root() / "experiments" / "results" / f"async_comparison_{timestamp}"
+    results_dir.mkdir(parents=True, exist_ok=True)
+
+    print("=" * 60)
+    print("SYNC vs ASYNC DATABASE MODE COMPARISON (monolith)")
+    print("=" * 60)
+    print(f"Concurrency levels: {concurrency_levels}")
+    print(f"Duration: {args.duration_seconds}s + {args.warmup_seconds}s warmup")
+    print(f"Results directory: {results_dir}")
+
+    config = {
+        "db_modes": DB_MODES,
+        "concurrency_levels": concurrency_levels,
+        "duration_seconds": args.duration_seconds,
+        "warmup_seconds": args.warmup_seconds,
+        "spawn_rate": args.spawn_rate,
+        "base_url_monolith": args.base_url_monolith,
+        "start_time": datetime.now().isoformat()
+    }
+    write_json(config, results_dir / "config.json")
+
+    all_results = []
+    run_index = 0
+    results_jsonl = results_dir / "results.jsonl"
+
+    for db_mode in DB_MODES:
+        restart_monolith(db_mode, args.base_url_monolith, args.startup_timeout)
+        mode_dir = results_dir / db_mode
+        mode_dir.mkdir(parents=True, exist_ok=True)
+
+        for concurrency in concurrency_levels:
+            try:
+                result = run_single_test(
+                    arch="monolith",
+                    concurrency=concurrency,
+                    args=args,
+                    results_dir=mode_dir,
+                    run_index=run_index
+                )
+                result["db_mode"] = db_mode
+                all_results.append(result)
+                append_jsonl(result, results_jsonl)
+                run_index += 1
+
+                print("\nPausing 5 seconds before next test...")
+                time.sleep(5)
+
+            except Exception as e:
+                print(f"\nError running test {db_mode}@{concurrency}: {e}")
+                import traceback
+                traceback.print_exc()
+                continue
+
+    # Leave the monolith in its default mode
+    restart_monolith("sync", args.base_url_monolith, args.startup_timeout)
+
+    write_json(all_results, results_dir / "all_results.json")
+    config["end_time"] = datetime.now().isoformat()
+    config["total_runs"] = len(all_results)
+    write_json(config, results_dir / "config.json")
+
+    print("\n" + "=" * 60)
+    print("COMPARISON COMPLETE")
+    print("=" * 60)
+    print_comparison(all_results)
+    print(f"\nResults saved to: {results_dir}")
+
+
+if __name__ == "__main__":
+    main()
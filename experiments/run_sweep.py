@@ -28,7 +28,9 @@ from experiments.config import (
     MONOLITH_BASE_URL,
     MICROSERVICES_BASE_URL,
     MONOLITH_CONTAINERS,
-    MICROSERVICES_CONTAINERS
+    MICROSERVICES_CONTAINERS,
+    MICROSERVICES_METRICS_URLS,
+    RESULT_CACHES
 )
 from experiments.lib.io_utils import (
     create_results_dir,
@@ -45,6 +47,7 @@ from experiments.lib.docker_metrics import (
     ResourceMonitor,
     compute_efficiency_metrics
 )
+from experiments.lib.service_metrics import cache_summary, pool_summary, scrape_each, sum_scrapes
 
 
 def parse_args():
@@ -137,9 +140,11 @@ def run_single_test(
     if arch == "monolith":
         base_url = args.base_url_monolith
         containers = MONOLITH_CONTAINERS
+        metrics_urls = [f"{base_url}/metrics"]
     else:
         base_url = args.base_url_micro
         containers = MICROSERVICES_CONTAINERS
+        metrics_urls = MICROSERVICES_METRICS_URLS
     
     # Create run-specific output directory
     run_dir = results_dir / f"run_{run_index:03d}_{arch}_c{concurrency}"
@@ -158,6 +163,7 @@ def run_single_test(
         sample_interval=args.sample_interval
     )
     resource_monitor.start()
+    metrics_before = scrape_each(metrics_urls)
     
     try:
         # Run load test
@@ -177,6 +183,17 @@ def run_single_test(
         print("Stopping resource monitoring...")
         resource_metrics = resource_monitor.stop()
     
+    # Result-cache hit ratio and latency savings over the run
+    metrics_after = scrape_each(metrics_urls)
+    cache = cache_summary(sum_scrapes(metrics_before), sum_scrapes(metrics_after), RESULT_CACHES)
+    
+    # Connection-pool checkouts, waits and timeouts per service over the run
+    pools = {}
+    for url in metrics_urls:
+        summary = pool_summary(metrics_before[url], metrics_after[url])
+        if summary is not None:
+            pools[url] = summary
+    
     # Compute efficiency metrics
     efficiency = compute_efficiency_metrics(
         throughput_rps=result.throughput_rps,
@@ -187,7 +204,9 @@ def run_single_test(
     combined_result = {
         **result.to_dict(),
         "resources": resource_metrics.to_dict(),
-        "efficiency": efficiency
+        "efficiency": efficiency,
+        "cache": cache,
+        "pools": pools
     }
     
     # Save per-run results
@@ -205,6 +224,15 @@ def run_single_test(
     print(f"Memory Used: {efficiency['total_mem_gb']:.2f} GB")
     print(f"RPS per CPU: {efficiency['rps_per_cpu_unit']:.2f}")
     print(f"RPS per GB: {efficiency['rps_per_gb_mem']:.2f}")
+    if cache:
+        for name, stats in cache.items():
+            print(f"Cache {name}: {stats['hit_ratio']:.1%} hits, "
+                  f"{stats['mean_hit_ms']:.2f} ms hit vs {stats['mean_miss_ms']:.2f} ms miss, "
+                  f"{stats['saved_seconds']:.1f} s saved")
+    for url, pool in pools.items():
+        p99 = f"{pool['p99_wait_ms']:.1f} ms" if pool["p99_wait_ms"] is not None else "n/a"
+        print(f"Pool {url}: {pool['checkouts']} checkouts, {pool['mean_wait_ms']:.2f} ms mean wait, "
+              f"p99 <= {p99}, {pool['timeouts']} timeouts")
     
     return combined_result
 
@@ -33,6 +33,18 @@ class Settings(BaseSettings):
         description="Allowed CORS origins"
     )
     
+    # Compression
+    COMPRESSION_ENABLED: bool = Field(default=True, description="Compress responses with brotli or gzip as the client accepts")
+    COMPRESSION_MINIMUM_SIZE: int = Field(default=1024, description="Smaller response bodies are sent uncompressed, in bytes")
+    COMPRESSION_GZIP_LEVEL: int = Field(default=6, ge=1, le=9, description="gzip compression level")
+    COMPRESSION_BROTLI_QUALITY: int = Field(
+        default=4, ge=0, le=11,
+        description="brotli quality; 4 compresses JSON about as well as gzip level 6 for less CPU"
+    )
+    
+    # Timing
+    SERVER_TIMING_ENABLED: bool = Field(default=True, description="Add a Server-Timing header with the request time")
+    
     # Logging
     LOG_LEVEL: str = Field(default="INFO", description="Logging level")
     
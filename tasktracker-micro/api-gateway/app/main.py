@@ -1,8 +1,12 @@
 from fastapi import FastAPI, Request, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
 import httpx
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
+from app.core.metrics import PROMETHEUS_CONTENT_TYPE, registry
+from app.core.timing import TimingMiddleware
 
 # Create FastAPI application
 app = FastAPI(
@@ -11,6 +15,10 @@ app = FastAPI(
     debug=settings.DEBUG,
 )
 
+# Upstream response headers describing the connection rather than the body;
+# Content-Encoding is kept since bodies are passed through still encoded
+EXCLUDED_RESPONSE_HEADERS = {"connection", "keep-alive", "transfer-encoding", "content-length"}
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -20,6 +28,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large responses with the coding the client prefers
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
+
+# Time requests into /metrics and the Server-Timing header; added last so
+# the time includes the other middleware
+app.add_middleware(
+    TimingMiddleware,
+    name="gateway",
+    server_timing=settings.SERVER_TIMING_ENABLED,
+)
+
 
 async def proxy_request(
     request: Request,
@@ -40,6 +65,9 @@ async def proxy_request(
     # Get headers and exclude host
     headers = dict(request.headers)
     headers.pop("host", None)
+    # Services compress for the client; without this httpx would ask for
+    # gzip on behalf of a client that cannot decode it
+    headers.setdefault("accept-encoding", "identity")
     
     # Get query parameters
     query_params = dict(request.query_params)
@@ -53,38 +81,61 @@ async def proxy_request(
     except:
         body = None
     
-    # Make request to microservice
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.request(
-                method=request.method,
-                url=target_url,
-                headers=headers,
-                params=query_params,
-                content=body
-            )
-            
-            # Return response
-            try:
-                content = response.json() if response.text else None
-            except:
-                content = {"detail": response.text} if response.text else None
-            
-            return JSONResponse(
-                status_code=response.status_code,
-                content=content,
-                headers=dict(response.headers)
-            )
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=str(e)
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail=f"Service unavailable: {str(e)}"
-            )
+    # Make request to microservice; the client is closed with the response
+    # body, which for a streamed upstream response outlives this function
+    client = httpx.AsyncClient(timeout=30.0)
+    try:
+        upstream_request = client.build_request(
+            method=request.method,
+            url=target_url,
+            headers=headers,
+            params=query_params,
+            content=body
+        )
+        response = await client.send(upstream_request, stream=True)
+    except httpx.RequestError as e:
+        await client.aclose()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Service unavailable: {str(e)}"
+        )
+    
+    async def close_upstream():
+        await response.aclose()
+        await client.aclose()
+    
+    # Return the body unchanged, with the service's validators (ETag,
+    # Cache-Control) so conditional requests and 304s pass through
+    response_headers = {
+        name: value for name, value in response.headers.items()
+        if name not in EXCLUDED_RESPONSE_HEADERS
+    }
+    
+    # A chunked upstream body (a task export) is relayed chunk by chunk as it
+    # arrives, so the gateway's memory does not grow with the body
+    if response.headers.get("transfer-encoding", "").lower() == "chunked":
+        return StreamingResponse(
+            response.aiter_raw(),
+            status_code=response.status_code,
+            headers=response_headers,
+            background=BackgroundTask(close_upstream)
+        )
+    
+    try:
+        # Raw bytes: a compressed body is passed through, not decoded and recompressed
+        content = b"".join([chunk async for chunk in response.aiter_raw()])
+    except httpx.RequestError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Service unavailable: {str(e)}"
+        )
+    finally:
+        await close_upstream()
+    return Response(
+        status_code=response.status_code,
+        content=content,
+        headers=response_headers
+    )
 
 
 # Root endpoint
@@ -109,6 +160,12 @@ def health_check():
     return {"status": "healthy", "service": "api-gateway"}
 
 
+@app.get("/metrics", tags=["Monitoring"], response_class=PlainTextResponse)
+def metrics() -> PlainTextResponse:
+    """Prometheus metrics endpoint."""
+    return PlainTextResponse(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
 # Route to user-service (authentication endpoints)
 @app.api_route(
     "/api/v1/auth/{path:path}",
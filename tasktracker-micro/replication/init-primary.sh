@@ -0,0 +1,9 @@
+#!/bin/sh
+# Allow the streaming replica to connect (runs once, when the primary's volume is initialized)
+set -e
+
+psql -v ON_ERROR_STOP=1 --username "$POSTGRES_USER" --dbname "$POSTGRES_DB" <<-EOSQL
+    CREATE ROLE replicator WITH REPLICATION LOGIN PASSWORD '${REPLICATION_PASSWORD:-replicator}';
+EOSQL
+
+echo "host replication replicator all scram-sha-256" >> "$PGDATA/pg_hba.conf"
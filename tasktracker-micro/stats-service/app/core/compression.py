@@ -0,0 +1,257 @@
+"""
+Negotiated response compression.
+
+CompressionMiddleware compresses response bodies of at least minimum_size
+bytes with brotli or gzip, whichever the client's Accept-Encoding prefers
+(brotli on a tie, and only when the brotli package is installed).
+Streamed bodies are compressed chunk by chunk whatever their size, and
+each chunk is flushed so the client receives it as soon as it is produced.
+Responses that already carry a Content-Encoding, such as upstream bodies
+passed through by the api-gateway, are sent unchanged.
+
+A strong ETag identifies one exact byte sequence, so a compressed
+response's ETag gets a coding suffix ("7.3" is sent as "7.3-br"). The
+suffix is stripped from If-None-Match before the application sees it and
+restored on the 304, so a client revalidates whichever coding its copy
+used.
+"""
+import zlib
+from typing import Dict, List, Optional, Sequence, Tuple
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+# Content types worth compressing; images, archives and the like already are
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+
+# Every coding an ETag suffix can name, whether or not this process produces it
+ETAG_CODINGS = ("br", "gzip")
+
+
+class GzipEncoder:
+    """Incremental gzip encoder."""
+
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliEncoder:
+    """Incremental brotli encoder."""
+
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(mode=brotli.MODE_TEXT, quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+def negotiate(accept_encoding: str, codings: Sequence[str]) -> Optional[str]:
+    """
+    Pick a content coding for an Accept-Encoding header.
+
+    Args:
+        accept_encoding: Header value, e.g. "gzip, br;q=0.9"
+        codings: Available codings, most preferred first
+
+    Returns:
+        The acceptable coding with the highest q-value (ties go to the
+        earlier one), None to send the body as is
+    """
+    qualities: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        name, _, value = params.partition("=")
+        quality = 1.0
+        if name.strip().lower() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        qualities[coding.strip().lower()] = quality
+    wildcard = qualities.get("*", 0.0)
+    quality, _, coding = max(
+        (qualities.get(coding, wildcard), -rank, coding) for rank, coding in enumerate(codings)
+    )
+    return coding if quality > 0 else None
+
+
+def encoded_etag(etag: str, coding: str) -> str:
+    """ETag of a representation in a content coding; weak ETags are unchanged."""
+    if etag.startswith("W/") or not etag.endswith('"'):
+        return etag
+    return f'{etag[:-1]}-{coding}"'
+
+
+def strip_etag_codings(if_none_match: str, coding: Optional[str]) -> Tuple[str, Dict[str, str]]:
+    """
+    Remove coding suffixes from the entity tags in an If-None-Match header.
+
+    Args:
+        if_none_match: Header value
+        coding: Coding negotiated for this request, preferred when the
+            client sends one tag per coding
+
+    Returns:
+        The header with plain tags, and {plain tag: tag as sent} for
+        restoring the client's tag on a 304
+    """
+    tags: List[str] = []
+    sent: Dict[str, str] = {}
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        for suffix_coding in ETAG_CODINGS:
+            suffix = f'-{suffix_coding}"'
+            if tag.endswith(suffix):
+                plain = tag[:-len(suffix)] + '"'
+                key = plain.removeprefix("W/")
+                if key not in sent or suffix_coding == coding:
+                    sent[key] = tag.removeprefix("W/")
+                tag = plain
+                break
+        tags.append(tag)
+    return ", ".join(tags), sent
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing response bodies with the negotiated coding."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ):
+        """
+        Wrap an application.
+
+        Args:
+            app: ASGI application
+            minimum_size: Bodies smaller than this many bytes are sent uncompressed
+            gzip_level: zlib compression level, 1-9
+            brotli_quality: brotli quality, 0-11
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.codings = ("br", "gzip") if brotli is not None else ("gzip",)
+
+    def encoder(self, coding: str):
+        """New incremental encoder for a coding."""
+        if coding == "br":
+            return BrotliEncoder(self.brotli_quality)
+        return GzipEncoder(self.gzip_level)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = MutableHeaders(scope=scope)
+        coding = negotiate(request_headers.get("accept-encoding", ""), self.codings)
+        sent_etags: Dict[str, str] = {}
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match:
+            request_headers["if-none-match"], sent_etags = strip_etag_codings(if_none_match, coding)
+
+        responder = _CompressionResponder(self, send, coding, sent_etags)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """Per-request send wrapper; holds the start message until the first body chunk."""
+
+    def __init__(self, middleware: CompressionMiddleware, send: Send, coding: Optional[str], sent_etags: Dict[str, str]):
+        self.middleware = middleware
+        self._send = send
+        self.coding = coding
+        self.sent_etags = sent_etags
+        self.start: Optional[Message] = None
+        self.encoder = None
+        self.started = False
+
+    def compressible(self, headers: Headers) -> bool:
+        status = self.start["status"]
+        return (
+            200 <= status < 300
+            and status != 204
+            and "content-encoding" not in headers
+            and headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+        )
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        if not self.started:
+            self.started = True
+            await self.begin(message)
+            return
+
+        if self.encoder is None:
+            await self._send(message)
+            return
+        more_body = message.get("more_body", False)
+        body = self.encode(message.get("body", b""), more_body)
+        if body or not more_body:
+            await self._send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+    async def begin(self, message: Message) -> None:
+        """Decide on the first body chunk whether to compress, then send the start and the chunk."""
+        headers = MutableHeaders(raw=self.start["headers"])
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start["status"] == 304:
+            etag = headers.get("etag")
+            if etag in self.sent_etags:
+                headers["etag"] = self.sent_etags[etag]
+        elif self.compressible(headers) and (more_body or len(body) >= self.middleware.minimum_size):
+            headers.add_vary_header("Accept-Encoding")
+            if self.coding is not None:
+                self.encoder = self.middleware.encoder(self.coding)
+                headers["content-encoding"] = self.coding
+                if "etag" in headers:
+                    headers["etag"] = encoded_etag(headers["etag"], self.coding)
+                body = self.encode(body, more_body)
+                if more_body:
+                    del headers["content-length"]
+                else:
+                    headers["content-length"] = str(len(body))
+
+        await self._send(self.start)
+        await self._send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+    def encode(self, body: bytes, more_body: bool) -> bytes:
+        """Compress a body chunk; a streamed chunk is flushed, the last one ends the stream."""
+        chunk = self.encoder.compress(body)
+        if not more_body:
+            return chunk + self.encoder.finish()
+        # Without a flush the encoder would buffer the stream until its end
+        if body:
+            chunk += self.encoder.flush()
+        return chunk
@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
 from pydantic import Field
+from typing import Literal
 from functools import lru_cache
 
 
@@ -19,6 +20,7 @@ class Settings(BaseSettings):
         description="Secret key for JWT validation"
     )
     ALGORITHM: str = Field(default="HS256", description="JWT algorithm")
+    TOKEN_CACHE_SIZE: int = Field(default=10000, description="Maximum number of verified access tokens to cache (0 disables)")
     
     # Service URLs
     TASK_SERVICE_URL: str = Field(
@@ -26,12 +28,34 @@ class Settings(BaseSettings):
         description="Task service URL"
     )
     
+    # Result Cache
+    CACHE_BACKEND: Literal["none", "redis"] = Field(
+        default="none",
+        description="Stats cache: none or redis, sharing the task-service's cache (and its owner versions) via CACHE_URL"
+    )
+    CACHE_URL: str = Field(default="redis://localhost:6379/0", description="Redis-protocol server URL for the redis cache backend")
+    CACHE_TTL_SECONDS: float = Field(default=60.0, description="Lifetime of cached stats")
+    CACHE_MAX_ENTRIES: int = Field(default=10000, description="Maximum entries in the memory cache backend")
+    CACHE_TIMEOUT_SECONDS: float = Field(default=0.05, description="Redis cache socket timeout; slower calls bypass the cache")
+    
     # CORS
     BACKEND_CORS_ORIGINS: list[str] = Field(
         default=["http://localhost:3000", "http://localhost:8000", "http://localhost:8080"],
         description="Allowed CORS origins"
     )
     
+    # Compression
+    COMPRESSION_ENABLED: bool = Field(default=True, description="Compress responses with brotli or gzip as the client accepts")
+    COMPRESSION_MINIMUM_SIZE: int = Field(default=1024, description="Smaller response bodies are sent uncompressed, in bytes")
+    COMPRESSION_GZIP_LEVEL: int = Field(default=6, ge=1, le=9, description="gzip compression level")
+    COMPRESSION_BROTLI_QUALITY: int = Field(
+        default=4, ge=0, le=11,
+        description="brotli quality; 4 compresses JSON about as well as gzip level 6 for less CPU"
+    )
+    
+    # Timing
+    SERVER_TIMING_ENABLED: bool = Field(default=True, description="Add a Server-Timing header with the request time")
+    
     # Logging
     LOG_LEVEL: str = Field(default="INFO", description="Logging level")
     
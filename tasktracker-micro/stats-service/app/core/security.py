@@ -1,6 +1,7 @@
 from typing import Optional, Dict, Any
 from jose import jwt, JWTError
 from app.core.config import settings
+from app.core.token_cache import verified_token_cache
 
 
 def decode_access_token(token: str) -> Optional[Dict[str, Any]]:
@@ -19,3 +20,20 @@ def decode_access_token(token: str) -> Optional[Dict[str, Any]]:
     except JWTError:
         return None
 
+
+def decode_access_token_cached(token: str) -> Optional[Dict[str, Any]]:
+    """
+    Decode a JWT access token, reusing an earlier verification of the same token.
+    
+    Args:
+        token: The JWT token to decode
+        
+    Returns:
+        The decoded token payload if valid, None otherwise
+    """
+    payload = verified_token_cache.get(token)
+    if payload is None:
+        payload = decode_access_token(token)
+        if payload is not None:
+            verified_token_cache.set(token, payload)
+    return payload
@@ -1,6 +1,10 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
+from app.core.metrics import PROMETHEUS_CONTENT_TYPE, registry
+from app.core.timing import TimingMiddleware
 from app.routers import stats_router
 
 # Create FastAPI application
@@ -19,6 +23,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large responses with the coding the client prefers
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
+
+# Time requests into /metrics and the Server-Timing header; added last so
+# the time includes the other middleware
+app.add_middleware(
+    TimingMiddleware,
+    name="stats",
+    server_timing=settings.SERVER_TIMING_ENABLED,
+)
+
 # Include routers
 app.include_router(stats_router, prefix="/api/v1")
 
@@ -38,3 +59,8 @@ def health_check():
     """Health check endpoint."""
     return {"status": "healthy", "service": "stats-service"}
 
+
+@app.get("/metrics", tags=["Monitoring"], response_class=PlainTextResponse)
+def metrics() -> PlainTextResponse:
+    """Prometheus metrics endpoint."""
+    return PlainTextResponse(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, Response
 from fastapi.security import OAuth2PasswordBearer
 from app.core.dependencies import get_current_user_id
-from app.services.stats_service import StatsService
+from app.core.conditional import etag_headers, not_modified
+from app.services.stats_service import StatsNotModified, StatsService
 from app.schemas.stats import StatsResponse
 
 router = APIRouter(prefix="/stats", tags=["Statistics"])
@@ -17,6 +19,8 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
     description="Get statistics for the authenticated user including total tasks and completion percentage."
 )
 def get_stats(
+    response: Response,
+    if_none_match: Optional[str] = Header(None, description="ETag of a cached copy; answered with 304 while it is current"),
     user_id: int = Depends(get_current_user_id),
     token: str = Depends(oauth2_scheme)
 ) -> StatsResponse:
@@ -30,14 +34,21 @@ def get_stats(
     - Completion percentage
     
     Args:
+        response: Response whose headers carry the validators
+        if_none_match: Optional ETag of the client's cached copy
         user_id: Authenticated user ID (from JWT)
         token: JWT authentication token
         
     Returns:
-        StatsResponse with aggregated statistics
+        StatsResponse with aggregated statistics, or 304 Not Modified
     """
     stats_service = StatsService(token)
-    stats = stats_service.get_user_stats(user_id)
+    try:
+        result = stats_service.get_user_stats(user_id, if_none_match)
+    except StatsNotModified as e:
+        return not_modified(e.etag)
     
-    return StatsResponse(**stats)
+    if result["etag"] is not None:
+        response.headers.update(etag_headers(result["etag"]))
+    return StatsResponse(**result["stats"])
 
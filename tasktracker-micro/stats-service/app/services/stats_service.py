@@ -1,12 +1,28 @@
 import requests
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from pydantic import TypeAdapter
+from app.core.cache import ResultCache
+from app.core.conditional import etag_matches
 from app.core.config import settings
 
+# Per-user statistics with the task-service's ETag for them; the task-service
+# bumps the owner versions on every task write, so entries are invalidated
+# only when the cache is shared
+user_stats_cache: ResultCache[Dict[str, Any]] = ResultCache("user_stats", TypeAdapter(Dict[str, Any]))
+
+
+class StatsNotModified(Exception):
+    """Raised when the client's cached copy of the statistics is current."""
+    
+    def __init__(self, etag: str):
+        super().__init__(etag)
+        self.etag = etag
+
 
 class StatsService:
     """
     Service for statistics operations.
-    Communicates with task-service to get task data and calculate statistics.
+    Communicates with task-service to get task counts and calculate statistics.
     """
     
     def __init__(self, token: str):
@@ -19,58 +35,79 @@ class StatsService:
         self.token = token
         self.task_service_url = settings.TASK_SERVICE_URL
     
-    def get_user_stats(self, user_id: int) -> Dict[str, Any]:
+    def get_user_stats(self, user_id: int, if_none_match: Optional[str] = None) -> Dict[str, Any]:
         """
         Get statistics for a specific user.
         
+        The task-service's ETag for its counts also identifies the statistics
+        derived from them, so it is passed through to the client.
+        
         Args:
             user_id: The authenticated user's ID
+            if_none_match: Optional If-None-Match header from the client
             
         Returns:
-            Dictionary with total_tasks, completed_tasks, and completed_percentage
+            Dictionary with stats (total_tasks, completed_tasks, and
+            completed_percentage) and their etag (None when unavailable)
+            
+        Raises:
+            StatsNotModified: If if_none_match matches the current ETag
         """
-        # Make request to task-service to get all tasks
-        headers = {"Authorization": f"Bearer {self.token}"}
-        
         try:
-            # Get all tasks (use max allowed limit of 1000)
-            response = requests.get(
-                f"{self.task_service_url}/api/v1/tasks/?limit=1000",
-                headers=headers,
-                timeout=5
-            )
-            
-            if response.status_code != 200:
-                return {
+            result = user_stats_cache.get_or_compute(user_id, "", lambda: self._fetch_stats(if_none_match))
+        except requests.RequestException as e:
+            # Log error and return default values; failures are not cached
+            print(f"Error communicating with task-service: {e}")
+            return {
+                "stats": {
                     "total_tasks": 0,
                     "completed_tasks": 0,
                     "completed_percentage": 0.0
-                }
-            
-            data = response.json()
-            tasks = data.get("tasks", [])
-            total_tasks = data.get("total", len(tasks))  # Use total count from response
-            
-            completed_tasks = sum(1 for task in tasks if task.get("is_completed", False))
-            
-            # Calculate completion percentage
-            if total_tasks > 0:
-                completed_percentage = round((completed_tasks / total_tasks) * 100, 2)
-            else:
-                completed_percentage = 0.0
-            
-            return {
+                },
+                "etag": None
+            }
+        
+        if result["etag"] is not None and etag_matches(if_none_match, result["etag"]):
+            raise StatsNotModified(result["etag"])
+        return result
+    
+    def _fetch_stats(self, if_none_match: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Compute the statistics from the task-service's counts.
+        
+        Raises:
+            StatsNotModified: If the task-service answers if_none_match with 304
+            requests.RequestException: If the task-service is unreachable or returns an error
+        """
+        # Ask task-service for its aggregate counts (one query on its side,
+        # a primary-key lookup when the client's copy is current)
+        headers = {"Authorization": f"Bearer {self.token}"}
+        if if_none_match:
+            headers["If-None-Match"] = if_none_match
+        response = requests.get(
+            f"{self.task_service_url}/api/v1/tasks/stats",
+            headers=headers,
+            timeout=5
+        )
+        if response.status_code == 304:
+            raise StatsNotModified(response.headers["ETag"])
+        response.raise_for_status()
+        
+        data = response.json()
+        total_tasks = data.get("total", 0)
+        completed_tasks = data.get("completed", 0)
+        
+        # Calculate completion percentage
+        if total_tasks > 0:
+            completed_percentage = round((completed_tasks / total_tasks) * 100, 2)
+        else:
+            completed_percentage = 0.0
+        
+        return {
+            "stats": {
                 "total_tasks": total_tasks,
                 "completed_tasks": completed_tasks,
                 "completed_percentage": completed_percentage
-            }
-            
-        except requests.RequestException as e:
-            # Log error and return default values
-            print(f"Error communicating with task-service: {e}")
-            return {
-                "total_tasks": 0,
-                "completed_tasks": 0,
-                "completed_percentage": 0.0
-            }
-
+            },
+            "etag": response.headers.get("ETag")
+        }
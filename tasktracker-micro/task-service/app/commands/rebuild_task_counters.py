@@ -0,0 +1,37 @@
+"""
+Rebuild the per-owner task_counters table from the tasks table.
+
+Counters are maintained incrementally by TaskRepository; run this after
+bulk imports, manual SQL fixes or any other write that bypassed it.
+
+Usage:
+    python -m app.commands.rebuild_task_counters
+    python -m app.commands.rebuild_task_counters --owner-id 42
+"""
+import argparse
+from app.core.database import SessionLocal
+from app.repositories.task_counter_repository import TaskCounterRepository
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild task counters from the tasks table")
+    parser.add_argument(
+        "--owner-id",
+        type=int,
+        default=None,
+        help="Only rebuild counters for this owner (default: all owners)"
+    )
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        TaskCounterRepository(db).rebuild(args.owner_id)
+    finally:
+        db.close()
+
+    scope = f"owner {args.owner_id}" if args.owner_id is not None else "all owners"
+    print(f"Rebuilt task counters for {scope}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+"""
+Owner-versioned result cache.
+
+Task-list pages and task statistics are cached per owner. Every cache key
+embeds the owner's current version, and every write in TaskRepository bumps
+that version once its transaction has committed. One INCR therefore
+invalidates all of an owner's cached results: the old entries are never
+read again and age out by TTL or LRU eviction.
+
+Bumping after the commit means a reader that sees the new version also
+sees the write. Reads served by a lagging replica can still be cached under
+the new version; CACHE_TTL_SECONDS bounds how long such an entry, or one
+left behind by a write made outside the repositories, stays visible.
+
+The backend is chosen by CACHE_BACKEND:
+
+- memory: a bounded LRU dictionary in this process; only correct while a
+  single process serves all of an owner's requests
+- redis: any server speaking the Redis protocol, shared by every process
+  and service pointing at the same CACHE_URL
+
+A failing backend never fails a request: lookups compute the result
+directly and the error is counted.
+"""
+import hashlib
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Awaitable, Callable, Generic, Optional, Tuple, TypeVar
+from anyio import to_thread
+from pydantic import TypeAdapter
+from app.core.config import settings
+from app.core.metrics import Histogram, registry
+
+T = TypeVar("T")
+
+
+class CacheUnavailableError(Exception):
+    """Raised by a backend that cannot reach its store."""
+
+
+class CacheBackend:
+    """Byte-string key/value store with expiry and atomic counters."""
+
+    # Calls block on network I/O; async callers run them in a worker thread
+    blocking = False
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get a value, None if missing or expired."""
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        """Store a value, expiring after ttl_seconds (never when None)."""
+        raise NotImplementedError
+
+    def add(self, key: str, value: bytes) -> bool:
+        """Store a value only if the key is missing; True if it was stored."""
+        raise NotImplementedError
+
+    def incr(self, key: str) -> int:
+        """Atomically increment an integer value (missing counts as 0) and return it."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Drop every entry held by this process; shared backends keep theirs."""
+
+
+class InProcessBackend(CacheBackend):
+    """LRU dictionary with per-entry expiry, local to this process."""
+
+    def __init__(self, max_entries: int):
+        """
+        Initialize an empty backend.
+
+        Args:
+            max_entries: Maximum number of entries, versions included
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Optional[float], bytes]]" = OrderedDict()
+        self._lock = Lock()
+
+    def _get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _set(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + ttl_seconds if ttl_seconds is not None else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            return self._get(key)
+
+    def set(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        with self._lock:
+            self._set(key, value, ttl_seconds)
+
+    def add(self, key: str, value: bytes) -> bool:
+        with self._lock:
+            if self._get(key) is not None:
+                return False
+            self._set(key, value)
+            return True
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            value = int(self._get(key) or 0) + 1
+            self._set(key, str(value).encode())
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisBackend(CacheBackend):
+    """Shared store on a Redis-protocol server (Redis, Valkey, KeyDB, Dragonfly)."""
+
+    blocking = True
+
+    def __init__(self, url: str, timeout_seconds: float):
+        """
+        Connect lazily to the server.
+
+        Args:
+            url: Server URL, e.g. redis://cache:6379/0
+            timeout_seconds: Connect and socket timeout; a slow cache is treated as unavailable
+        """
+        import redis
+
+        self._errors = (redis.RedisError,)
+        self._client = redis.Redis.from_url(
+            url,
+            socket_timeout=timeout_seconds,
+            socket_connect_timeout=timeout_seconds,
+        )
+
+    def _call(self, method: str, *args, **kwargs):
+        try:
+            return getattr(self._client, method)(*args, **kwargs)
+        except self._errors as e:
+            raise CacheUnavailableError(str(e)) from e
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._call("get", key)
+
+    def set(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        px = max(1, int(ttl_seconds * 1000)) if ttl_seconds is not None else None
+        self._call("set", key, value, px=px)
+
+    def add(self, key: str, value: bytes) -> bool:
+        return bool(self._call("set", key, value, nx=True))
+
+    def incr(self, key: str) -> int:
+        return int(self._call("incr", key))
+
+
+def create_backend(kind: str, url: str, max_entries: int, timeout_seconds: float) -> Optional[CacheBackend]:
+    """
+    Build the configured backend.
+
+    Args:
+        kind: "none", "memory" or "redis"
+        url: Server URL for the redis backend
+        max_entries: Entry limit for the memory backend
+        timeout_seconds: Socket timeout for the redis backend
+
+    Returns:
+        The backend, None when caching is disabled
+    """
+    if kind == "memory":
+        return InProcessBackend(max_entries)
+    if kind == "redis":
+        return RedisBackend(url, timeout_seconds)
+    return None
+
+
+class OwnerVersions:
+    """Per-owner version numbers embedded in every cache key."""
+
+    def __init__(self, backend: Optional[CacheBackend]):
+        self.backend = backend
+        self.bumps = 0
+        self.errors = 0
+
+    @staticmethod
+    def key(owner_id: int) -> str:
+        return f"owner:{owner_id}:version"
+
+    def _seed(self, key: str) -> None:
+        # A version lost to eviction restarts from the clock, never from a
+        # number that earlier (possibly stale) entries were stored under
+        self.backend.add(key, str(time.time_ns()).encode())
+
+    def get(self, owner_id: int) -> str:
+        """
+        Current version of an owner's cached results.
+
+        Raises:
+            CacheUnavailableError: If the backend cannot be reached
+        """
+        key = self.key(owner_id)
+        version = self.backend.get(key)
+        if version is None:
+            self._seed(key)
+            version = self.backend.get(key) or b"0"
+        return version.decode()
+
+    def bump(self, owner_id: int) -> None:
+        """Invalidate every cached result of an owner; call after the write has committed."""
+        if self.backend is None:
+            return
+        key = self.key(owner_id)
+        try:
+            self._seed(key)
+            self.backend.incr(key)
+            self.bumps += 1
+        except CacheUnavailableError:
+            self.errors += 1
+
+    async def abump(self, owner_id: int) -> None:
+        """Async bump(), off the event loop for blocking backends."""
+        if self.backend is not None and self.backend.blocking:
+            await to_thread.run_sync(self.bump, owner_id)
+        else:
+            self.bump(owner_id)
+
+
+class ResultCache(Generic[T]):
+    """Cache of one kind of per-owner result, stored as JSON under the owner's version."""
+
+    def __init__(self, name: str, adapter: TypeAdapter, versions: Optional[OwnerVersions] = None):
+        """
+        Initialize the cache and register its metrics.
+
+        Args:
+            name: Key prefix and metric name prefix, e.g. "task_list"
+            adapter: TypeAdapter of the cached result type, for (de)serialization
+            versions: Owner versions to key by (default: the process-wide owner_versions)
+        """
+        self.name = name
+        self.adapter = adapter
+        self.versions = versions or owner_versions
+        self.ttl_seconds = settings.CACHE_TTL_SECONDS
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.hit_seconds = registry.register_histogram(
+            f"{name}_cache_hit_seconds", f"Time to serve a {name} result from the cache", Histogram()
+        )
+        self.miss_seconds = registry.register_histogram(
+            f"{name}_cache_miss_seconds", f"Time to compute and store an uncached {name} result", Histogram()
+        )
+        registry.register(f"{name}_cache_hits_total", "counter", f"{name} results served from the cache", lambda: self.hits)
+        registry.register(f"{name}_cache_misses_total", "counter", f"{name} results computed on a cache miss", lambda: self.misses)
+        registry.register(f"{name}_cache_errors_total", "counter", f"{name} cache operations that failed", lambda: self.errors)
+
+    @property
+    def backend(self) -> Optional[CacheBackend]:
+        return self.versions.backend
+
+    def _key(self, owner_id: int, params: str) -> str:
+        digest = hashlib.blake2b(params.encode(), digest_size=16).hexdigest()
+        return f"{self.name}:{owner_id}:{self.versions.get(owner_id)}:{digest}"
+
+    def _lookup(self, owner_id: int, params: str) -> Tuple[Optional[str], Optional[bytes]]:
+        """Return (key, cached JSON); a None key means the backend failed and nothing is stored."""
+        try:
+            key = self._key(owner_id, params)
+            return key, self.backend.get(key)
+        except CacheUnavailableError:
+            self.errors += 1
+            return None, None
+
+    def _store(self, key: Optional[str], value: T) -> None:
+        if key is None:
+            return
+        try:
+            self.backend.set(key, self.adapter.dump_json(value), self.ttl_seconds)
+        except CacheUnavailableError:
+            self.errors += 1
+
+    def _hit(self, cached: bytes, start: float) -> T:
+        value = self.adapter.validate_json(cached)
+        self.hits += 1
+        self.hit_seconds.observe(time.perf_counter() - start)
+        return value
+
+    def get_or_compute(self, owner_id: int, params: str, compute: Callable[[], T]) -> T:
+        """
+        Get a cached result or compute and cache it.
+
+        Args:
+            owner_id: Owner whose data the result is derived from
+            params: Canonical string of every input besides the owner
+            compute: Computes the result on a miss; exceptions propagate uncached
+
+        Returns:
+            The cached or freshly computed result
+        """
+        if self.backend is None:
+            return compute()
+        start = time.perf_counter()
+        key, cached = self._lookup(owner_id, params)
+        if cached is not None:
+            return self._hit(cached, start)
+        self.misses += 1
+        value = compute()
+        self._store(key, value)
+        self.miss_seconds.observe(time.perf_counter() - start)
+        return value
+
+    async def aget_or_compute(self, owner_id: int, params: str, compute: Callable[[], Awaitable[T]]) -> T:
+        """Async get_or_compute(); compute is awaited, blocking backend calls run in a worker thread."""
+        backend = self.backend
+        if backend is None:
+            return await compute()
+        start = time.perf_counter()
+        if backend.blocking:
+            key, cached = await to_thread.run_sync(self._lookup, owner_id, params)
+        else:
+            key, cached = self._lookup(owner_id, params)
+        if cached is not None:
+            return self._hit(cached, start)
+        self.misses += 1
+        value = await compute()
+        if backend.blocking:
+            await to_thread.run_sync(self._store, key, value)
+        else:
+            self._store(key, value)
+        self.miss_seconds.observe(time.perf_counter() - start)
+        return value
+
+
+# Process-wide owner versions over the configured backend
+owner_versions = OwnerVersions(create_backend(
+    settings.CACHE_BACKEND,
+    settings.CACHE_URL,
+    settings.CACHE_MAX_ENTRIES,
+    settings.CACHE_TIMEOUT_SECONDS,
+))
+
+registry.register(
+    "cache_invalidations_total", "counter",
+    "Owner versions bumped by task writes",
+    lambda: owner_versions.bumps
+)
+registry.register(
+    "cache_invalidation_errors_total", "counter",
+    "Owner version bumps that failed; results cached before the write live until their TTL",
+    lambda: owner_versions.errors
+)
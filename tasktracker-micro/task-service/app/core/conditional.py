@@ -0,0 +1,56 @@
+"""
+HTTP conditional requests for owner-scoped reads.
+
+Every task write increments the owner's version in task_counters in the
+same transaction, so (owner, version) identifies the state of all of the
+owner's tasks. Task and stats reads send it as a strong ETag, and answer a
+matching If-None-Match with 304 Not Modified after a single primary-key
+lookup, without loading or serializing any rows.
+
+Routes read the version before the data, so a body is never older than
+its ETag. The owner ID is part of the tag because browsers key their
+cache by URL alone, and every user's task list has the same URL.
+"""
+from typing import Dict, Optional
+from fastapi import Response, status
+
+# Responses are per-user; browsers may store them but must revalidate on every use
+CACHE_CONTROL = "private, no-cache"
+
+
+def owner_etag(owner_id: int, version: int) -> str:
+    """Strong ETag for an owner's data at a version."""
+    return f'"{owner_id}.{version}"'
+
+
+def etag_headers(etag: str) -> Dict[str, str]:
+    """Validator headers sent with 200 and 304 responses."""
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+
+def etag_matches(if_none_match: Optional[str], etag: str, wildcard: bool = True) -> bool:
+    """
+    Evaluate an If-None-Match header against the current ETag.
+
+    If-None-Match uses the weak comparison, so W/ prefixes are ignored.
+
+    Args:
+        if_none_match: Header value: "*" or a comma-separated list of entity tags
+        etag: Current strong ETag
+        wildcard: Whether "*" matches. It matches any current representation,
+            so item routes, which check the version before the item exists,
+            pass False
+
+    Returns:
+        True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return wildcard
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    """Bodiless 304 response carrying the current validators."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=etag_headers(etag))
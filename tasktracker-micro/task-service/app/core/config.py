@@ -1,6 +1,6 @@
 from pydantic_settings import BaseSettings
 from pydantic import Field, PostgresDsn
-from typing import Optional
+from typing import Literal, Optional
 from functools import lru_cache
 
 
@@ -26,6 +26,7 @@ class Settings(BaseSettings):
         description="Secret key for JWT validation"
     )
     ALGORITHM: str = Field(default="HS256", description="JWT algorithm")
+    TOKEN_CACHE_SIZE: int = Field(default=10000, description="Maximum number of verified access tokens to cache (0 disables)")
     
     # CORS
     BACKEND_CORS_ORIGINS: list[str] = Field(
@@ -39,6 +40,63 @@ class Settings(BaseSettings):
     DB_POOL_TIMEOUT: int = Field(default=30, description="Database pool timeout in seconds")
     DB_POOL_RECYCLE: int = Field(default=3600, description="Database pool recycle time in seconds")
     
+    # Read Replicas
+    DATABASE_REPLICA_URLS: list[str] = Field(
+        default=[],
+        description="Streaming replica URLs for read-only repository queries (JSON list)"
+    )
+    DB_REPLICA_MAX_LAG_SECONDS: float = Field(default=5.0, description="Replicas lagging further behind the primary are skipped")
+    DB_REPLICA_LAG_CHECK_INTERVAL_SECONDS: float = Field(default=5.0, description="Seconds between replica lag checks")
+    DB_REPLICA_LAG_CHECK_TIMEOUT_SECONDS: float = Field(
+        default=1.0, gt=0,
+        description="Time limit of a replica lag query and its connect (libpq connects in whole seconds, at least 2)"
+    )
+    DB_REPLICA_FALLBACK_TO_PRIMARY: bool = Field(
+        default=True,
+        description="Read from the primary when no replica is within the lag limit (otherwise use the least-lagged replica)"
+    )
+    
+    # Bulk Operations
+    BULK_MAX_ITEMS: int = Field(default=100, description="Maximum number of items per bulk task request")
+    
+    # Responses
+    FAST_JSON_RESPONSES: bool = Field(
+        default=True,
+        description="Serialize task responses once with pydantic-core and encode other responses with orjson"
+    )
+    
+    # Result Cache
+    CACHE_BACKEND: Literal["none", "memory", "redis"] = Field(
+        default="memory",
+        description="Task-list and stats cache: none, memory (this process only) or redis (shared via CACHE_URL)"
+    )
+    CACHE_URL: str = Field(default="redis://localhost:6379/0", description="Redis-protocol server URL for the redis cache backend")
+    CACHE_TTL_SECONDS: float = Field(
+        default=60.0,
+        description="Lifetime of a cached result; bounds staleness from writes made outside the repositories"
+    )
+    CACHE_MAX_ENTRIES: int = Field(default=10000, description="Maximum entries in the memory cache backend")
+    CACHE_TIMEOUT_SECONDS: float = Field(default=0.05, description="Redis cache socket timeout; slower calls bypass the cache")
+    
+    # Export
+    EXPORT_BATCH_SIZE: int = Field(
+        default=1000, ge=1,
+        description="Rows fetched per round trip from the server-side cursor of a task export"
+    )
+    
+    # Compression
+    COMPRESSION_ENABLED: bool = Field(default=True, description="Compress responses with brotli or gzip as the client accepts")
+    COMPRESSION_MINIMUM_SIZE: int = Field(default=1024, description="Smaller response bodies are sent uncompressed, in bytes")
+    COMPRESSION_GZIP_LEVEL: int = Field(default=6, ge=1, le=9, description="gzip compression level")
+    COMPRESSION_BROTLI_QUALITY: int = Field(
+        default=4, ge=0, le=11,
+        description="brotli quality; 4 compresses JSON about as well as gzip level 6 for less CPU"
+    )
+    
+    # Timing
+    SERVER_TIMING_ENABLED: bool = Field(default=True, description="Add a Server-Timing header with request and SQL time")
+    SLOW_QUERY_SECONDS: float = Field(default=0.5, ge=0, description="Log SQL statements taking at least this long; 0 disables")
+    
     # Logging
     LOG_LEVEL: str = Field(default="INFO", description="Logging level")
     
@@ -1,8 +1,14 @@
+import math
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import NullPool
 from typing import Generator
 from app.core.config import settings
+from app.core.metrics import registry
+from app.core.pool_metrics import instrument_pool
+from app.core.replicas import ReplicaSet, RoutingSession
+from app.core.timing import track_queries
 
 # Create database engine
 engine = create_engine(
@@ -15,8 +21,67 @@ engine = create_engine(
     echo=settings.DEBUG,
 )
 
+# Read replicas; RoutingSession sends replica_read queries to them
+replica_set = ReplicaSet(
+    [
+        create_engine(
+            url,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_pre_ping=True,
+            echo=settings.DEBUG,
+        )
+        for url in settings.DATABASE_REPLICA_URLS
+    ],
+    max_lag_seconds=settings.DB_REPLICA_MAX_LAG_SECONDS,
+    check_interval_seconds=settings.DB_REPLICA_LAG_CHECK_INTERVAL_SECONDS,
+    fallback_to_primary=settings.DB_REPLICA_FALLBACK_TO_PRIMARY,
+    # Lag checks open their own connections with a connect timeout, so an
+    # exhausted or unreachable replica fails its check instead of stalling it
+    probe_engines=[
+        create_engine(
+            url,
+            poolclass=NullPool,
+            connect_args={"connect_timeout": math.ceil(settings.DB_REPLICA_LAG_CHECK_TIMEOUT_SECONDS)},
+        )
+        for url in settings.DATABASE_REPLICA_URLS
+    ],
+    probe_timeout_seconds=settings.DB_REPLICA_LAG_CHECK_TIMEOUT_SECONDS,
+)
+
 # Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(
+    class_=RoutingSession,
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    replicas=replica_set,
+)
+
+# Pool telemetry of the primary engine
+instrument_pool(engine)
+
+# Per-request SQL accounting and the slow-query log, replicas included
+for tracked_engine in [engine, *replica_set.engines]:
+    track_queries(tracked_engine, settings.SLOW_QUERY_SECONDS)
+
+registry.register(
+    "db_replica_reads_total", "counter",
+    "Read-only queries routed to a replica",
+    lambda: replica_set.replica_reads
+)
+registry.register(
+    "db_replica_fallbacks_total", "counter",
+    "Read-only queries sent to the primary because no replica was within the lag limit",
+    lambda: replica_set.primary_fallbacks
+)
+registry.register(
+    "db_replica_lag_seconds", "gauge",
+    "Largest measured replica lag",
+    lambda: replica_set.max_lag()
+)
 
 # Create Base class for models
 Base = declarative_base()
@@ -33,6 +98,14 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def get_session_factory() -> sessionmaker:
+    """
+    Dependency function to get the session factory, for streamed
+    responses that must open a session outliving the request's.
+    """
+    return SessionLocal
+
+
 def init_db():
     """
     Initialize database - create all tables.
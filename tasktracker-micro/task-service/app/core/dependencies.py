@@ -1,7 +1,7 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from typing import Optional
-from app.core.security import decode_access_token
+from app.core.security import decode_access_token_cached
 
 # OAuth2 scheme for token authentication
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
@@ -27,7 +27,7 @@ def get_current_user_id(token: str = Depends(oauth2_scheme)) -> int:
     )
     
     # Decode token
-    payload = decode_access_token(token)
+    payload = decode_access_token_cached(token)
     if payload is None:
         raise credentials_exception
     
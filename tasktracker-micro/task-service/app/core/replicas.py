@@ -0,0 +1,256 @@
+"""
+Read-replica routing.
+
+Repository methods decorated with replica_read send their SELECTs to a
+streaming replica; every other statement goes to the primary. A session is
+pinned to the primary once it writes or enters a primary_write method, so
+reads that follow a write in the same request see that write. ETag
+versions are read with primary_read, which pins the same way, so a
+conditional request never gets a 304 from a replica behind the client's
+own write. Until pinned, a session's reads stay on the first replica
+chosen, so they see one replication point.
+
+Replica lag is measured every DB_REPLICA_LAG_CHECK_INTERVAL_SECONDS in a
+background thread, so reads never wait for the check; they use the last
+measured lags. Replicas lagging more than DB_REPLICA_MAX_LAG_SECONDS, or
+failing the check within DB_REPLICA_LAG_CHECK_TIMEOUT_SECONDS, are skipped,
+as are replicas not yet checked. When no replica is usable, reads fall back to the
+primary, or with fallback disabled to the least-lagged replica.
+"""
+import functools
+import inspect
+import itertools
+import math
+import time
+from contextlib import contextmanager
+from threading import Lock, Thread
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, TypeVar
+from sqlalchemy import Select, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import ORMExecuteState, Session
+
+# Session.info keys
+REPLICA_READ = "replica_read"
+PRIMARY_PINNED = "primary_pinned"
+REPLICA_ENGINE = "replica_engine"
+
+# Seconds since the last replayed transaction, 0 when the replica has replayed all it received
+LAG_QUERY = text(
+    "SELECT CASE WHEN NOT pg_is_in_recovery() "
+    "OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class ReplicaSet:
+    """Replica engines chosen round-robin among those within the lag limit."""
+
+    def __init__(
+        self,
+        engines: Sequence[Engine],
+        max_lag_seconds: float,
+        check_interval_seconds: float,
+        fallback_to_primary: bool = True,
+        probe_engines: Optional[Sequence[Engine]] = None,
+        probe_timeout_seconds: float = 1.0,
+    ):
+        """
+        Initialize the replica set.
+
+        Args:
+            engines: Replica engines (sync engines; pass AsyncEngine.sync_engine in async mode)
+            max_lag_seconds: Replicas lagging further behind the primary are skipped
+            check_interval_seconds: Minimum time between lag measurements
+            fallback_to_primary: Read from the primary when no replica is usable;
+                otherwise use the least-lagged replica
+            probe_engines: Engines the lag checks connect through, one per replica;
+                defaults to the replica engines
+            probe_timeout_seconds: Time limit of a lag query
+        """
+        self.engines = list(engines)
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self.fallback_to_primary = fallback_to_primary
+        self.probe_engines = list(probe_engines) if probe_engines is not None else self.engines
+        self.probe_timeout_seconds = probe_timeout_seconds
+        # Unknown until the first check, so unchecked replicas are not used
+        self.lags: List[float] = [math.inf] * len(self.engines)
+        self.replica_reads = 0
+        self.primary_fallbacks = 0
+        self._checked_at: Optional[float] = None
+        self._cycle = itertools.count()
+        self._lock = Lock()
+
+    @staticmethod
+    def measure_lag(engine: Engine, timeout_seconds: float) -> float:
+        """
+        Measure a replica's replication lag.
+
+        Args:
+            engine: Replica probe engine
+            timeout_seconds: Time limit of the lag query
+
+        Returns:
+            Lag in seconds; 0 for non-PostgreSQL engines, infinity if the
+            replica is unreachable or the query times out
+        """
+        if engine.dialect.name != "postgresql":
+            return 0.0
+        try:
+            with engine.connect() as conn:
+                conn.execute(text(f"SET LOCAL statement_timeout = {max(int(timeout_seconds * 1000), 1)}"))
+                return float(conn.execute(LAG_QUERY).scalar() or 0.0)
+        except SQLAlchemyError:
+            return math.inf
+
+    def check_lag(self) -> None:
+        """Measure every replica's lag now, in the calling thread."""
+        self.lags = [self.measure_lag(engine, self.probe_timeout_seconds) for engine in self.probe_engines]
+        self._checked_at = time.monotonic()
+
+    def refresh(self) -> None:
+        """Start a background lag check if the check interval has passed."""
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < self.check_interval_seconds:
+            return
+        # One check runs at a time; until it finishes reads use the previous values
+        if not self._lock.acquire(blocking=False):
+            return
+        Thread(target=self._check_lag_in_background, name="replica-lag-check", daemon=True).start()
+
+    def _check_lag_in_background(self) -> None:
+        try:
+            self.check_lag()
+        finally:
+            self._lock.release()
+
+    def choose(self, preferred: Optional[Engine] = None) -> Optional[Engine]:
+        """
+        Pick the replica for the next read.
+
+        Args:
+            preferred: Replica to keep while it is usable, e.g. the one a session already read from
+
+        Returns:
+            A replica engine, None to read from the primary
+        """
+        if not self.engines:
+            return None
+        self.refresh()
+        usable = [engine for engine, lag in zip(self.engines, self.lags) if lag <= self.max_lag_seconds]
+        if usable:
+            self.replica_reads += 1
+            if preferred in usable:
+                return preferred
+            return usable[next(self._cycle) % len(usable)]
+        if self.fallback_to_primary:
+            self.primary_fallbacks += 1
+            return None
+        self.replica_reads += 1
+        return min(zip(self.lags, self.engines), key=lambda pair: pair[0])[1]
+
+    def max_lag(self) -> float:
+        """Largest measured lag across replicas, in seconds."""
+        return max(self.lags, default=0.0)
+
+
+class RoutingSession(Session):
+    """Session that sends replica_read SELECTs to a replica and everything else to the primary."""
+
+    def __init__(self, *args: Any, replicas: Optional[ReplicaSet] = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if (
+            self.replicas is not None
+            and self.info.get(REPLICA_READ)
+            and not self.info.get(PRIMARY_PINNED)
+            and not self._flushing
+            and isinstance(clause, Select)
+            and clause._for_update_arg is None
+        ):
+            replica = self.replicas.choose(self.info.get(REPLICA_ENGINE))
+            if replica is not None:
+                self.info[REPLICA_ENGINE] = replica
+                return replica
+        return super().get_bind(mapper, clause=clause, **kw)
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _pin_on_write(orm_execute_state: ORMExecuteState) -> None:
+    """Keep a session on the primary once it has issued a write."""
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info[PRIMARY_PINNED] = True
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _pin_on_flush(session: Session, flush_context: Any) -> None:
+    session.info[PRIMARY_PINNED] = True
+
+
+@contextmanager
+def _replica_scope(info: Dict[str, Any]) -> Iterator[None]:
+    outer = info.get(REPLICA_READ, False)
+    info[REPLICA_READ] = True
+    try:
+        yield
+    finally:
+        info[REPLICA_READ] = outer
+
+
+def replica_read(method: F) -> F:
+    """
+    Mark a read-only repository method as safe to serve from a replica.
+
+    The repository's session (self.db) decides per statement: pinned
+    sessions and locking reads still go to the primary.
+    """
+    if inspect.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            with _replica_scope(self.db.info):
+                return await method(self, *args, **kwargs)
+        return async_wrapper  # type: ignore[return-value]
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with _replica_scope(self.db.info):
+            return method(self, *args, **kwargs)
+    return wrapper  # type: ignore[return-value]
+
+
+def primary_read(method: F) -> F:
+    """
+    Mark a read that must see the primary, such as the version behind an ETag.
+
+    A lagging replica would answer a conditional request with a stale 304,
+    so the read goes to the primary. Like primary_write it pins the session,
+    so rows read after the version come from the database the version
+    describes.
+    """
+    return primary_write(method)
+
+
+def primary_write(method: F) -> F:
+    """
+    Mark a repository write method, pinning its session to the primary.
+
+    Reads the method makes before writing, and every read after it in the
+    same session, go to the primary.
+    """
+    if inspect.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            self.db.info[PRIMARY_PINNED] = True
+            return await method(self, *args, **kwargs)
+        return async_wrapper  # type: ignore[return-value]
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self.db.info[PRIMARY_PINNED] = True
+        return method(self, *args, **kwargs)
+    return wrapper  # type: ignore[return-value]
@@ -0,0 +1,60 @@
+"""
+Fast JSON responses.
+
+For a route with a response_model, FastAPI validates the returned object
+against the model a second time, converts it with jsonable_encoder and
+encodes it with the stdlib json module. Hot routes instead return
+model_response(...): the already-validated model is serialized once by
+pydantic-core straight to bytes, and since a Response is returned FastAPI
+skips its own validation and encoding. The response_model stays on the
+route, so the OpenAPI schema is unchanged.
+
+Other routes are encoded with orjson through ORJSONResponse, the
+application's default response class in this mode.
+"""
+from typing import Dict, Optional, Type, Union
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+from pydantic import BaseModel
+from app.core.config import settings
+
+
+class ModelResponse(Response):
+    """JSON response rendered from a pydantic model by pydantic-core."""
+
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.__pydantic_serializer__.to_json(content)
+
+
+def model_response(
+    model: BaseModel,
+    status_code: int = 200,
+    headers: Optional[Dict[str, str]] = None
+) -> Union[BaseModel, Response]:
+    """
+    Return a validated model as pre-serialized JSON.
+
+    With FAST_JSON_RESPONSES disabled the model is returned unchanged, for
+    FastAPI to validate and encode against the route's response_model; with
+    headers it is encoded the same way (jsonable_encoder) into a JSONResponse.
+
+    Args:
+        model: Response model instance, already validated
+        status_code: HTTP status code; must match the route's status_code
+        headers: Optional extra response headers, e.g. validators
+
+    Returns:
+        A ModelResponse, or the model itself when fast responses are disabled
+    """
+    if not settings.FAST_JSON_RESPONSES:
+        if headers is None:
+            return model
+        return JSONResponse(jsonable_encoder(model), status_code=status_code, headers=headers)
+    return ModelResponse(model, status_code=status_code, headers=headers)
+
+
+def default_response_class() -> Type[Response]:
+    """Response class for routes returning plain data: orjson in fast mode, stdlib json otherwise."""
+    return ORJSONResponse if settings.FAST_JSON_RESPONSES else JSONResponse
@@ -0,0 +1,108 @@
+"""
+Bounded cache of verified JWT access tokens.
+
+Clients reuse the same token for every request until it expires, so the
+signature check and claim parsing only need to happen once per token.
+Entries are keyed by a SHA-256 digest of the token (the raw bearer token
+is never kept) and expire at the token's own "exp" claim.
+"""
+import hashlib
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+from app.core.config import settings
+from app.core.metrics import registry
+
+
+class VerifiedTokenCache:
+    """LRU mapping of token digest to verified claims, evicted at the token's expiry."""
+
+    def __init__(self, maxsize: int):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of cached tokens; 0 disables the cache
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the claims of a previously verified, unexpired token.
+
+        Args:
+            token: JWT access token
+
+        Returns:
+            The verified claims (shared; do not mutate), None on a miss
+        """
+        if self.maxsize <= 0:
+            return None
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.time():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, token: str, payload: Dict[str, Any]) -> None:
+        """
+        Cache the claims of a verified token until its "exp" claim.
+
+        Tokens without a numeric expiry are not cached.
+
+        Args:
+            token: JWT access token
+            payload: Claims returned by signature verification
+        """
+        expires_at = payload.get("exp")
+        if self.maxsize <= 0 or not isinstance(expires_at, (int, float)):
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (float(expires_at), payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached token."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Process-wide verified-token cache
+verified_token_cache = VerifiedTokenCache(settings.TOKEN_CACHE_SIZE)
+
+registry.register(
+    "token_cache_hits_total", "counter",
+    "Access tokens accepted without re-verifying the signature",
+    lambda: verified_token_cache.hits
+)
+registry.register(
+    "token_cache_misses_total", "counter",
+    "Access tokens that needed signature verification",
+    lambda: verified_token_cache.misses
+)
+registry.register(
+    "token_cache_size", "gauge",
+    "Verified access tokens currently cached",
+    lambda: len(verified_token_cache)
+)
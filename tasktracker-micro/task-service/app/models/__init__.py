@@ -1,5 +1,6 @@
 # Models package
 from app.models.task import Task, TaskStatus, TaskPriority
+from app.models.task_counter import TaskCounter
 
-__all__ = ["Task", "TaskStatus", "TaskPriority"]
+__all__ = ["Task", "TaskStatus", "TaskPriority", "TaskCounter"]
 
@@ -1,9 +1,15 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Enum as SQLEnum
+from sqlalchemy import Column, Index, Integer, String, Text, DateTime, Boolean, Enum as SQLEnum, and_
 from sqlalchemy.sql import func
 import enum
+from datetime import datetime, timezone
 from app.core.database import Base
 
 
+def utc_now() -> datetime:
+    """Current time in UTC, for Python-side column defaults."""
+    return datetime.now(timezone.utc)
+
+
 class TaskStatus(str, enum.Enum):
     TODO = "todo"
     IN_PROGRESS = "in_progress"
@@ -19,18 +25,41 @@ class TaskPriority(str, enum.Enum):
 class Task(Base):
     __tablename__ = "tasks"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     status = Column(SQLEnum(TaskStatus, values_callable=lambda obj: [e.value for e in obj]), default=TaskStatus.TODO, nullable=False)
     priority = Column(SQLEnum(TaskPriority, values_callable=lambda obj: [e.value for e in obj]), default=TaskPriority.MEDIUM, nullable=False)
     is_completed = Column(Boolean, default=False, nullable=False)
     due_date = Column(DateTime(timezone=True), nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    # Set by the application so the stored value has the same precision as
+    # the cursor values it is compared with (SQLite's CURRENT_TIMESTAMP has
+    # whole seconds); the server default covers rows inserted outside the ORM
+    created_at = Column(DateTime(timezone=True), default=utc_now, server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Foreign Key (owner_id) - references user-service user ID
-    owner_id = Column(Integer, nullable=False, index=True)
+    owner_id = Column(Integer, nullable=False)
+
+    # PostgreSQL also keeps a generated search_vector column and its GIN
+    # index (migration 005); it is left unmapped so task loads never fetch it
+
+    # Owner-scoped indexes matching the repository query shapes (see migrations 002 and 006)
+    __table_args__ = (
+        Index("ix_tasks_owner_created", owner_id, created_at.desc(), id.desc()),
+        Index("ix_tasks_owner_status_created", owner_id, status, created_at.desc(), id.desc()),
+        Index("ix_tasks_owner_priority_created", owner_id, priority, created_at.desc(), id.desc()),
+        Index(
+            "ix_tasks_owner_incomplete_created",
+            owner_id, created_at.desc(), id.desc(),
+            postgresql_where=(is_completed == False),
+        ),
+        Index(
+            "ix_tasks_owner_due_incomplete",
+            owner_id, due_date, id,
+            postgresql_where=and_(is_completed == False, due_date.is_not(None)),
+        ),
+    )
 
     def __repr__(self):
         return f"<Task(id={self.id}, title={self.title}, status={self.status})>"
@@ -0,0 +1,27 @@
+from sqlalchemy import BigInteger, Column, Integer
+from app.core.database import Base
+
+
+class TaskCounter(Base):
+    """
+    Per-owner task counts, maintained by TaskRepository in the same
+    transaction as every task write so counts are primary-key lookups.
+
+    version is incremented by every task write (and every rebuild), so it
+    identifies the state of all of the owner's tasks; it is the ETag source.
+    """
+    __tablename__ = "task_counters"
+
+    owner_id = Column(Integer, primary_key=True, autoincrement=False)
+    total = Column(Integer, default=0, server_default="0", nullable=False)
+    todo = Column(Integer, default=0, server_default="0", nullable=False)
+    in_progress = Column(Integer, default=0, server_default="0", nullable=False)
+    done = Column(Integer, default=0, server_default="0", nullable=False)
+    completed = Column(Integer, default=0, server_default="0", nullable=False)
+    high_priority = Column(Integer, default=0, server_default="0", nullable=False)
+    medium_priority = Column(Integer, default=0, server_default="0", nullable=False)
+    low_priority = Column(Integer, default=0, server_default="0", nullable=False)
+    version = Column(BigInteger, default=0, server_default="0", nullable=False)
+
+    def __repr__(self):
+        return f"<TaskCounter(owner_id={self.owner_id}, total={self.total})>"
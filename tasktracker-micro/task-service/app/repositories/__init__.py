@@ -1,5 +1,6 @@
 # Repositories package
 from app.repositories.task_repository import TaskRepository
+from app.repositories.task_counter_repository import TaskCounterRepository
 
-__all__ = ["TaskRepository"]
+__all__ = ["TaskRepository", "TaskCounterRepository"]
 
@@ -0,0 +1,211 @@
+from typing import Dict, List, Optional
+from sqlalchemy import Executable, func, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.core.cache import owner_versions
+from app.core.replicas import primary_read, primary_write, replica_read
+from app.models.task import Task, TaskStatus, TaskPriority
+from app.models.task_counter import TaskCounter
+
+
+COUNTER_FIELDS = (
+    "total",
+    "todo",
+    "in_progress",
+    "done",
+    "completed",
+    "high_priority",
+    "medium_priority",
+    "low_priority",
+)
+
+# Every status, priority and completion count, computed in a single pass
+# over the owner's index range (used to rebuild the counters)
+TASK_STATS_COLUMNS = (
+    func.count().label("total"),
+    func.count().filter(Task.status == TaskStatus.TODO).label("todo"),
+    func.count().filter(Task.status == TaskStatus.IN_PROGRESS).label("in_progress"),
+    func.count().filter(Task.status == TaskStatus.DONE).label("done"),
+    func.count().filter(Task.is_completed == True).label("completed"),
+    func.count().filter(Task.priority == TaskPriority.HIGH).label("high_priority"),
+    func.count().filter(Task.priority == TaskPriority.MEDIUM).label("medium_priority"),
+    func.count().filter(Task.priority == TaskPriority.LOW).label("low_priority"),
+)
+
+_DIALECT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def counter_deltas(
+    status: TaskStatus,
+    priority: TaskPriority,
+    is_completed: bool,
+    sign: int = 1
+) -> Dict[str, int]:
+    """
+    Counter changes contributed by a single task.
+
+    Args:
+        status: The task's status
+        priority: The task's priority
+        is_completed: The task's completion flag
+        sign: 1 when the task is added, -1 when it is removed
+
+    Returns:
+        Mapping of counter field to delta
+    """
+    deltas = {"total": sign, status.value: sign, f"{priority.value}_priority": sign}
+    if is_completed:
+        deltas["completed"] = sign
+    return deltas
+
+
+def merge_deltas(*parts: Dict[str, int]) -> Dict[str, int]:
+    """Sum several delta mappings, dropping fields that cancel out."""
+    merged: Dict[str, int] = {}
+    for part in parts:
+        for field, delta in part.items():
+            merged[field] = merged.get(field, 0) + delta
+    return {field: delta for field, delta in merged.items() if delta}
+
+
+def dialect_insert_for(dialect_name: str):
+    """INSERT construct with ON CONFLICT support for a dialect."""
+    dialect_insert = _DIALECT_INSERTS.get(dialect_name)
+    if dialect_insert is None:
+        raise NotImplementedError(f"Task counters do not support the {dialect_name} dialect")
+    return dialect_insert
+
+
+def build_increment(dialect_name: str, owner_id: int, deltas: Dict[str, int]) -> Executable:
+    """
+    Build an upsert adding deltas to an owner's counters row and bumping its version.
+
+    Args:
+        dialect_name: Name of the session's database dialect
+        owner_id: The owner's user ID
+        deltas: Mapping of counter field to delta; may be empty for writes
+            that change no counts
+
+    Returns:
+        INSERT ... ON CONFLICT (owner_id) DO UPDATE statement
+    """
+    table = TaskCounter.__table__
+    stmt = dialect_insert_for(dialect_name)(table).values(owner_id=owner_id, version=1, **deltas)
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c.owner_id],
+        set_={
+            **{field: table.c[field] + stmt.excluded[field] for field in deltas},
+            "version": table.c.version + 1,
+        }
+    )
+
+
+def build_rebuild(dialect_name: str, owner_id: Optional[int] = None) -> List[Executable]:
+    """
+    Build the statements that recompute counters from the tasks table.
+
+    Rows are reset and upserted rather than deleted, so versions keep
+    increasing and ETags issued before the rebuild never match again.
+
+    Args:
+        dialect_name: Name of the session's database dialect
+        owner_id: Restrict the rebuild to one owner; None rebuilds every owner
+
+    Returns:
+        Reset and upsert-from-select statements, to run in order
+    """
+    table = TaskCounter.__table__
+    reset = update(TaskCounter).values(**dict.fromkeys(COUNTER_FIELDS, 0), version=TaskCounter.version + 1)
+    aggregate = select(Task.owner_id, *TASK_STATS_COLUMNS).group_by(Task.owner_id)
+    if owner_id is not None:
+        reset = reset.where(TaskCounter.owner_id == owner_id)
+        aggregate = aggregate.where(Task.owner_id == owner_id)
+    fill = dialect_insert_for(dialect_name)(table).from_select(["owner_id", *COUNTER_FIELDS], aggregate)
+    fill = fill.on_conflict_do_update(
+        index_elements=[table.c.owner_id],
+        set_={field: fill.excluded[field] for field in COUNTER_FIELDS}
+    )
+    return [reset, fill]
+
+
+def empty_counts() -> Dict[str, int]:
+    """Counts for an owner without a counters row (no tasks yet)."""
+    return dict.fromkeys(COUNTER_FIELDS, 0)
+
+
+class TaskCounterRepository:
+    """
+    Repository for the per-owner task_counters table.
+    Increments join the caller's transaction; the caller commits.
+    """
+
+    def __init__(self, db: Session):
+        """
+        Initialize the repository with a database session.
+
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.db = db
+
+    @replica_read
+    def get_counts(self, owner_id: int) -> Dict[str, int]:
+        """
+        Get all task counts for a specific user.
+
+        Args:
+            owner_id: The owner's user ID
+
+        Returns:
+            Dictionary with one entry per counter field
+        """
+        row = self.db.execute(
+            select(*(TaskCounter.__table__.c[field] for field in COUNTER_FIELDS))
+            .where(TaskCounter.owner_id == owner_id)
+        ).first()
+        return dict(row._mapping) if row else empty_counts()
+
+    @primary_read
+    def get_version(self, owner_id: int) -> int:
+        """
+        Get the version of a specific user's tasks.
+
+        Args:
+            owner_id: The owner's user ID
+
+        Returns:
+            Number incremented by every task write; 0 before the first
+        """
+        version = self.db.scalar(select(TaskCounter.version).where(TaskCounter.owner_id == owner_id))
+        return version or 0
+
+    @primary_write
+    def increment(self, owner_id: int, deltas: Dict[str, int]) -> None:
+        """
+        Apply counter deltas for a specific user and bump their version, without committing.
+
+        Args:
+            owner_id: The owner's user ID
+            deltas: Mapping of counter field to delta
+        """
+        dialect_name = self.db.get_bind().dialect.name
+        self.db.execute(build_increment(dialect_name, owner_id, deltas))
+
+    @primary_write
+    def rebuild(self, owner_id: Optional[int] = None) -> None:
+        """
+        Recompute counters from the tasks table and commit.
+
+        Args:
+            owner_id: Restrict the rebuild to one owner; None rebuilds every owner,
+                leaving cached stats to expire after CACHE_TTL_SECONDS
+        """
+        dialect_name = self.db.get_bind().dialect.name
+        for stmt in build_rebuild(dialect_name, owner_id):
+            self.db.execute(stmt)
+        self.db.commit()
+        if owner_id is not None:
+            owner_versions.bump(owner_id)
@@ -1,11 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from typing import Optional
-from app.core.database import get_db
+from fastapi import APIRouter, Depends, Header, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
+from starlette.status import HTTP_400_BAD_REQUEST
+from sqlalchemy.orm import Session, sessionmaker
+from datetime import datetime, timezone
+from typing import Optional, Union
+from app.core.database import get_db, get_session_factory
 from app.core.dependencies import get_current_user_id
-from app.services.task_service import TaskService
-from app.schemas.task import TaskCreate, TaskUpdate, TaskOut, TaskListResponse, TaskStats
+from app.core.conditional import etag_headers, etag_matches, not_modified, owner_etag
+from app.core.responses import model_response
+from app.services.task_service import EXPORT_MEDIA_TYPES, TaskService, stream_export
+from app.schemas.task import TASK_FIELDS, TaskCreate, TaskUpdate, TaskOut, PartialTaskOut, TaskListResponse, PartialTaskListResponse, TaskSearchResponse, TaskDueResponse, TaskStats, TaskFilter, TaskSortField, SortOrder, ExportFormat, TaskBulkCreate, TaskBulkUpdate, TaskBulkDelete, TaskBulkResponse
 from app.models.task import TaskStatus, TaskPriority
+from app.utils.fieldsets import InvalidFieldsError, parse_fields
+from app.utils.pagination import InvalidCursorError
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
@@ -24,12 +31,13 @@ def create_task(
 ) -> TaskOut:
     """Create a new task."""
     task_service = TaskService(db)
-    return task_service.create_task(task_create, user_id)
+    task = task_service.create_task(task_create, user_id)
+    return model_response(task, status_code=status.HTTP_201_CREATED)
 
 
 @router.get(
     "/",
-    response_model=TaskListResponse,
+    response_model=Union[TaskListResponse, PartialTaskListResponse],
     summary="Get all tasks",
     description="Get all tasks for the authenticated user with optional filtering and pagination."
 )
@@ -38,18 +46,60 @@ def get_tasks(
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     status: Optional[TaskStatus] = Query(None, description="Filter by status"),
     priority: Optional[TaskPriority] = Query(None, description="Filter by priority"),
+    is_completed: Optional[bool] = Query(None, description="Filter by completion status"),
+    due_after: Optional[datetime] = Query(None, description="Only tasks due on or after this time"),
+    due_before: Optional[datetime] = Query(None, description="Only tasks due before this time"),
+    created_after: Optional[datetime] = Query(None, description="Only tasks created on or after this time"),
+    created_before: Optional[datetime] = Query(None, description="Only tasks created before this time"),
+    sort_by: TaskSortField = Query(TaskSortField.CREATED_AT, description="Sort key"),
+    order: SortOrder = Query(SortOrder.DESC, description="Sort direction"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor; takes precedence over skip"),
+    fields: Optional[str] = Query(None, description="Comma-separated task fields to return, e.g. id,title,status; default all"),
+    if_none_match: Optional[str] = Header(None, description="ETag of a cached copy; answered with 304 while it is current"),
     db: Session = Depends(get_db),
     user_id: int = Depends(get_current_user_id)
-) -> TaskListResponse:
-    """Get all tasks for the authenticated user."""
+) -> Union[TaskListResponse, PartialTaskListResponse]:
+    """Get all tasks for the authenticated user; 304 Not Modified if If-None-Match is current."""
+    try:
+        field_names = parse_fields(fields, TASK_FIELDS)
+    except InvalidFieldsError as e:
+        raise HTTPException(
+            status_code=HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     task_service = TaskService(db)
-    return task_service.get_tasks(
-        owner_id=user_id,
-        skip=skip,
-        limit=limit,
-        status=status,
-        priority=priority
-    )
+    version = task_service.get_version(user_id)
+    etag = owner_etag(user_id, version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    try:
+        page = task_service.get_tasks(
+            owner_id=user_id,
+            skip=skip,
+            limit=limit,
+            filters=TaskFilter(
+                status=status,
+                priority=priority,
+                is_completed=is_completed,
+                due_after=due_after,
+                due_before=due_before,
+                created_after=created_after,
+                created_before=created_before,
+                sort_by=sort_by,
+                order=order
+            ),
+            cursor=cursor,
+            version=version,
+            fields=field_names
+        )
+    except InvalidCursorError as e:
+        # "status" is shadowed by the status filter in this handler
+        raise HTTPException(
+            status_code=HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    return model_response(page, headers=etag_headers(etag))
 
 
 @router.get(
@@ -59,28 +109,193 @@ def get_tasks(
     description="Get task statistics for the authenticated user."
 )
 def get_task_stats(
+    if_none_match: Optional[str] = Header(None, description="ETag of a cached copy; answered with 304 while it is current"),
     db: Session = Depends(get_db),
     user_id: int = Depends(get_current_user_id)
 ) -> TaskStats:
-    """Get task statistics for the authenticated user."""
+    """Get task statistics for the authenticated user; 304 Not Modified if If-None-Match is current."""
+    task_service = TaskService(db)
+    version = task_service.get_version(user_id)
+    etag = owner_etag(user_id, version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    return model_response(task_service.get_task_stats(user_id), headers=etag_headers(etag))
+
+
+@router.get(
+    "/search",
+    response_model=TaskSearchResponse,
+    summary="Search tasks",
+    description="Full-text search over the authenticated user's task titles and descriptions, best match first."
+)
+def search_tasks(
+    q: str = Query(..., min_length=1, max_length=200, description='Words to find; supports "quoted phrases", or, and -word'),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    db: Session = Depends(get_db),
+    user_id: int = Depends(get_current_user_id)
+) -> TaskSearchResponse:
+    """Search the authenticated user's tasks by title and description, best match first."""
+    task_service = TaskService(db)
+    try:
+        page = task_service.search_tasks(user_id, q, limit, cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    return model_response(page)
+
+
+@router.get(
+    "/overdue",
+    response_model=TaskDueResponse,
+    summary="Get overdue tasks",
+    description="Incomplete tasks of the authenticated user whose due date has passed, oldest due date first."
+)
+def get_overdue_tasks(
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    db: Session = Depends(get_db),
+    user_id: int = Depends(get_current_user_id)
+) -> TaskDueResponse:
+    """Get the authenticated user's incomplete tasks that are past due, oldest due date first."""
+    task_service = TaskService(db)
+    try:
+        page = task_service.get_overdue_tasks(user_id, limit, cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    return model_response(page)
+
+
+@router.get(
+    "/due",
+    response_model=TaskDueResponse,
+    summary="Get tasks by due date",
+    description="Incomplete tasks of the authenticated user due in [after, before), soonest first. after defaults to now."
+)
+def get_due_tasks(
+    after: Optional[datetime] = Query(None, description="Only tasks due on or after this time; default now"),
+    before: Optional[datetime] = Query(None, description="Only tasks due before this time"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    db: Session = Depends(get_db),
+    user_id: int = Depends(get_current_user_id)
+) -> TaskDueResponse:
+    """Get the authenticated user's incomplete tasks due in a window, soonest first."""
     task_service = TaskService(db)
-    return task_service.get_task_stats(user_id)
+    try:
+        page = task_service.get_due_tasks(user_id, after or datetime.now(timezone.utc), before, limit, cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    return model_response(page)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export all tasks",
+    description="Stream every task of the authenticated user as NDJSON or CSV."
+)
+def export_tasks(
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format", description="Export format"),
+    session_factory: sessionmaker = Depends(get_session_factory),
+    user_id: int = Depends(get_current_user_id)
+) -> StreamingResponse:
+    """Stream every task of the authenticated user from a server-side cursor."""
+    return StreamingResponse(
+        stream_export(session_factory, user_id, export_format),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="tasks.{export_format.value}"'}
+    )
+
+
+@router.post(
+    "/bulk",
+    response_model=TaskBulkResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create tasks in bulk",
+    description="Create up to BULK_MAX_ITEMS tasks for the authenticated user in one transaction."
+)
+def bulk_create_tasks(
+    bulk_create: TaskBulkCreate,
+    db: Session = Depends(get_db),
+    user_id: int = Depends(get_current_user_id)
+) -> TaskBulkResponse:
+    """Create several tasks."""
+    task_service = TaskService(db)
+    results = task_service.bulk_create_tasks(bulk_create, user_id)
+    return model_response(results, status_code=status.HTTP_201_CREATED)
+
+
+@router.patch(
+    "/bulk",
+    response_model=TaskBulkResponse,
+    summary="Update tasks in bulk",
+    description="Update up to BULK_MAX_ITEMS tasks for the authenticated user in one transaction. "
+                "Set status to done to complete a task."
+)
+def bulk_update_tasks(
+    bulk_update: TaskBulkUpdate,
+    db: Session = Depends(get_db),
+    user_id: int = Depends(get_current_user_id)
+) -> TaskBulkResponse:
+    """Update several tasks."""
+    task_service = TaskService(db)
+    results = task_service.bulk_update_tasks(bulk_update, user_id)
+    return model_response(results)
+
+
+@router.delete(
+    "/bulk",
+    response_model=TaskBulkResponse,
+    summary="Delete tasks in bulk",
+    description="Delete up to BULK_MAX_ITEMS tasks for the authenticated user in one transaction."
+)
+def bulk_delete_tasks(
+    bulk_delete: TaskBulkDelete,
+    db: Session = Depends(get_db),
+    user_id: int = Depends(get_current_user_id)
+) -> TaskBulkResponse:
+    """Delete several tasks."""
+    task_service = TaskService(db)
+    results = task_service.bulk_delete_tasks(bulk_delete, user_id)
+    return model_response(results)
 
 
 @router.get(
     "/{task_id}",
-    response_model=TaskOut,
+    response_model=Union[TaskOut, PartialTaskOut],
     summary="Get task by ID",
     description="Get a specific task by ID for the authenticated user."
 )
 def get_task(
     task_id: int,
+    fields: Optional[str] = Query(None, description="Comma-separated task fields to return, e.g. id,title,status; default all"),
+    if_none_match: Optional[str] = Header(None, description="ETag of a cached copy; answered with 304 while it is current"),
     db: Session = Depends(get_db),
     user_id: int = Depends(get_current_user_id)
-) -> TaskOut:
-    """Get a task by ID."""
+) -> Union[TaskOut, PartialTaskOut]:
+    """Get a task by ID; 304 Not Modified if If-None-Match is current."""
+    try:
+        field_names = parse_fields(fields, TASK_FIELDS)
+    except InvalidFieldsError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     task_service = TaskService(db)
-    task = task_service.get_task(task_id, user_id)
+    version = task_service.get_version(user_id)
+    etag = owner_etag(user_id, version)
+    if etag_matches(if_none_match, etag, wildcard=False):
+        return not_modified(etag)
+    task = task_service.get_task(task_id, user_id, field_names)
     
     if not task:
         raise HTTPException(
@@ -88,7 +303,7 @@ def get_task(
             detail="Task not found"
         )
     
-    return task
+    return model_response(task, headers=etag_headers(etag))
 
 
 @router.put(
@@ -113,7 +328,7 @@ def update_task(
             detail="Task not found"
         )
     
-    return task
+    return model_response(task)
 
 
 @router.delete(
@@ -159,7 +374,7 @@ def mark_task_completed(
             detail="Task not found"
         )
     
-    return task
+    return model_response(task)
 
 
 @router.patch(
@@ -183,5 +398,5 @@ def mark_task_incomplete(
             detail="Task not found"
         )
     
-    return task
+    return model_response(task)
 
@@ -1,5 +1,5 @@
 # Schemas package
-from app.schemas.task import TaskCreate, TaskUpdate, TaskOut, TaskListResponse, TaskStats
+from app.schemas.task import TaskCreate, TaskUpdate, TaskOut, TaskOutList, TaskListResponse, TaskSortField, SortOrder, TaskFilter, TaskBulkCreate, TaskBulkUpdateItem, TaskBulkUpdate, TaskBulkDelete, TaskBulkItemResult, TaskBulkResponse, TaskStats
 
-__all__ = ["TaskCreate", "TaskUpdate", "TaskOut", "TaskListResponse", "TaskStats"]
+__all__ = ["TaskCreate", "TaskUpdate", "TaskOut", "TaskOutList", "TaskListResponse", "TaskSortField", "SortOrder", "TaskFilter", "TaskBulkCreate", "TaskBulkUpdateItem", "TaskBulkUpdate", "TaskBulkDelete", "TaskBulkItemResult", "TaskBulkResponse", "TaskStats"]
 
@@ -1,8 +1,110 @@
-from typing import Optional, List
-from sqlalchemy.orm import Session
+import csv
+import io
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, Optional, List, Sequence, Union
+from pydantic import TypeAdapter
+from sqlalchemy import Row
+from sqlalchemy.orm import Session, sessionmaker
+from app.core.cache import ResultCache
+from app.core.config import settings
 from app.repositories.task_repository import TaskRepository
-from app.schemas.task import TaskCreate, TaskUpdate, TaskOut, TaskListResponse, TaskStats
-from app.models.task import Task, TaskStatus, TaskPriority
+from app.schemas.task import (
+    TASK_FIELDS,
+    TaskCreate,
+    TaskUpdate,
+    TaskOut,
+    TaskOutList,
+    TaskListResponse,
+    TaskSearchResponse,
+    TaskDueResponse,
+    PartialTaskOut,
+    PartialTaskListResponse,
+    TaskStats,
+    TaskFilter,
+    TaskSortField,
+    TaskBulkCreate,
+    TaskBulkUpdate,
+    TaskBulkDelete,
+    TaskBulkItemResult,
+    TaskBulkResponse,
+    ExportFormat,
+)
+from app.utils.pagination import (
+    InvalidCursorError,
+    encode_cursor,
+    decode_cursor,
+    encode_search_cursor,
+    decode_search_cursor,
+)
+
+
+# Task-list pages, invalidated by every write to the owner's tasks
+task_list_cache: ResultCache[TaskListResponse] = ResultCache("task_list", TypeAdapter(TaskListResponse))
+# Sparse-fieldset pages; same invalidation, cached apart so full pages keep their schema
+partial_task_list_cache: ResultCache[PartialTaskListResponse] = ResultCache(
+    "task_list_partial", TypeAdapter(PartialTaskListResponse)
+)
+
+
+def task_list_params(
+    skip: int,
+    limit: int,
+    filters: TaskFilter,
+    cursor: Optional[str],
+    version: Optional[int] = None,
+    fields: Optional[List[str]] = None
+) -> str:
+    """Canonical cache key input for a task-list request."""
+    return f"{version}:{skip}:{limit}:{cursor or ''}:{','.join(fields or [])}:{filters.model_dump_json()}"
+
+
+def page_columns(fields: List[str]) -> List[str]:
+    """Columns to select for a sparse task-list page; the cursor also needs created_at and id."""
+    return fields + [name for name in ("created_at", "id") if name not in fields]
+
+
+def bulk_response(results: List[TaskBulkItemResult]) -> TaskBulkResponse:
+    """Wrap per-item results with success and failure totals."""
+    succeeded = sum(1 for result in results if result.ok)
+    return TaskBulkResponse(results=results, succeeded=succeeded, failed=len(results) - succeeded)
+
+
+# Media type of each export format
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+def encode_csv(records: Iterable[Iterable[Any]]) -> bytes:
+    """Encode records as CSV lines."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(records)
+    return buffer.getvalue().encode()
+
+
+def encode_export_batch(rows: Sequence[Row], export_format: ExportFormat) -> bytes:
+    """Serialize one cursor batch of task rows as NDJSON lines or CSV records."""
+    tasks = TaskOutList.validate_python(rows, from_attributes=True)
+    if export_format == ExportFormat.NDJSON:
+        return b"".join(TaskOut.__pydantic_serializer__.to_json(task) + b"\n" for task in tasks)
+    return encode_csv(task.model_dump(mode="json").values() for task in tasks)
+
+
+def stream_export(session_factory: sessionmaker, owner_id: int, export_format: ExportFormat) -> Iterator[bytes]:
+    """
+    Stream every task of a user, one chunk per server-side cursor batch.
+
+    The body of a streamed response is sent after the request's session is
+    closed, so the export opens its own, on the first chunk, and closes it
+    after the last.
+    """
+    with session_factory() as db:
+        result = TaskRepository(db).stream_all(owner_id, settings.EXPORT_BATCH_SIZE)
+        if export_format == ExportFormat.CSV:
+            yield encode_csv([TASK_FIELDS])
+        for rows in result.partitions():
+            yield encode_export_batch(rows, export_format)
 
 
 class TaskService:
@@ -36,59 +138,223 @@ class TaskService:
         db_task = self.task_repository.create(task_create, owner_id)
         return TaskOut.model_validate(db_task)
     
-    def get_task(self, task_id: int, owner_id: int) -> Optional[TaskOut]:
+    def get_task(
+        self,
+        task_id: int,
+        owner_id: int,
+        fields: Optional[List[str]] = None
+    ) -> Optional[Union[TaskOut, PartialTaskOut]]:
         """
         Get a task by ID for the authenticated user.
         
         Args:
             task_id: The task's ID
             owner_id: The authenticated user's ID
+            fields: Optional sparse fieldset; only these columns are fetched and returned
             
         Returns:
             Task if found and owned by user, None otherwise
         """
+        if fields is not None:
+            row = self.task_repository.get_columns_by_id(task_id, owner_id, fields)
+            return PartialTaskOut(row._asdict()) if row else None
         db_task = self.task_repository.get_by_id(task_id, owner_id)
         if not db_task:
             return None
         return TaskOut.model_validate(db_task)
     
+    def get_version(self, owner_id: int) -> int:
+        """
+        Get the version of the authenticated user's tasks.
+        
+        Args:
+            owner_id: The authenticated user's ID
+            
+        Returns:
+            Number incremented by every task write, for ETags
+        """
+        return self.task_repository.get_version(owner_id)
+    
     def get_tasks(
         self,
         owner_id: int,
         skip: int = 0,
         limit: int = 100,
-        status: Optional[TaskStatus] = None,
-        priority: Optional[TaskPriority] = None
-    ) -> TaskListResponse:
+        filters: Optional[TaskFilter] = None,
+        cursor: Optional[str] = None,
+        version: Optional[int] = None,
+        fields: Optional[List[str]] = None
+    ) -> Union[TaskListResponse, PartialTaskListResponse]:
         """
-        Get all tasks for the authenticated user with optional filtering.
+        Get tasks for the authenticated user with optional filtering and sorting.
         
         Args:
             owner_id: The authenticated user's ID
             skip: Number of records to skip (pagination)
             limit: Maximum number of records to return (pagination)
-            status: Optional status filter
-            priority: Optional priority filter
+            filters: Optional filters and ordering; all provided filters are combined
+            cursor: Optional next_cursor of a previous page; takes precedence over skip
+            version: Task version already sent as the ETag; a cached page is
+                only reused if it was computed at or after that version
+            fields: Optional sparse fieldset; only these columns are fetched and returned
             
         Returns:
-            TaskListResponse with tasks and pagination info
+            TaskListResponse with tasks, the matching total and the next page's cursor;
+            a PartialTaskListResponse for a sparse fieldset
+            
+        Raises:
+            InvalidCursorError: If the cursor is malformed or used with a non-default sort
         """
-        if status:
-            tasks = self.task_repository.get_by_status(owner_id, status, skip, limit)
-        elif priority:
-            tasks = self.task_repository.get_by_priority(owner_id, priority, skip, limit)
-        else:
-            tasks = self.task_repository.get_all(owner_id, skip, limit)
+        filters = filters or TaskFilter()
+        cache = task_list_cache if fields is None else partial_task_list_cache
+        return cache.get_or_compute(
+            owner_id,
+            task_list_params(skip, limit, filters, cursor, version, fields),
+            lambda: self._list_tasks(owner_id, skip, limit, filters, cursor, fields)
+        )
+    
+    def _list_tasks(
+        self,
+        owner_id: int,
+        skip: int,
+        limit: int,
+        filters: TaskFilter,
+        cursor: Optional[str],
+        fields: Optional[List[str]] = None
+    ) -> Union[TaskListResponse, PartialTaskListResponse]:
+        """Query a task-list page; get_tasks() without the cache."""
+        keyset = filters.sort_by == TaskSortField.CREATED_AT
         
-        total = self.task_repository.count(owner_id)
+        after = decode_cursor(cursor) if cursor else None
+        if after is not None:
+            if not keyset:
+                raise InvalidCursorError("Cursor pagination requires sort_by=created_at")
+            skip = 0
         
+        # Fetch one extra row to know whether another page exists
+        columns = page_columns(fields) if fields is not None else None
+        tasks, total = self.task_repository.get_filtered(owner_id, filters, skip, limit + 1, after, columns)
+        
+        next_cursor = None
+        if len(tasks) > limit:
+            tasks = tasks[:limit]
+            if keyset:
+                next_cursor = encode_cursor(tasks[-1].created_at, tasks[-1].id)
+        
+        if fields is not None:
+            return PartialTaskListResponse(
+                tasks=[{name: getattr(row, name) for name in fields} for row in tasks],
+                total=total,
+                skip=skip,
+                limit=limit,
+                next_cursor=next_cursor
+            )
         return TaskListResponse(
-            tasks=[TaskOut.model_validate(task) for task in tasks],
+            tasks=TaskOutList.validate_python(tasks, from_attributes=True),
             total=total,
             skip=skip,
-            limit=limit
+            limit=limit,
+            next_cursor=next_cursor
+        )
+    
+    def search_tasks(
+        self,
+        owner_id: int,
+        q: str,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> TaskSearchResponse:
+        """
+        Search the authenticated user's tasks by title and description.
+        
+        Args:
+            owner_id: The authenticated user's ID
+            q: Search text
+            limit: Maximum number of records to return
+            cursor: Optional next_cursor of a previous page of the same search
+        
+        Returns:
+            TaskSearchResponse with the best matches first and the next page's cursor
+        
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        after = decode_search_cursor(cursor) if cursor else None
+        # Fetch one extra row to know whether another page exists
+        rows = self.task_repository.search(owner_id, q, limit + 1, after)
+        
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_search_cursor(rows[-1].rank, rows[-1].Task.id)
+        
+        return TaskSearchResponse(
+            tasks=TaskOutList.validate_python([row.Task for row in rows], from_attributes=True),
+            limit=limit,
+            next_cursor=next_cursor
+        )
+    
+    def get_due_tasks(
+        self,
+        owner_id: int,
+        due_after: Optional[datetime] = None,
+        due_before: Optional[datetime] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> TaskDueResponse:
+        """
+        Get the authenticated user's incomplete tasks with a due date, soonest first.
+        
+        Args:
+            owner_id: The authenticated user's ID
+            due_after: Optional lower bound (inclusive) on due_date
+            due_before: Optional upper bound (exclusive) on due_date
+            limit: Maximum number of records to return
+            cursor: Optional next_cursor of a previous page with the same bounds
+        
+        Returns:
+            TaskDueResponse with the page and the next page's cursor
+        
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        after = decode_cursor(cursor) if cursor else None
+        # Fetch one extra row to know whether another page exists
+        tasks = self.task_repository.get_due(owner_id, limit + 1, due_after, due_before, after)
+        
+        next_cursor = None
+        if len(tasks) > limit:
+            tasks = tasks[:limit]
+            next_cursor = encode_cursor(tasks[-1].due_date, tasks[-1].id)
+        
+        return TaskDueResponse(
+            tasks=TaskOutList.validate_python(tasks, from_attributes=True),
+            limit=limit,
+            next_cursor=next_cursor
         )
     
+    def get_overdue_tasks(
+        self,
+        owner_id: int,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> TaskDueResponse:
+        """
+        Get the authenticated user's incomplete tasks that are past due, oldest due date first.
+        
+        Args:
+            owner_id: The authenticated user's ID
+            limit: Maximum number of records to return
+            cursor: Optional next_cursor of a previous overdue page
+        
+        Returns:
+            TaskDueResponse with the page and the next page's cursor
+        
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        return self.get_due_tasks(owner_id, due_before=datetime.now(timezone.utc), limit=limit, cursor=cursor)
+    
     def update_task(
         self,
         task_id: int,
@@ -156,6 +422,80 @@ class TaskService:
             return None
         return TaskOut.model_validate(db_task)
     
+    def bulk_create_tasks(self, bulk_create: TaskBulkCreate, owner_id: int) -> TaskBulkResponse:
+        """
+        Create several tasks for the authenticated user in one transaction.
+        
+        Args:
+            bulk_create: Tasks to create
+            owner_id: The authenticated user's ID
+            
+        Returns:
+            TaskBulkResponse with one result per item, in request order
+        """
+        db_tasks = self.task_repository.bulk_create(bulk_create.items, owner_id)
+        return bulk_response([
+            TaskBulkItemResult(index=index, id=db_task.id, ok=True, task=TaskOut.model_validate(db_task))
+            for index, db_task in enumerate(db_tasks)
+        ])
+    
+    def bulk_update_tasks(self, bulk_update: TaskBulkUpdate, owner_id: int) -> TaskBulkResponse:
+        """
+        Update several tasks for the authenticated user in one transaction.
+        
+        Items for missing, foreign or repeated task IDs fail individually;
+        the remaining items are still applied.
+        
+        Args:
+            bulk_update: Per-task updates
+            owner_id: The authenticated user's ID
+            
+        Returns:
+            TaskBulkResponse with one result per item, in request order
+        """
+        task_updates: Dict[int, TaskUpdate] = {}
+        for item in bulk_update.items:
+            task_updates.setdefault(item.id, item)
+        
+        db_tasks = self.task_repository.bulk_update(task_updates, owner_id)
+        
+        results = []
+        for index, item in enumerate(bulk_update.items):
+            if task_updates[item.id] is not item:
+                results.append(TaskBulkItemResult(index=index, id=item.id, ok=False, error="Duplicate task ID"))
+            elif item.id not in db_tasks:
+                results.append(TaskBulkItemResult(index=index, id=item.id, ok=False, error="Task not found"))
+            else:
+                task = TaskOut.model_validate(db_tasks[item.id])
+                results.append(TaskBulkItemResult(index=index, id=item.id, ok=True, task=task))
+        return bulk_response(results)
+    
+    def bulk_delete_tasks(self, bulk_delete: TaskBulkDelete, owner_id: int) -> TaskBulkResponse:
+        """
+        Delete several tasks for the authenticated user in one transaction.
+        
+        Args:
+            bulk_delete: IDs of the tasks to delete
+            owner_id: The authenticated user's ID
+            
+        Returns:
+            TaskBulkResponse with one result per ID, in request order
+        """
+        task_ids = list(dict.fromkeys(bulk_delete.ids))
+        deleted = set(self.task_repository.bulk_delete(task_ids, owner_id))
+        
+        results = []
+        seen = set()
+        for index, task_id in enumerate(bulk_delete.ids):
+            if task_id in seen:
+                results.append(TaskBulkItemResult(index=index, id=task_id, ok=False, error="Duplicate task ID"))
+            elif task_id not in deleted:
+                results.append(TaskBulkItemResult(index=index, id=task_id, ok=False, error="Task not found"))
+            else:
+                results.append(TaskBulkItemResult(index=index, id=task_id, ok=True))
+            seen.add(task_id)
+        return bulk_response(results)
+    
     def get_task_stats(self, owner_id: int) -> TaskStats:
         """
         Get task statistics for the authenticated user.
@@ -166,26 +506,6 @@ class TaskService:
         Returns:
             TaskStats with counts by status and priority
         """
-        total = self.task_repository.count(owner_id)
-        todo = self.task_repository.count_by_status(owner_id, TaskStatus.TODO)
-        in_progress = self.task_repository.count_by_status(owner_id, TaskStatus.IN_PROGRESS)
-        done = self.task_repository.count_by_status(owner_id, TaskStatus.DONE)
-        completed = self.task_repository.count_completed(owner_id)
-        
-        # Count by priority
-        all_tasks = self.task_repository.get_all(owner_id, skip=0, limit=1000)
-        high_priority = sum(1 for task in all_tasks if task.priority == TaskPriority.HIGH)
-        medium_priority = sum(1 for task in all_tasks if task.priority == TaskPriority.MEDIUM)
-        low_priority = sum(1 for task in all_tasks if task.priority == TaskPriority.LOW)
-        
-        return TaskStats(
-            total=total,
-            todo=todo,
-            in_progress=in_progress,
-            done=done,
-            completed=completed,
-            high_priority=high_priority,
-            medium_priority=medium_priority,
-            low_priority=low_priority
-        )
+        # All counts come from the owner's task_counters row, kept current on every write
+        return TaskStats(**self.task_repository.get_stats(owner_id))
 
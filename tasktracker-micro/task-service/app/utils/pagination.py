@@ -0,0 +1,81 @@
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(created_at: datetime, task_id: int) -> str:
+    """
+    Encode a keyset position into an opaque cursor string.
+
+    Args:
+        created_at: created_at of the last task on the current page (due_date
+            for the due-date views)
+        task_id: ID of the last task on the current page
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps({"c": created_at.isoformat(), "i": task_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page's next_cursor
+
+    Returns:
+        Tuple of (created_at or due_date, task_id) to continue after
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload["c"]), int(payload["i"])
+    except (ValueError, KeyError, TypeError) as exc:
+        raise InvalidCursorError("Invalid cursor") from exc
+
+
+def encode_search_cursor(rank: float, task_id: int) -> str:
+    """
+    Encode a search keyset position into an opaque cursor string.
+
+    Args:
+        rank: Rank of the last task on the current page
+        task_id: ID of the last task on the current page
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps({"r": rank, "i": task_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_search_cursor(cursor: str) -> Tuple[float, int]:
+    """
+    Decode a cursor produced by encode_search_cursor.
+
+    Args:
+        cursor: Cursor string from a previous search page's next_cursor
+
+    Returns:
+        Tuple of (rank, task_id) to continue after
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return float(payload["r"]), int(payload["i"])
+    except (ValueError, KeyError, TypeError) as exc:
+        raise InvalidCursorError("Invalid cursor") from exc
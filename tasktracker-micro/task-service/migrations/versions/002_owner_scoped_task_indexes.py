@@ -0,0 +1,99 @@
+"""Owner-scoped composite indexes for task listing
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block; building the
+    # indexes this way keeps the tasks table writable during the migration.
+    with op.get_context().autocommit_block():
+        # List/cursor pages and per-owner counts
+        op.create_index(
+            'ix_tasks_owner_created',
+            'tasks',
+            ['owner_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Status-filtered pages and counts
+        op.create_index(
+            'ix_tasks_owner_status_created',
+            'tasks',
+            ['owner_id', 'status', sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Priority-filtered pages
+        op.create_index(
+            'ix_tasks_owner_priority_created',
+            'tasks',
+            ['owner_id', 'priority', sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Incomplete tasks only - the open-work views stay small as tasks are completed
+        op.create_index(
+            'ix_tasks_owner_incomplete_created',
+            'tasks',
+            ['owner_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_where=sa.text('is_completed = false'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # ix_tasks_id duplicates the primary key index and ix_tasks_owner_id
+        # (where the initial migration created it) is a prefix of ix_tasks_owner_created
+        op.drop_index(
+            op.f('ix_tasks_id'),
+            table_name='tasks',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_tasks_owner_id',
+            table_name='tasks',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_tasks_id'),
+            'tasks',
+            ['id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_tasks_owner_id',
+            'tasks',
+            ['owner_id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index('ix_tasks_owner_incomplete_created', table_name='tasks', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_tasks_owner_priority_created', table_name='tasks', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_tasks_owner_status_created', table_name='tasks', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_tasks_owner_created', table_name='tasks', postgresql_concurrently=True, if_exists=True)
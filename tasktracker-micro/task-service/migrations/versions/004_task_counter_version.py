@@ -0,0 +1,29 @@
+"""Task counter version for ETags
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'task_counters',
+        sa.Column('version', sa.BigInteger(), nullable=False, server_default='0')
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('task_counters', 'version')
@@ -0,0 +1,51 @@
+"""Full-text search vector and GIN index for tasks
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    # Maintained by PostgreSQL on every insert and update; title words rank
+    # above description words. Adding a stored generated column rewrites the
+    # table under an exclusive lock.
+    conn.execute(sa.text(
+        "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        "GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+        ") STORED"
+    ))
+    # btree_gin lets owner_id share the GIN index, so a search only reads
+    # the owner's postings instead of filtering every matching task
+    conn.execute(sa.text("CREATE EXTENSION IF NOT EXISTS btree_gin"))
+
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        conn.execute(sa.text(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tasks_owner_search "
+            "ON tasks USING gin (owner_id, search_vector)"
+        ))
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+
+    with op.get_context().autocommit_block():
+        conn.execute(sa.text("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_owner_search"))
+    conn.execute(sa.text("ALTER TABLE tasks DROP COLUMN IF EXISTS search_vector"))
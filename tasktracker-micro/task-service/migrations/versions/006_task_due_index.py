@@ -0,0 +1,39 @@
+"""Partial due-date index for the overdue and due-soon views
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    # Open tasks with a due date only, in (due_date, id) keyset order;
+    # completed and undated tasks never enter the index.
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        conn.execute(sa.text(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tasks_owner_due_incomplete "
+            "ON tasks (owner_id, due_date, id) "
+            "WHERE is_completed = false AND due_date IS NOT NULL"
+        ))
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+
+    with op.get_context().autocommit_block():
+        conn.execute(sa.text("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_owner_due_incomplete"))
@@ -1,6 +1,6 @@
 from pydantic_settings import BaseSettings
 from pydantic import Field, PostgresDsn
-from typing import Optional
+from typing import Literal, Optional
 from functools import lru_cache
 
 
@@ -27,6 +27,23 @@ class Settings(BaseSettings):
     )
     ALGORITHM: str = Field(default="HS256", description="JWT algorithm")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=30, description="Access token expiration time in minutes")
+    TOKEN_CACHE_SIZE: int = Field(default=10000, description="Maximum number of verified access tokens to cache (0 disables)")
+    
+    # Password Hashing
+    PASSWORD_HASH_SCHEME: Literal["bcrypt", "argon2"] = Field(
+        default="bcrypt",
+        description="Scheme for new password hashes; argon2 uses argon2id and needs argon2-cffi"
+    )
+    BCRYPT_ROUNDS: int = Field(default=12, description="bcrypt cost factor (log2 of the iteration count)")
+    ARGON2_TIME_COST: int = Field(default=3, description="argon2id iterations")
+    ARGON2_MEMORY_COST: int = Field(default=65536, description="argon2id memory in KiB")
+    ARGON2_PARALLELISM: int = Field(default=4, description="argon2id lanes")
+    PASSWORD_HASH_WORKERS: int = Field(
+        default=2,
+        description="Worker processes for password hashing (0 hashes in the request threadpool)"
+    )
+    PASSWORD_HASH_MAX_PENDING: int = Field(default=64, description="Maximum password hashes queued or running")
+    PASSWORD_HASH_RETRY_AFTER_SECONDS: int = Field(default=1, description="Retry-After sent when the hash queue is full")
     
     # CORS
     BACKEND_CORS_ORIGINS: list[str] = Field(
@@ -40,6 +57,26 @@ class Settings(BaseSettings):
     DB_POOL_TIMEOUT: int = Field(default=30, description="Database pool timeout in seconds")
     DB_POOL_RECYCLE: int = Field(default=3600, description="Database pool recycle time in seconds")
     
+    # Principal Cache
+    PRINCIPAL_CACHE_SIZE: int = Field(default=10000, description="Maximum number of cached authenticated users")
+    PRINCIPAL_CACHE_TTL_SECONDS: float = Field(
+        default=30.0,
+        description="Lifetime of a cached authenticated user in seconds (0 disables the cache)"
+    )
+    
+    # Compression
+    COMPRESSION_ENABLED: bool = Field(default=True, description="Compress responses with brotli or gzip as the client accepts")
+    COMPRESSION_MINIMUM_SIZE: int = Field(default=1024, description="Smaller response bodies are sent uncompressed, in bytes")
+    COMPRESSION_GZIP_LEVEL: int = Field(default=6, ge=1, le=9, description="gzip compression level")
+    COMPRESSION_BROTLI_QUALITY: int = Field(
+        default=4, ge=0, le=11,
+        description="brotli quality; 4 compresses JSON about as well as gzip level 6 for less CPU"
+    )
+    
+    # Timing
+    SERVER_TIMING_ENABLED: bool = Field(default=True, description="Add a Server-Timing header with request and SQL time")
+    SLOW_QUERY_SECONDS: float = Field(default=0.5, ge=0, description="Log SQL statements taking at least this long; 0 disables")
+    
     # Logging
     LOG_LEVEL: str = Field(default="INFO", description="Logging level")
     
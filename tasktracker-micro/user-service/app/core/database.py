@@ -3,6 +3,8 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from typing import Generator
 from app.core.config import settings
+from app.core.pool_metrics import instrument_pool
+from app.core.timing import track_queries
 
 # Create database engine
 engine = create_engine(
@@ -15,6 +17,10 @@ engine = create_engine(
     echo=settings.DEBUG,  # Log SQL queries in debug mode
 )
 
+# Pool telemetry, per-request SQL accounting and the slow-query log on /metrics
+instrument_pool(engine)
+track_queries(engine, settings.SLOW_QUERY_SECONDS)
+
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
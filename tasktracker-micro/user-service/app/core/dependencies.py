@@ -3,7 +3,8 @@ from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 from typing import Optional
 from app.core.database import get_db
-from app.core.security import decode_access_token
+from app.core.principal_cache import principal_cache
+from app.core.security import decode_access_token_cached
 from app.models.user import User
 from app.repositories.user_repository import UserRepository
 
@@ -35,7 +36,7 @@ def get_current_user(
     )
     
     # Decode token
-    payload = decode_access_token(token)
+    payload = decode_access_token_cached(token)
     if payload is None:
         raise credentials_exception
     
@@ -44,13 +45,18 @@ def get_current_user(
     if user_id is None:
         raise credentials_exception
     
-    # Get user from database
+    user = principal_cache.get(int(user_id))
+    if user is not None:
+        return user
+    
+    # Cache miss: get user from database
     user_repository = UserRepository(db)
     user = user_repository.get_by_id(int(user_id))
     
     if user is None:
         raise credentials_exception
     
+    principal_cache.set(user)
     return user
 
 
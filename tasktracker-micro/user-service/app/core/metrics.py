@@ -0,0 +1,178 @@
+"""
+In-process metrics registry rendered in the Prometheus text format.
+
+Components register a callback per metric; callbacks are read at scrape
+time, so the hot path only updates its own counters.
+"""
+from bisect import bisect_left
+from threading import Lock
+from typing import Any, Callable, Dict, List, NamedTuple, Sequence, Tuple, Union
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Latency buckets in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Cumulative histogram of observed values, in seconds for latencies."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = Lock()
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def snapshot(self) -> Tuple[List[Tuple[str, int]], float, int]:
+        """
+        Read the histogram.
+
+        Returns:
+            Tuple of (cumulative (upper bound, count) pairs ending with "+Inf",
+            sum of observations, number of observations)
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        cumulative = []
+        running = 0
+        for bound, count in zip([*map(str, self.buckets), "+Inf"], counts):
+            running += count
+            cumulative.append((bound, running))
+        return cumulative, total, running
+
+
+class HistogramFamily:
+    """Histograms of one metric keyed by label values, e.g. one per route."""
+
+    def __init__(self, label_names: Sequence[str], buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        self._children: Dict[Tuple[str, ...], Histogram] = {}
+        self._lock = Lock()
+
+    def labels(self, *values: str) -> Histogram:
+        """Histogram for one combination of label values, created on first use."""
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(values, Histogram(self.buckets))
+        return child
+
+    def children(self) -> List[Tuple[str, Histogram]]:
+        """(rendered labels, histogram) pairs, e.g. ('method="GET",route="/tasks/"', ...)."""
+        with self._lock:
+            children = sorted(self._children.items())
+        return [
+            (",".join(f'{name}="{escape_label(value)}"' for name, value in zip(self.label_names, values)), histogram)
+            for values, histogram in children
+        ]
+
+
+def escape_label(value: str) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+MetricValue = Union[int, float, Histogram, HistogramFamily]
+
+
+class Metric(NamedTuple):
+    name: str
+    kind: str
+    help: str
+    collect: Callable[[], MetricValue]
+
+
+class MetricsRegistry:
+    """Registry of named metrics exposed on the /metrics endpoint."""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = Lock()
+
+    def register(self, name: str, kind: str, help: str, collect: Callable[[], MetricValue]) -> None:
+        """
+        Register a metric, replacing any previous metric with the same name.
+
+        Args:
+            name: Prometheus metric name
+            kind: Prometheus metric type ("counter", "gauge" or "histogram")
+            help: One-line description
+            collect: Callback returning the current value (a Histogram for histograms)
+        """
+        with self._lock:
+            self._metrics[name] = Metric(name, kind, help, collect)
+
+    def register_histogram(self, name: str, help: str, histogram: Histogram) -> Histogram:
+        """Register a histogram and return it for the caller to observe into."""
+        self.register(name, "histogram", help, lambda: histogram)
+        return histogram
+
+    def register_histogram_family(self, name: str, help: str, family: HistogramFamily) -> HistogramFamily:
+        """Register a labelled histogram family and return it for the caller to observe into."""
+        self.register(name, "histogram", help, lambda: family)
+        return family
+
+    def collect(self) -> Dict[str, Any]:
+        """
+        Read every registered metric; histograms become count/sum/bucket
+        dictionaries, histogram families one per rendered label set.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        values: Dict[str, Any] = {}
+        for metric in metrics:
+            value = metric.collect()
+            if isinstance(value, Histogram):
+                value = histogram_values(value)
+            elif isinstance(value, HistogramFamily):
+                value = {labels: histogram_values(histogram) for labels, histogram in value.children()}
+            values[metric.name] = value
+        return values
+
+    def render(self) -> str:
+        """Render every registered metric in the Prometheus text format."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines: List[str] = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            value = metric.collect()
+            if isinstance(value, Histogram):
+                lines.extend(histogram_lines(metric.name, value))
+            elif isinstance(value, HistogramFamily):
+                for labels, histogram in value.children():
+                    lines.extend(histogram_lines(metric.name, histogram, labels))
+            else:
+                lines.append(f"{metric.name} {value}")
+        return "\n".join(lines) + "\n"
+
+
+def histogram_values(histogram: Histogram) -> Dict[str, Any]:
+    """Count, sum and cumulative buckets of a histogram."""
+    buckets, total, count = histogram.snapshot()
+    return {"count": count, "sum": total, "buckets": dict(buckets)}
+
+
+def histogram_lines(name: str, histogram: Histogram, labels: str = "") -> List[str]:
+    """Prometheus sample lines of a histogram, with optional rendered labels."""
+    buckets, total, count = histogram.snapshot()
+    prefix = f"{labels}," if labels else ""
+    suffix = f"{{{labels}}}" if labels else ""
+    lines = [f'{name}_bucket{{{prefix}le="{bound}"}} {bucket_count}' for bound, bucket_count in buckets]
+    lines.append(f"{name}_sum{suffix} {total}")
+    lines.append(f"{name}_count{suffix} {count}")
+    return lines
+
+
+# Process-wide registry
+registry = MetricsRegistry()
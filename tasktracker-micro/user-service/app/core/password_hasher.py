@@ -0,0 +1,170 @@
+"""
+Password hashing off the request threads.
+
+bcrypt and argon2id are CPU-bound and hold the GIL, so running them in the
+Starlette threadpool lets a burst of logins starve every other endpoint.
+The PasswordHasher runs them in a separately sized process pool instead and is
+awaited from the async auth routes. The number of hashes in flight is
+bounded: past PASSWORD_HASH_MAX_PENDING, callers get an error carrying a
+Retry-After hint instead of queueing without limit.
+"""
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, Tuple
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.core.metrics import Histogram, registry
+from app.core.security import get_password_hash, verify_and_update_password, verify_password
+
+
+class PasswordHasherError(Exception):
+    """Base error for hashing requests that were not executed."""
+
+    status_code = 503
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class PasswordHasherBusyError(PasswordHasherError):
+    """Raised when the pending-hash queue is full."""
+
+    status_code = 429
+
+
+class PasswordHasherUnavailableError(PasswordHasherError):
+    """Raised when the worker processes died; the pool is rebuilt on the next call."""
+
+    status_code = 503
+
+
+class PasswordHasher:
+    """Bounded process pool for password hashing and verification."""
+
+    def __init__(self, workers: int, max_pending: int, retry_after: int):
+        """
+        Initialize the hasher; worker processes start on first use.
+
+        Args:
+            workers: Worker processes; 0 hashes in the Starlette threadpool instead
+            max_pending: Maximum hashes queued or running at once
+            retry_after: Seconds suggested to rejected clients
+        """
+        self.workers = workers
+        self.max_pending = max_pending
+        self.retry_after = retry_after
+        self.pending = 0
+        self.rejected = 0
+        self.hash_seconds = Histogram()
+        self.verify_seconds = Histogram()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    async def _run(self, histogram: Histogram, fn: Callable[..., Any], *args: Any) -> Any:
+        # Only touched from the event loop thread, so no lock is needed
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise PasswordHasherBusyError("Too many pending password checks", self.retry_after)
+
+        self.pending += 1
+        start = time.perf_counter()
+        try:
+            if self.workers <= 0:
+                return await run_in_threadpool(fn, *args)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+        except BrokenProcessPool:
+            self.shutdown()
+            raise PasswordHasherUnavailableError("Password hashing is unavailable", self.retry_after)
+        finally:
+            self.pending -= 1
+            histogram.observe(time.perf_counter() - start)
+
+    async def hash(self, password: str) -> str:
+        """
+        Hash a password in the worker pool.
+
+        Args:
+            password: The plain text password to hash
+
+        Returns:
+            The hashed password
+
+        Raises:
+            PasswordHasherError: If the queue is full or the pool is unavailable
+        """
+        return await self._run(self.hash_seconds, get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Verify a password against its hash in the worker pool.
+
+        Args:
+            plain_password: The plain text password
+            hashed_password: The hashed password to compare against
+
+        Returns:
+            True if the password matches, False otherwise
+
+        Raises:
+            PasswordHasherError: If the queue is full or the pool is unavailable
+        """
+        return await self._run(self.verify_seconds, verify_password, plain_password, hashed_password)
+
+    async def verify_and_update(self, plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password in the worker pool, rehashing it if its scheme or cost is outdated.
+
+        Args:
+            plain_password: The plain text password
+            hashed_password: The hashed password to compare against
+
+        Returns:
+            Tuple of (whether the password matches, replacement hash or None)
+
+        Raises:
+            PasswordHasherError: If the queue is full or the pool is unavailable
+        """
+        return await self._run(self.verify_seconds, verify_and_update_password, plain_password, hashed_password)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes without waiting for queued work."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Process-wide password hasher
+password_hasher = PasswordHasher(
+    settings.PASSWORD_HASH_WORKERS,
+    settings.PASSWORD_HASH_MAX_PENDING,
+    settings.PASSWORD_HASH_RETRY_AFTER_SECONDS,
+)
+
+registry.register(
+    "password_hash_queue_depth", "gauge",
+    "Password hashes and checks queued or running",
+    lambda: password_hasher.pending
+)
+registry.register(
+    "password_hash_rejected_total", "counter",
+    "Password hashes and checks rejected because the queue was full",
+    lambda: password_hasher.rejected
+)
+registry.register_histogram(
+    "password_hash_seconds",
+    "Time to hash a password, including queue wait",
+    password_hasher.hash_seconds
+)
+registry.register_histogram(
+    "password_verify_seconds",
+    "Time to verify a password, including queue wait",
+    password_hasher.verify_seconds
+)
@@ -0,0 +1,129 @@
+"""
+In-process TTL + LRU cache of authenticated principals.
+
+get_current_user resolves the token's user through this cache, so most
+authenticated requests skip the users SELECT. Entries hold the identity
+and permission fields only (never the password hash) and are invalidated
+by the user repositories on every write. The cache is per process: other
+workers see a change once their entry expires.
+"""
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+from app.core.config import settings
+from app.core.metrics import registry
+from app.models.user import User
+
+PRINCIPAL_FIELDS = (
+    "id",
+    "email",
+    "username",
+    "full_name",
+    "is_active",
+    "is_superuser",
+    "created_at",
+    "updated_at",
+)
+
+
+class PrincipalCache:
+    """Bounded LRU mapping of user ID to principal fields, with a TTL per entry."""
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of cached principals
+            ttl_seconds: Lifetime of an entry; 0 disables the cache
+        """
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[int, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.maxsize > 0
+
+    def get(self, user_id: int) -> Optional[User]:
+        """
+        Get a cached principal.
+
+        Args:
+            user_id: The user's ID
+
+        Returns:
+            A transient User holding the cached fields, None on a miss
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[user_id]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            fields = entry[1]
+        return User(**fields)
+
+    def set(self, user: User) -> None:
+        """
+        Cache a user's principal fields, evicting the least recently used entry when full.
+
+        Args:
+            user: User loaded from the database
+        """
+        if not self.enabled:
+            return
+        fields = {field: getattr(user, field) for field in PRINCIPAL_FIELDS}
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[user.id] = (expires_at, fields)
+            self._entries.move_to_end(user.id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        """
+        Drop a user's cached principal.
+
+        Args:
+            user_id: The user's ID
+        """
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        """Drop every cached principal."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Process-wide principal cache
+principal_cache = PrincipalCache(settings.PRINCIPAL_CACHE_SIZE, settings.PRINCIPAL_CACHE_TTL_SECONDS)
+
+registry.register(
+    "principal_cache_hits_total", "counter",
+    "Authenticated requests served from the principal cache",
+    lambda: principal_cache.hits
+)
+registry.register(
+    "principal_cache_misses_total", "counter",
+    "Authenticated requests that loaded the user from the database",
+    lambda: principal_cache.misses
+)
+registry.register(
+    "principal_cache_size", "gauge",
+    "Principals currently cached",
+    lambda: len(principal_cache)
+)
@@ -1,13 +1,28 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
+from app.core.metrics import PROMETHEUS_CONTENT_TYPE, registry
+from app.core.timing import TimingMiddleware
+from app.core.password_hasher import password_hasher
 from app.routers import auth_router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan - stops the password hashing workers on shutdown."""
+    yield
+    password_hasher.shutdown()
+
+
 # Create FastAPI application
 app = FastAPI(
     title="User Service",
     version="1.0.0",
     debug=settings.DEBUG,
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -19,6 +34,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large responses with the coding the client prefers
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
+
+# Time requests into /metrics and the Server-Timing header; added last so
+# the time includes the other middleware
+app.add_middleware(
+    TimingMiddleware,
+    name="user",
+    server_timing=settings.SERVER_TIMING_ENABLED,
+)
+
 # Include routers
 app.include_router(auth_router, prefix="/api/v1")
 
@@ -38,3 +70,8 @@ def health_check():
     """Health check endpoint."""
     return {"status": "healthy", "service": "user-service"}
 
+
+@app.get("/metrics", tags=["Monitoring"], response_class=PlainTextResponse)
+def metrics() -> PlainTextResponse:
+    """Prometheus metrics endpoint."""
+    return PlainTextResponse(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
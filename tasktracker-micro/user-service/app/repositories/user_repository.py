@@ -1,9 +1,11 @@
 from typing import Optional
+from sqlalchemy import delete, update
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from app.models.user import User
 from app.schemas.user import UserCreate
 from app.core.security import get_password_hash
+from app.core.principal_cache import principal_cache
 
 
 class UserRepository:
@@ -21,21 +23,24 @@ class UserRepository:
         """
         self.db = db
     
-    def create(self, user_create: UserCreate) -> Optional[User]:
+    def create(self, user_create: UserCreate, hashed_password: Optional[str] = None) -> Optional[User]:
         """
         Create a new user in the database.
         
         Args:
             user_create: User creation data
+            hashed_password: Precomputed password hash; hashed here when omitted
             
         Returns:
             Created user object, or None if creation failed
         """
+        if hashed_password is None:
+            hashed_password = get_password_hash(user_create.password)
         try:
             db_user = User(
                 email=user_create.email,
                 username=user_create.username,
-                hashed_password=get_password_hash(user_create.password),
+                hashed_password=hashed_password,
                 full_name=user_create.full_name,
                 is_active=True,
                 is_superuser=False
@@ -104,9 +109,27 @@ class UserRepository:
                 setattr(db_user, key, value)
         
         self.db.commit()
+        principal_cache.invalidate(user_id)
         self.db.refresh(db_user)
         return db_user
     
+    def update_password_hash(self, user_id: int, hashed_password: str) -> bool:
+        """
+        Replace a user's password hash, e.g. after a scheme or cost upgrade.
+        
+        Args:
+            user_id: The user's ID
+            hashed_password: The new password hash
+            
+        Returns:
+            True if updated, False if user not found
+        """
+        result = self.db.execute(
+            update(User).where(User.id == user_id).values(hashed_password=hashed_password)
+        )
+        self.db.commit()
+        return result.rowcount > 0
+    
     def delete(self, user_id: int) -> bool:
         """
         Delete a user by ID.
@@ -117,11 +140,8 @@ class UserRepository:
         Returns:
             True if user was deleted, False otherwise
         """
-        db_user = self.get_by_id(user_id)
-        if not db_user:
-            return False
-        
-        self.db.delete(db_user)
+        result = self.db.execute(delete(User).where(User.id == user_id))
         self.db.commit()
-        return True
+        principal_cache.invalidate(user_id)
+        return result.rowcount > 0
 
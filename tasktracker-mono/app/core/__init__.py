@@ -1,5 +1,5 @@
 from app.core.config import settings
-from app.core.database import Base, engine, get_db, init_db
+from app.core.database import Base, engine, get_db, get_async_db, init_db
 
-__all__ = ["settings", "Base", "engine", "get_db", "init_db"]
+__all__ = ["settings", "Base", "engine", "get_db", "get_async_db", "init_db"]
 
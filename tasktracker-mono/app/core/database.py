@@ -1,8 +1,16 @@
+import math
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from sqlalchemy.pool import NullPool
+from typing import AsyncGenerator, Generator, List, Optional
 from app.core.config import settings
+from app.core.metrics import registry
+from app.core.pool_metrics import instrument_pool
+from app.core.replicas import ReplicaSet, RoutingSession
+from app.core.timing import track_queries
 
 # Create SQLAlchemy engine
 engine = create_engine(
@@ -15,17 +23,158 @@ engine = create_engine(
     echo=settings.DEBUG,  # Log SQL queries in debug mode
 )
 
+# Pool settings shared by the replica engines
+REPLICA_ENGINE_OPTIONS = dict(
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+    echo=settings.DEBUG,
+)
+
+
+def create_lag_probe_engine(url: str) -> Engine:
+    """
+    Create the engine a replica's lag checks connect through.
+
+    Probes open their own connections with a connect timeout, so a replica
+    whose pool is exhausted or that stopped answering fails its check
+    instead of stalling it.
+
+    Args:
+        url: Sync replica URL
+
+    Returns:
+        Unpooled sync engine
+    """
+    connect_args = {}
+    if make_url(url).get_backend_name() == "postgresql":
+        connect_args["connect_timeout"] = math.ceil(settings.DB_REPLICA_LAG_CHECK_TIMEOUT_SECONDS)
+    return create_engine(url, poolclass=NullPool, connect_args=connect_args)
+
+
+def create_replica_set(engines: List[Engine]) -> ReplicaSet:
+    """
+    Wrap replica engines with the configured lag limit and fallback.
+
+    Args:
+        engines: Sync replica engines, in DATABASE_REPLICA_URLS order
+
+    Returns:
+        ReplicaSet used by RoutingSession to route read-only queries
+    """
+    return ReplicaSet(
+        engines,
+        max_lag_seconds=settings.DB_REPLICA_MAX_LAG_SECONDS,
+        check_interval_seconds=settings.DB_REPLICA_LAG_CHECK_INTERVAL_SECONDS,
+        fallback_to_primary=settings.DB_REPLICA_FALLBACK_TO_PRIMARY,
+        probe_engines=[create_lag_probe_engine(url) for url in settings.DATABASE_REPLICA_URLS],
+        probe_timeout_seconds=settings.DB_REPLICA_LAG_CHECK_TIMEOUT_SECONDS,
+    )
+
+
+# Read replicas; RoutingSession sends replica_read queries to them
+replica_set = create_replica_set([
+    create_engine(url, **REPLICA_ENGINE_OPTIONS) for url in settings.DATABASE_REPLICA_URLS
+])
+
 # Create SessionLocal class
 SessionLocal = sessionmaker(
+    class_=RoutingSession,
     autocommit=False,
     autoflush=False,
     bind=engine,
+    replicas=replica_set,
 )
 
 # Create Base class for declarative models
 Base = declarative_base()
 
 
+def get_async_database_url() -> str:
+    """
+    Get the database URL used by the async engine.
+
+    Returns:
+        ASYNC_DATABASE_URL if configured, otherwise DATABASE_URL
+        rewritten to use the asyncpg driver
+    """
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+    return to_async_url(str(settings.DATABASE_URL))
+
+
+def to_async_url(url: str) -> str:
+    """
+    Rewrite a PostgreSQL URL to use the asyncpg driver.
+
+    Args:
+        url: Database URL
+
+    Returns:
+        The same URL with the postgresql+asyncpg driver
+    """
+    return make_url(url).set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+
+
+# Async engine and session factory, only created when async mode is enabled
+# so the asyncpg driver is not required by the default sync deployment.
+async_engine: Optional[AsyncEngine] = None
+async_replica_engines: List[AsyncEngine] = []
+AsyncSessionLocal: Optional[async_sessionmaker[AsyncSession]] = None
+
+if settings.DB_ASYNC:
+    async_engine = create_async_engine(
+        get_async_database_url(),
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+        echo=settings.DEBUG,
+    )
+    async_replica_engines = [
+        create_async_engine(to_async_url(url), **REPLICA_ENGINE_OPTIONS)
+        for url in settings.DATABASE_REPLICA_URLS
+    ]
+    # Requests read through the async replicas; routing works on their sync facades
+    replica_set = create_replica_set([replica.sync_engine for replica in async_replica_engines])
+    # Objects stay usable after commit; lazy refreshes are not allowed
+    # outside of an awaited call in async mode.
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine,
+        sync_session_class=RoutingSession,
+        autoflush=False,
+        expire_on_commit=False,
+        replicas=replica_set,
+    )
+
+# Pool telemetry of the engine serving requests
+request_engine = async_engine.sync_engine if async_engine is not None else engine
+instrument_pool(request_engine)
+
+# Per-request SQL accounting and the slow-query log, replicas included
+for tracked_engine in [request_engine, *replica_set.engines]:
+    track_queries(tracked_engine, settings.SLOW_QUERY_SECONDS)
+
+registry.register(
+    "db_replica_reads_total", "counter",
+    "Read-only queries routed to a replica",
+    lambda: replica_set.replica_reads
+)
+registry.register(
+    "db_replica_fallbacks_total", "counter",
+    "Read-only queries sent to the primary because no replica was within the lag limit",
+    lambda: replica_set.primary_fallbacks
+)
+registry.register(
+    "db_replica_lag_seconds", "gauge",
+    "Largest measured replica lag",
+    lambda: replica_set.max_lag()
+)
+
+
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency function to get database session.
@@ -43,6 +192,37 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def get_session_factory() -> sessionmaker:
+    """
+    Dependency function to get the session factory.
+    A streamed response's body is sent after get_db() has closed the
+    request's session, so it opens its own session from this factory.
+    """
+    return SessionLocal
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency function to get an async database session.
+    Yields an AsyncSession and ensures it's closed after use.
+
+    Usage in FastAPI:
+        @app.get("/items")
+        async def read_items(db: AsyncSession = Depends(get_async_db)):
+            ...
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    Dependency function to get the async session factory, for streamed
+    responses that must open a session outliving the request's.
+    """
+    return AsyncSessionLocal
+
+
 def init_db() -> None:
     """
     Initialize database - create all tables.
@@ -50,4 +230,3 @@ def init_db() -> None:
     In production, use Alembic migrations instead.
     """
     Base.metadata.create_all(bind=engine)
-
@@ -1,17 +1,56 @@
 from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.core.database import get_db
-from app.core.security import decode_access_token
+from app.core.database import get_db, get_async_db
+from app.core.principal_cache import principal_cache
+from app.core.security import decode_access_token_cached
 from app.models.user import User
 from app.repositories.user_repository import UserRepository
+from app.repositories.async_user_repository import AsyncUserRepository
 from app.schemas.user import TokenPayload
 
 # OAuth2 scheme for token authentication
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
+def _credentials_exception() -> HTTPException:
+    """Build the 401 raised for any invalid or unknown credentials."""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def get_token_user_id(token: str) -> int:
+    """
+    Decode a JWT access token and extract the user ID from its subject.
+    
+    Args:
+        token: JWT access token
+        
+    Returns:
+        The user ID stored in the token's "sub" claim
+        
+    Raises:
+        HTTPException: If the token is invalid or has no usable subject
+    """
+    payload = decode_access_token_cached(token)
+    if payload is None:
+        raise _credentials_exception()
+    
+    user_id_str: Optional[str] = payload.get("sub")
+    if user_id_str is None:
+        raise _credentials_exception()
+    
+    try:
+        return int(user_id_str)
+    except ValueError:
+        raise _credentials_exception()
+
+
 def get_current_user(
     db: Session = Depends(get_db),
     token: str = Depends(oauth2_scheme)
@@ -19,6 +58,9 @@ def get_current_user(
     """
     Dependency to get the current authenticated user from JWT token.
     
+    Users are served from the principal cache when possible; the returned
+    User is then a transient copy of the cached identity fields.
+    
     Args:
         db: Database session
         token: JWT access token
@@ -29,34 +71,53 @@ def get_current_user(
     Raises:
         HTTPException: If token is invalid or user not found
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+    user_id = get_token_user_id(token)
     
-    # Decode token
-    payload = decode_access_token(token)
-    if payload is None:
-        raise credentials_exception
+    user = principal_cache.get(user_id)
+    if user is not None:
+        return user
     
-    # Extract user_id from token
-    user_id_str: Optional[str] = payload.get("sub")
-    if user_id_str is None:
-        raise credentials_exception
-    
-    try:
-        user_id = int(user_id_str)
-    except ValueError:
-        raise credentials_exception
-    
-    # Get user from database
+    # Cache miss: get user from database
     user_repository = UserRepository(db)
     user = user_repository.get_by_id(user_id)
     
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
     
+    principal_cache.set(user)
+    return user
+
+
+async def get_current_user_async(
+    db: AsyncSession = Depends(get_async_db),
+    token: str = Depends(oauth2_scheme)
+) -> User:
+    """
+    Async variant of get_current_user backed by an AsyncSession.
+    
+    Args:
+        db: Async database session
+        token: JWT access token
+        
+    Returns:
+        Current authenticated User object
+        
+    Raises:
+        HTTPException: If token is invalid or user not found
+    """
+    user_id = get_token_user_id(token)
+    
+    user = principal_cache.get(user_id)
+    if user is not None:
+        return user
+    
+    user_repository = AsyncUserRepository(db)
+    user = await user_repository.get_by_id(user_id)
+    
+    if user is None:
+        raise _credentials_exception()
+    
+    principal_cache.set(user)
     return user
 
 
@@ -83,6 +144,29 @@ def get_current_active_user(
     return current_user
 
 
+async def get_current_active_user_async(
+    current_user: User = Depends(get_current_user_async)
+) -> User:
+    """
+    Async variant of get_current_active_user.
+    
+    Args:
+        current_user: Current authenticated user
+        
+    Returns:
+        Current active User object
+        
+    Raises:
+        HTTPException: If user is inactive
+    """
+    if not current_user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Inactive user"
+        )
+    return current_user
+
+
 def get_current_superuser(
     current_user: User = Depends(get_current_active_user)
 ) -> User:
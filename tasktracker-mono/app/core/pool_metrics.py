@@ -0,0 +1,139 @@
+"""
+Connection-pool telemetry for the /metrics endpoint.
+
+Pool events count checkouts and time connection lifetimes; pool occupancy
+is read from the pool at scrape time. SQLAlchemy fires no event before a
+checkout starts waiting, so the wait is timed around the pool's connect().
+"""
+import time
+from typing import Any, Callable, Dict
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import ConnectionPoolEntry, QueuePool
+from app.core.metrics import Histogram, registry
+
+# Checkout wait buckets in seconds; an idle pool hands out connections in
+# well under a millisecond, a saturated one up to the pool timeout
+WAIT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Connection lifetime buckets in seconds, up to past the default one-hour pool_recycle
+LIFETIME_BUCKETS = (1.0, 10.0, 60.0, 300.0, 900.0, 1800.0, 3600.0, 7200.0)
+
+
+class PoolMetrics:
+    """Checkout, wait, timeout and lifetime figures of one QueuePool."""
+
+    def __init__(self, pool: QueuePool):
+        """
+        Attach to a pool's events and wrap its connect().
+
+        Args:
+            pool: The engine's pool (QueuePool or AsyncAdaptedQueuePool)
+        """
+        self.pool = pool
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connects = 0
+        self.wait_seconds = Histogram(WAIT_BUCKETS)
+        self.lifetime_seconds = Histogram(LIFETIME_BUCKETS)
+        # DBAPI connection id -> time it was opened
+        self._opened_at: Dict[int, float] = {}
+
+        event.listen(pool, "checkout", self._on_checkout)
+        event.listen(pool, "connect", self._on_connect)
+        event.listen(pool, "close", self._on_close)
+        event.listen(pool, "close_detached", self._on_close_detached)
+        pool.connect = self._timed(pool.connect)
+
+    def _timed(self, connect: Callable[[], Any]) -> Callable[[], Any]:
+        def timed_connect() -> Any:
+            start = time.perf_counter()
+            try:
+                return connect()
+            except exc.TimeoutError:
+                self.timeouts += 1
+                raise
+            finally:
+                self.wait_seconds.observe(time.perf_counter() - start)
+        return timed_connect
+
+    def _on_checkout(self, dbapi_connection: Any, connection_record: ConnectionPoolEntry, connection_proxy: Any) -> None:
+        self.checkouts += 1
+
+    def _on_connect(self, dbapi_connection: Any, connection_record: ConnectionPoolEntry) -> None:
+        self.connects += 1
+        self._opened_at[id(dbapi_connection)] = time.monotonic()
+
+    def _on_close(self, dbapi_connection: Any, connection_record: ConnectionPoolEntry) -> None:
+        self._on_close_detached(dbapi_connection)
+
+    def _on_close_detached(self, dbapi_connection: Any) -> None:
+        opened_at = self._opened_at.pop(id(dbapi_connection), None)
+        if opened_at is not None:
+            self.lifetime_seconds.observe(time.monotonic() - opened_at)
+
+    @property
+    def checked_out(self) -> int:
+        return self.pool.checkedout()
+
+    @property
+    def overflow(self) -> int:
+        # QueuePool counts overflow from -pool_size; only connections beyond pool_size are overflow
+        return max(self.pool.overflow(), 0)
+
+
+def instrument_pool(engine: Engine) -> PoolMetrics:
+    """
+    Expose an engine's pool as the db_pool_* metrics.
+
+    Registering another engine replaces the metrics, so only the engine
+    serving requests is reported.
+
+    Args:
+        engine: Sync engine, or an AsyncEngine's sync_engine
+
+    Returns:
+        The PoolMetrics attached to the engine's pool
+    """
+    metrics = PoolMetrics(engine.pool)
+    registry.register(
+        "db_pool_size", "gauge",
+        "Connections the pool keeps open (pool_size)",
+        lambda: metrics.pool.size()
+    )
+    registry.register(
+        "db_pool_checked_out", "gauge",
+        "Connections currently checked out of the pool",
+        lambda: metrics.checked_out
+    )
+    registry.register(
+        "db_pool_overflow", "gauge",
+        "Overflow connections open beyond pool_size",
+        lambda: metrics.overflow
+    )
+    registry.register(
+        "db_pool_checkouts_total", "counter",
+        "Connections checked out of the pool",
+        lambda: metrics.checkouts
+    )
+    registry.register(
+        "db_pool_timeouts_total", "counter",
+        "Checkouts that gave up after pool_timeout",
+        lambda: metrics.timeouts
+    )
+    registry.register(
+        "db_pool_connects_total", "counter",
+        "Database connections opened by the pool",
+        lambda: metrics.connects
+    )
+    registry.register_histogram(
+        "db_pool_checkout_wait_seconds",
+        "Time to check a connection out, including queue wait, connecting and pre-ping",
+        metrics.wait_seconds
+    )
+    registry.register_histogram(
+        "db_pool_connection_lifetime_seconds",
+        "Age of pooled connections when closed",
+        metrics.lifetime_seconds
+    )
+    return metrics
@@ -1,11 +1,57 @@
 from datetime import datetime, timedelta
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from app.core.config import settings
+from app.core.token_cache import verified_token_cache
+
+
+def create_password_context(
+    scheme: str,
+    bcrypt_rounds: int,
+    argon2_time_cost: int,
+    argon2_memory_cost: int,
+    argon2_parallelism: int,
+) -> CryptContext:
+    """
+    Create a password hashing context.
+    
+    Both schemes stay verifiable so existing hashes keep working after a
+    switch; hashes that use the other scheme or different cost parameters
+    are reported by needs_update() and upgraded on the next login.
+    
+    Args:
+        scheme: Scheme for new hashes ("bcrypt" or "argon2")
+        bcrypt_rounds: bcrypt cost factor
+        argon2_time_cost: argon2id iterations
+        argon2_memory_cost: argon2id memory in KiB
+        argon2_parallelism: argon2id lanes
+        
+    Returns:
+        The configured CryptContext
+    """
+    return CryptContext(
+        schemes=["bcrypt", "argon2"],
+        default=scheme,
+        deprecated="auto",
+        bcrypt__default_rounds=bcrypt_rounds,
+        bcrypt__min_desired_rounds=bcrypt_rounds,
+        bcrypt__max_desired_rounds=bcrypt_rounds,
+        argon2__type="ID",
+        argon2__time_cost=argon2_time_cost,
+        argon2__memory_cost=argon2_memory_cost,
+        argon2__parallelism=argon2_parallelism,
+    )
+
 
 # Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = create_password_context(
+    settings.PASSWORD_HASH_SCHEME,
+    settings.BCRYPT_ROUNDS,
+    settings.ARGON2_TIME_COST,
+    settings.ARGON2_MEMORY_COST,
+    settings.ARGON2_PARALLELISM,
+)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -22,9 +68,23 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and rehash it if its scheme or cost is outdated.
+    
+    Args:
+        plain_password: The plain text password
+        hashed_password: The hashed password to compare against
+        
+    Returns:
+        Tuple of (whether the password matches, replacement hash or None)
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
 def get_password_hash(password: str) -> str:
     """
-    Hash a password using bcrypt.
+    Hash a password with the configured scheme and cost.
     
     Args:
         password: The plain text password to hash
@@ -75,3 +135,20 @@ def decode_access_token(token: str) -> Optional[dict[str, Any]]:
     except JWTError:
         return None
 
+
+def decode_access_token_cached(token: str) -> Optional[dict[str, Any]]:
+    """
+    Decode a JWT access token, reusing an earlier verification of the same token.
+    
+    Args:
+        token: The JWT token to decode
+        
+    Returns:
+        The decoded token payload if valid, None otherwise
+    """
+    payload = verified_token_cache.get(token)
+    if payload is None:
+        payload = decode_access_token(token)
+        if payload is not None:
+            verified_token_cache.set(token, payload)
+    return payload
@@ -0,0 +1,196 @@
+"""
+Server-side request timing and per-request SQL accounting.
+
+TimingMiddleware times every HTTP request into per-route histograms on
+/metrics and reports the time in a Server-Timing response header, so
+latency can be split between the client, the api-gateway, the services
+and their databases. Engines passed to track_queries count each
+statement and its time against the request that issued it, and log
+statements slower than the configured threshold.
+
+The header is added when the response starts, so for a streamed body it
+covers the time to the first chunk; the histograms cover the full body.
+"""
+import logging
+import re
+import time
+from contextvars import ContextVar
+from typing import Any, Optional
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.metrics import Histogram, HistogramFamily, registry
+
+logger = logging.getLogger(__name__)
+
+# Statement latency buckets in seconds; most queries take about a millisecond
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# Statements per request
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 4, 5, 7, 10, 15, 25, 50, 100)
+
+# Route label of requests no route matched, so unknown paths add no series
+UNMATCHED_ROUTE = "unmatched"
+
+# Stack of statement start times on each connection's info
+QUERY_START_KEY = "timing_query_start"
+
+
+class RequestTiming:
+    """Database work of one request, filled in by the engine hooks."""
+
+    def __init__(self, method: str, path: str):
+        self.method = method
+        self.path = path
+        self.queries = 0
+        self.db_seconds = 0.0
+
+    def server_timing(self, name: str, elapsed: float) -> str:
+        """
+        Server-Timing header value, e.g. 'app;dur=12.5, app-db;dur=3.1;desc="2 queries"'.
+
+        Args:
+            name: Metric name of the whole request; the database entry is "<name>-db"
+            elapsed: Seconds since the request started
+
+        Returns:
+            Header value; the database entry is left out when no query ran
+        """
+        value = f"{name};dur={elapsed * 1000:.1f}"
+        if self.queries:
+            queries = "1 query" if self.queries == 1 else f"{self.queries} queries"
+            value += f', {name}-db;dur={self.db_seconds * 1000:.1f};desc="{queries}"'
+        return value
+
+
+# Timing of the request being served; sync endpoints and dependencies run
+# in a threadpool with a copy of the context, so they share the object
+current_timing: ContextVar[Optional[RequestTiming]] = ContextVar("current_timing", default=None)
+
+request_seconds = registry.register_histogram_family(
+    "http_request_duration_seconds",
+    "Time to serve a request, by method and route",
+    HistogramFamily(("method", "route"))
+)
+request_queries = registry.register_histogram_family(
+    "http_request_db_queries",
+    "SQL statements issued per request, by method and route",
+    HistogramFamily(("method", "route"), QUERY_COUNT_BUCKETS)
+)
+request_db_seconds = registry.register_histogram_family(
+    "http_request_db_seconds",
+    "Time spent executing SQL per request, by method and route",
+    HistogramFamily(("method", "route"), QUERY_BUCKETS)
+)
+
+
+class TimingMiddleware:
+    """ASGI middleware timing requests into /metrics and the Server-Timing header."""
+
+    def __init__(self, app: ASGIApp, name: str = "app", server_timing: bool = True):
+        """
+        Wrap an application.
+
+        Args:
+            app: ASGI application
+            name: Server-Timing metric name of this service, e.g. "task"
+            server_timing: Whether to add the Server-Timing header
+        """
+        self.app = app
+        self.name = name
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing = RequestTiming(scope["method"], scope["path"])
+        token = current_timing.set(timing)
+        start = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start" and self.server_timing:
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", timing.server_timing(self.name, time.perf_counter() - start))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            elapsed = time.perf_counter() - start
+            current_timing.reset(token)
+            # Set by the router on the shared scope once a route matched
+            route = scope.get("route")
+            labels = (timing.method, getattr(route, "path", UNMATCHED_ROUTE))
+            request_seconds.labels(*labels).observe(elapsed)
+            request_queries.labels(*labels).observe(timing.queries)
+            request_db_seconds.labels(*labels).observe(timing.db_seconds)
+
+
+class QueryStats:
+    """Process-wide SQL statement counters."""
+
+    def __init__(self):
+        self.queries = 0
+        self.slow_queries = 0
+        self.seconds = Histogram(QUERY_BUCKETS)
+
+
+query_stats = QueryStats()
+
+
+def track_queries(engine: Any, slow_query_seconds: float = 0.0) -> None:
+    """
+    Count an engine's statements and time them against the current request.
+
+    Args:
+        engine: Sync engine, or an AsyncEngine's sync_engine
+        slow_query_seconds: Log statements taking at least this long; 0 disables
+    """
+    # Imported here: the api-gateway and stats-service have no database
+    from sqlalchemy import event
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault(QUERY_START_KEY, []).append(time.perf_counter())
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        elapsed = time.perf_counter() - conn.info[QUERY_START_KEY].pop()
+        query_stats.queries += 1
+        query_stats.seconds.observe(elapsed)
+        timing = current_timing.get()
+        if timing is not None:
+            timing.queries += 1
+            timing.db_seconds += elapsed
+        if slow_query_seconds and elapsed >= slow_query_seconds:
+            query_stats.slow_queries += 1
+            request = f"{timing.method} {timing.path}" if timing is not None else "no request"
+            logger.warning(
+                "Slow query took %.1f ms (%s): %s",
+                elapsed * 1000, request, re.sub(r"\s+", " ", statement).strip()
+            )
+
+    def handle_error(exception_context) -> None:
+        # A failed statement never reaches after_cursor_execute
+        connection = exception_context.connection
+        if connection is not None and connection.info.get(QUERY_START_KEY):
+            connection.info[QUERY_START_KEY].pop()
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
+    event.listen(engine, "handle_error", handle_error)
+
+    registry.register(
+        "db_queries_total", "counter",
+        "SQL statements executed",
+        lambda: query_stats.queries
+    )
+    registry.register(
+        "db_slow_queries_total", "counter",
+        "SQL statements at or over the slow-query threshold",
+        lambda: query_stats.slow_queries
+    )
+    registry.register_histogram(
+        "db_query_seconds",
+        "Time to execute a SQL statement",
+        query_stats.seconds
+    )
@@ -1,13 +1,42 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
-from app.routers import auth_router, task_router, stats_router
+from app.core.database import async_engine, async_replica_engines
+from app.core.metrics import PROMETHEUS_CONTENT_TYPE, registry
+from app.core.timing import TimingMiddleware
+from app.core.responses import default_response_class
+from app.core.password_hasher import password_hasher
+from app.routers import (
+    auth_router,
+    task_router,
+    stats_router,
+    async_auth_router,
+    async_task_router,
+    async_stats_router,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan - releases pooled resources on shutdown."""
+    yield
+    password_hasher.shutdown()
+    if async_engine is not None:
+        await async_engine.dispose()
+    for replica in async_replica_engines:
+        await replica.dispose()
+
 
 # Create FastAPI application
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     debug=settings.DEBUG,
+    default_response_class=default_response_class(),
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -19,10 +48,32 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Include routers
-app.include_router(auth_router, prefix=settings.API_V1_PREFIX)
-app.include_router(task_router, prefix=settings.API_V1_PREFIX)
-app.include_router(stats_router, prefix=settings.API_V1_PREFIX)
+# Compress large responses with the coding the client prefers
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
+
+# Time requests into /metrics and the Server-Timing header; added last so
+# the time includes the other middleware
+app.add_middleware(
+    TimingMiddleware,
+    name="app",
+    server_timing=settings.SERVER_TIMING_ENABLED,
+)
+
+# Include routers (async variants when DB_ASYNC is enabled)
+if settings.DB_ASYNC:
+    app.include_router(async_auth_router, prefix=settings.API_V1_PREFIX)
+    app.include_router(async_task_router, prefix=settings.API_V1_PREFIX)
+    app.include_router(async_stats_router, prefix=settings.API_V1_PREFIX)
+else:
+    app.include_router(auth_router, prefix=settings.API_V1_PREFIX)
+    app.include_router(task_router, prefix=settings.API_V1_PREFIX)
+    app.include_router(stats_router, prefix=settings.API_V1_PREFIX)
 
 
 @app.get("/", tags=["Root"])
@@ -31,7 +82,8 @@ def root():
     return {
         "name": settings.APP_NAME,
         "version": settings.APP_VERSION,
-        "status": "running"
+        "status": "running",
+        "db_mode": "async" if settings.DB_ASYNC else "sync"
     }
 
 
@@ -40,3 +92,9 @@ def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
 
+
+
+@app.get("/metrics", tags=["Monitoring"], response_class=PlainTextResponse)
+def metrics() -> PlainTextResponse:
+    """Prometheus metrics endpoint."""
+    return PlainTextResponse(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,5 +1,6 @@
 from app.models.user import User
 from app.models.task import Task, TaskStatus, TaskPriority
+from app.models.task_counter import TaskCounter
 
-__all__ = ["User", "Task", "TaskStatus", "TaskPriority"]
+__all__ = ["User", "Task", "TaskStatus", "TaskPriority", "TaskCounter"]
 
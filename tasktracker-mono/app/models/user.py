@@ -17,8 +17,9 @@ class User(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
-    # Relationship
-    tasks = relationship("Task", back_populates="owner", cascade="all, delete-orphan")
+    # Relationship; passive_deletes leaves child rows to the database's
+    # ON DELETE CASCADE instead of loading every task before a delete
+    tasks = relationship("Task", back_populates="owner", cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self):
         return f"<User(id={self.id}, username={self.username}, email={self.email})>"
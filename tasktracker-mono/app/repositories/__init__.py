@@ -1,4 +1,15 @@
 from app.repositories.user_repository import UserRepository
 from app.repositories.task_repository import TaskRepository
+from app.repositories.task_counter_repository import TaskCounterRepository
+from app.repositories.async_user_repository import AsyncUserRepository
+from app.repositories.async_task_repository import AsyncTaskRepository
+from app.repositories.async_task_counter_repository import AsyncTaskCounterRepository
 
-__all__ = ["UserRepository", "TaskRepository"]
+__all__ = [
+    "UserRepository",
+    "TaskRepository",
+    "TaskCounterRepository",
+    "AsyncUserRepository",
+    "AsyncTaskRepository",
+    "AsyncTaskCounterRepository",
+]
@@ -0,0 +1,88 @@
+from typing import Dict, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.cache import owner_versions
+from app.core.replicas import primary_read, primary_write, replica_read
+from app.models.task_counter import TaskCounter
+from app.repositories.task_counter_repository import (
+    COUNTER_FIELDS,
+    build_increment,
+    build_rebuild,
+    empty_counts,
+)
+
+
+class AsyncTaskCounterRepository:
+    """
+    Async repository for the per-owner task_counters table.
+    Mirrors TaskCounterRepository on top of an AsyncSession.
+    """
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize the repository with an async database session.
+
+        Args:
+            db: SQLAlchemy async database session
+        """
+        self.db = db
+
+    @replica_read
+    async def get_counts(self, owner_id: int) -> Dict[str, int]:
+        """
+        Get all task counts for a specific user.
+
+        Args:
+            owner_id: The owner's user ID
+
+        Returns:
+            Dictionary with one entry per counter field
+        """
+        result = await self.db.execute(
+            select(*(TaskCounter.__table__.c[field] for field in COUNTER_FIELDS))
+            .where(TaskCounter.owner_id == owner_id)
+        )
+        row = result.first()
+        return dict(row._mapping) if row else empty_counts()
+
+    @primary_read
+    async def get_version(self, owner_id: int) -> int:
+        """
+        Get the version of a specific user's tasks.
+
+        Args:
+            owner_id: The owner's user ID
+
+        Returns:
+            Number incremented by every task write; 0 before the first
+        """
+        version = await self.db.scalar(select(TaskCounter.version).where(TaskCounter.owner_id == owner_id))
+        return version or 0
+
+    @primary_write
+    async def increment(self, owner_id: int, deltas: Dict[str, int]) -> None:
+        """
+        Apply counter deltas for a specific user and bump their version, without committing.
+
+        Args:
+            owner_id: The owner's user ID
+            deltas: Mapping of counter field to delta
+        """
+        dialect_name = self.db.get_bind().dialect.name
+        await self.db.execute(build_increment(dialect_name, owner_id, deltas))
+
+    @primary_write
+    async def rebuild(self, owner_id: Optional[int] = None) -> None:
+        """
+        Recompute counters from the tasks table and commit.
+
+        Args:
+            owner_id: Restrict the rebuild to one owner; None rebuilds every owner,
+                leaving cached stats to expire after CACHE_TTL_SECONDS
+        """
+        dialect_name = self.db.get_bind().dialect.name
+        for stmt in build_rebuild(dialect_name, owner_id):
+            await self.db.execute(stmt)
+        await self.db.commit()
+        if owner_id is not None:
+            await owner_versions.abump(owner_id)
@@ -0,0 +1,418 @@
+from datetime import datetime
+from typing import Any, Dict, Optional, List, Tuple
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+from app.models.task import Task, TaskStatus
+from app.schemas.task import TaskCreate, TaskUpdate, TaskFilter
+from app.core.cache import owner_versions
+from app.core.replicas import primary_read, primary_write, replica_read
+from app.repositories.async_task_counter_repository import AsyncTaskCounterRepository
+from app.repositories.task_counter_repository import counter_deltas, merge_deltas
+from app.repositories.task_repository import (
+    PRIOR_VALUES_RETURNING_DIALECTS,
+    build_bulk_insert,
+    build_bulk_update,
+    build_count_query,
+    build_due_query,
+    build_export_query,
+    build_insert,
+    build_list_query,
+    build_owned_bulk_delete,
+    build_owned_columns,
+    build_owned_delete,
+    build_owned_tasks,
+    build_owned_update,
+    build_prior_values,
+    build_search_query,
+    incomplete_values,
+    insert_values,
+    update_values,
+)
+
+
+class AsyncTaskRepository:
+    """
+    Async repository for Task database operations.
+    Mirrors TaskRepository on top of an AsyncSession.
+    All operations are scoped to a specific user.
+    """
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize the repository with an async database session.
+
+        Args:
+            db: SQLAlchemy async database session
+        """
+        self.db = db
+        self.counters = AsyncTaskCounterRepository(db)
+
+    @staticmethod
+    def _counter_deltas(task: Task, sign: int = 1) -> Dict[str, int]:
+        """
+        Counter changes contributed by a task in its current state.
+
+        Args:
+            task: The task
+            sign: 1 when the task is added, -1 when it is removed
+
+        Returns:
+            Mapping of counter field to delta
+        """
+        return counter_deltas(task.status, task.priority, task.is_completed, sign)
+
+    @replica_read
+    async def get_by_id(self, task_id: int, owner_id: int) -> Optional[Task]:
+        """
+        Get a task by ID for a specific user.
+
+        Args:
+            task_id: The task's ID
+            owner_id: The owner's user ID
+
+        Returns:
+            Task object if found and owned by user, None otherwise
+        """
+        result = await self.db.scalars(
+            select(Task).where(Task.id == task_id, Task.owner_id == owner_id)
+        )
+        return result.first()
+
+    @replica_read
+    async def get_columns_by_id(self, task_id: int, owner_id: int, columns: List[str]) -> Optional[Row]:
+        """
+        Get some columns of a task by ID for a specific user.
+
+        Args:
+            task_id: The task's ID
+            owner_id: The owner's user ID
+            columns: Task columns to select
+
+        Returns:
+            Row of the columns if found and owned by user, None otherwise
+        """
+        result = await self.db.execute(build_owned_columns(task_id, owner_id, columns))
+        return result.first()
+
+    @replica_read
+    async def get_filtered(
+        self,
+        owner_id: int,
+        filters: TaskFilter,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        columns: Optional[List[str]] = None
+    ) -> Tuple[List[Any], int]:
+        """
+        Get a filtered, sorted page of tasks and the matching total in one query.
+
+        Args:
+            owner_id: The owner's user ID
+            filters: Task filters and ordering
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            cursor: Optional (created_at, id) keyset position to continue after
+            columns: Optional task columns to fetch instead of whole tasks
+
+        Returns:
+            Tuple of (tasks, total number of matching tasks); with columns,
+            the tasks are rows of just those columns
+        """
+        result = await self.db.execute(build_list_query(owner_id, filters, skip, limit, cursor, columns))
+        rows = result.all()
+        if rows:
+            tasks = rows if columns is not None else [row.Task for row in rows]
+            return tasks, rows[0].total
+
+        # An empty page past the end carries no total; count separately
+        if skip == 0 and cursor is None:
+            return [], 0
+        return [], await self.db.scalar(build_count_query(owner_id, filters))
+
+    @replica_read
+    async def stream_all(self, owner_id: int, batch_size: int) -> AsyncResult:
+        """
+        Stream every task of a user from a server-side cursor.
+
+        Args:
+            owner_id: The owner's user ID
+            batch_size: Rows fetched per round trip
+
+        Returns:
+            AsyncResult whose partitions() yield lists of at most batch_size rows
+        """
+        return await self.db.stream(build_export_query(owner_id, batch_size))
+
+    @replica_read
+    async def get_due(
+        self,
+        owner_id: int,
+        limit: int = 100,
+        due_after: Optional[datetime] = None,
+        due_before: Optional[datetime] = None,
+        cursor: Optional[Tuple[datetime, int]] = None
+    ) -> List[Task]:
+        """
+        Get a page of a user's incomplete tasks with a due date, soonest first.
+
+        Args:
+            owner_id: The owner's user ID
+            limit: Maximum number of records to return
+            due_after: Optional lower bound (inclusive) on due_date
+            due_before: Optional upper bound (exclusive) on due_date
+            cursor: Optional (due_date, id) keyset position to continue after
+
+        Returns:
+            List of tasks
+        """
+        result = await self.db.scalars(build_due_query(owner_id, limit, due_after, due_before, cursor))
+        return list(result)
+
+    @replica_read
+    async def search(
+        self,
+        owner_id: int,
+        q: str,
+        limit: int = 20,
+        cursor: Optional[Tuple[float, int]] = None
+    ) -> List[Row]:
+        """
+        Get a page of a user's tasks matching a text query, best match first.
+
+        Args:
+            owner_id: The owner's user ID
+            q: Search text
+            limit: Maximum number of records to return
+            cursor: Optional (rank, id) keyset position to continue after
+
+        Returns:
+            Rows of (Task, rank)
+        """
+        dialect_name = self.db.get_bind().dialect.name
+        result = await self.db.execute(build_search_query(dialect_name, owner_id, q, limit, cursor))
+        return result.all()
+
+    @replica_read
+    async def get_stats(self, owner_id: int) -> Dict[str, int]:
+        """
+        Get all task counts for a specific user from the counters table.
+
+        Args:
+            owner_id: The owner's user ID
+
+        Returns:
+            Dictionary with total, todo, in_progress, done, completed,
+            high_priority, medium_priority and low_priority counts
+        """
+        return await self.counters.get_counts(owner_id)
+
+    @primary_read
+    async def get_version(self, owner_id: int) -> int:
+        """
+        Get the version of a specific user's tasks, for ETags.
+
+        Args:
+            owner_id: The owner's user ID
+
+        Returns:
+            Number incremented by every write to the user's tasks
+        """
+        return await self.counters.get_version(owner_id)
+
+    @primary_write
+    async def create(self, task_create: TaskCreate, owner_id: int) -> Task:
+        """
+        Create a new task for a specific user.
+
+        Uses INSERT ... RETURNING so server defaults come back without a refresh.
+
+        Args:
+            task_create: Task creation schema with task data
+            owner_id: The owner's user ID
+
+        Returns:
+            Created Task object
+        """
+        db_task = (await self.db.scalars(build_insert(task_create, owner_id))).one()
+        await self.counters.increment(owner_id, self._counter_deltas(db_task))
+        await self.db.commit()
+        await owner_versions.abump(owner_id)
+        return db_task
+
+    async def _update_owned(self, task_id: int, owner_id: int, values: Dict[str, Any]) -> Optional[Task]:
+        """
+        Update an owned task with UPDATE ... RETURNING and adjust its counters.
+
+        Args:
+            task_id: The task's ID
+            owner_id: The owner's user ID
+            values: Column values or SQL expressions to set
+
+        Returns:
+            Updated Task object, None if task not found or not owned by user
+        """
+        if self.db.get_bind().dialect.name in PRIOR_VALUES_RETURNING_DIALECTS:
+            row = (await self.db.execute(build_owned_update(task_id, owner_id, values, with_prior=True))).first()
+            if row is None:
+                return None
+            before = counter_deltas(row.old_status, row.old_priority, row.old_is_completed, sign=-1)
+        else:
+            prior = (await self.db.execute(build_prior_values(task_id, owner_id))).first()
+            if prior is None:
+                return None
+            before = counter_deltas(prior.status, prior.priority, prior.is_completed, sign=-1)
+            row = (await self.db.execute(build_owned_update(task_id, owner_id, values))).one()
+
+        db_task = row.Task
+        await self.counters.increment(owner_id, merge_deltas(before, self._counter_deltas(db_task)))
+        await self.db.commit()
+        await owner_versions.abump(owner_id)
+        return db_task
+
+    @primary_write
+    async def update(self, task_id: int, task_update: TaskUpdate, owner_id: int) -> Optional[Task]:
+        """
+        Update a task for a specific user.
+
+        Args:
+            task_id: The task's ID
+            task_update: Task update schema with fields to update
+            owner_id: The owner's user ID
+
+        Returns:
+            Updated Task object if successful, None if task not found or not owned by user
+        """
+        # Update only provided fields; status also updates is_completed
+        values = update_values(task_update)
+        if not values:
+            return await self.get_by_id(task_id, owner_id)
+
+        return await self._update_owned(task_id, owner_id, values)
+
+    @primary_write
+    async def delete(self, task_id: int, owner_id: int) -> bool:
+        """
+        Delete a task for a specific user.
+
+        Args:
+            task_id: The task's ID
+            owner_id: The owner's user ID
+
+        Returns:
+            True if deleted successfully, False if task not found or not owned by user
+        """
+        row = (await self.db.execute(build_owned_delete(task_id, owner_id))).first()
+        if row is None:
+            return False
+
+        await self.counters.increment(owner_id, counter_deltas(row.status, row.priority, row.is_completed, sign=-1))
+        await self.db.commit()
+        await owner_versions.abump(owner_id)
+        return True
+
+    @primary_write
+    async def bulk_create(self, task_creates: List[TaskCreate], owner_id: int) -> List[Task]:
+        """
+        Create several tasks for a specific user in one transaction.
+
+        Args:
+            task_creates: Task creation schemas, in request order
+            owner_id: The owner's user ID
+
+        Returns:
+            Created Task objects, in the same order
+        """
+        db_tasks = (await self.db.scalars(
+            build_bulk_insert(),
+            [insert_values(task_create, owner_id) for task_create in task_creates]
+        )).all()
+        await self.counters.increment(owner_id, merge_deltas(*(self._counter_deltas(task) for task in db_tasks)))
+        await self.db.commit()
+        await owner_versions.abump(owner_id)
+        return list(db_tasks)
+
+    @primary_write
+    async def bulk_update(self, task_updates: Dict[int, TaskUpdate], owner_id: int) -> Dict[int, Task]:
+        """
+        Update several tasks for a specific user with a single UPDATE statement.
+
+        Args:
+            task_updates: Mapping of task ID to the update for that task
+            owner_id: The owner's user ID
+
+        Returns:
+            Mapping of task ID to the updated Task, for the tasks owned by the user
+        """
+        db_tasks = {task.id: task for task in await self.db.scalars(build_owned_tasks(list(task_updates), owner_id))}
+        changes = {}
+        for task_id in db_tasks:
+            values = update_values(task_updates[task_id])
+            if values:
+                changes[task_id] = values
+
+        if changes:
+            # Counter deltas must be taken before RETURNING refreshes the tasks
+            before = [self._counter_deltas(db_tasks[task_id], sign=-1) for task_id in changes]
+            updated = (await self.db.scalars(build_bulk_update(owner_id, changes))).all()
+            after = [self._counter_deltas(task) for task in updated]
+            await self.counters.increment(owner_id, merge_deltas(*before, *after))
+
+        await self.db.commit()
+        if changes:
+            await owner_versions.abump(owner_id)
+        return db_tasks
+
+    @primary_write
+    async def bulk_delete(self, task_ids: List[int], owner_id: int) -> List[int]:
+        """
+        Delete several tasks for a specific user with a single DELETE statement.
+
+        Args:
+            task_ids: IDs of the tasks to delete
+            owner_id: The owner's user ID
+
+        Returns:
+            IDs of the tasks that were deleted
+        """
+        rows = (await self.db.execute(build_owned_bulk_delete(task_ids, owner_id))).all()
+        if rows:
+            await self.counters.increment(owner_id, merge_deltas(*(
+                counter_deltas(row.status, row.priority, row.is_completed, sign=-1) for row in rows
+            )))
+        await self.db.commit()
+        if rows:
+            await owner_versions.abump(owner_id)
+        return [row.id for row in rows]
+
+    @primary_write
+    async def mark_as_completed(self, task_id: int, owner_id: int) -> Optional[Task]:
+        """
+        Mark a task as completed for a specific user.
+
+        Args:
+            task_id: The task's ID
+            owner_id: The owner's user ID
+
+        Returns:
+            Updated Task object if successful, None if task not found or not owned by user
+        """
+        return await self._update_owned(
+            task_id,
+            owner_id,
+            {"is_completed": True, "status": TaskStatus.DONE}
+        )
+
+    @primary_write
+    async def mark_as_incomplete(self, task_id: int, owner_id: int) -> Optional[Task]:
+        """
+        Mark a task as incomplete for a specific user.
+
+        Args:
+            task_id: The task's ID
+            owner_id: The owner's user ID
+
+        Returns:
+            Updated Task object if successful, None if task not found or not owned by user
+        """
+        return await self._update_owned(task_id, owner_id, incomplete_values())
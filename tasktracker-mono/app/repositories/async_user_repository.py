@@ -0,0 +1,216 @@
+from typing import Optional, List
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.user import User
+from app.schemas.user import UserCreate, UserUpdate
+from app.core.password_hasher import password_hasher
+from app.core.principal_cache import principal_cache
+
+
+class AsyncUserRepository:
+    """
+    Async repository for User database operations.
+    Mirrors UserRepository on top of an AsyncSession.
+    """
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize the repository with an async database session.
+
+        Args:
+            db: SQLAlchemy async database session
+        """
+        self.db = db
+
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        """
+        Get a user by ID.
+
+        Args:
+            user_id: The user's ID
+
+        Returns:
+            User object if found, None otherwise
+        """
+        return await self.db.get(User, user_id)
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """
+        Get a user by email.
+
+        Args:
+            email: The user's email
+
+        Returns:
+            User object if found, None otherwise
+        """
+        result = await self.db.scalars(select(User).where(User.email == email))
+        return result.first()
+
+    async def get_by_username(self, username: str) -> Optional[User]:
+        """
+        Get a user by username.
+
+        Args:
+            username: The user's username
+
+        Returns:
+            User object if found, None otherwise
+        """
+        result = await self.db.scalars(select(User).where(User.username == username))
+        return result.first()
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> List[User]:
+        """
+        Get all users with pagination.
+
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            List of User objects
+        """
+        result = await self.db.scalars(select(User).offset(skip).limit(limit))
+        return list(result.all())
+
+    async def create(self, user_create: UserCreate, hashed_password: Optional[str] = None) -> Optional[User]:
+        """
+        Create a new user.
+
+        Args:
+            user_create: User creation schema with user data
+            hashed_password: Precomputed password hash; hashed here when omitted
+
+        Returns:
+            Created User object if successful, None if username/email already exists
+        """
+        # Hashing is CPU-bound, keep it off the event loop
+        if hashed_password is None:
+            hashed_password = await password_hasher.hash(user_create.password)
+
+        db_user = User(
+            email=user_create.email,
+            username=user_create.username,
+            hashed_password=hashed_password,
+            full_name=user_create.full_name,
+            is_active=True,
+            is_superuser=False,
+        )
+
+        try:
+            self.db.add(db_user)
+            await self.db.commit()
+            await self.db.refresh(db_user)
+            return db_user
+        except IntegrityError:
+            await self.db.rollback()
+            return None
+
+    async def update(self, user_id: int, user_update: UserUpdate) -> Optional[User]:
+        """
+        Update a user.
+
+        Args:
+            user_id: The user's ID
+            user_update: User update schema with fields to update
+
+        Returns:
+            Updated User object if successful, None if user not found
+        """
+        db_user = await self.get_by_id(user_id)
+        if not db_user:
+            return None
+
+        # Update only provided fields
+        update_data = user_update.model_dump(exclude_unset=True)
+
+        # Hash password if provided
+        if "password" in update_data:
+            update_data["hashed_password"] = await password_hasher.hash(update_data.pop("password"))
+
+        for field, value in update_data.items():
+            setattr(db_user, field, value)
+
+        try:
+            await self.db.commit()
+            principal_cache.invalidate(user_id)
+            await self.db.refresh(db_user)
+            return db_user
+        except IntegrityError:
+            await self.db.rollback()
+            return None
+
+    async def update_password_hash(self, user_id: int, hashed_password: str) -> bool:
+        """
+        Replace a user's password hash, e.g. after a scheme or cost upgrade.
+
+        Args:
+            user_id: The user's ID
+            hashed_password: The new password hash
+
+        Returns:
+            True if updated, False if user not found
+        """
+        result = await self.db.execute(
+            update(User).where(User.id == user_id).values(hashed_password=hashed_password)
+        )
+        await self.db.commit()
+        return result.rowcount > 0
+
+    async def delete(self, user_id: int) -> bool:
+        """
+        Delete a user.
+
+        Args:
+            user_id: The user's ID
+
+        Returns:
+            True if deleted successfully, False if user not found
+        """
+        # Single DELETE; tasks and counters go with it via ON DELETE CASCADE
+        result = await self.db.execute(delete(User).where(User.id == user_id))
+        await self.db.commit()
+        principal_cache.invalidate(user_id)
+        return result.rowcount > 0
+
+    async def activate(self, user_id: int) -> Optional[User]:
+        """
+        Activate a user account.
+
+        Args:
+            user_id: The user's ID
+
+        Returns:
+            Updated User object if successful, None if user not found
+        """
+        db_user = await self.get_by_id(user_id)
+        if not db_user:
+            return None
+
+        db_user.is_active = True
+        await self.db.commit()
+        principal_cache.invalidate(user_id)
+        await self.db.refresh(db_user)
+        return db_user
+
+    async def deactivate(self, user_id: int) -> Optional[User]:
+        """
+        Deactivate a user account.
+
+        Args:
+            user_id: The user's ID
+
+        Returns:
+            Updated User object if successful, None if user not found
+        """
+        db_user = await self.get_by_id(user_id)
+        if not db_user:
+            return None
+
+        db_user.is_active = False
+        await self.db.commit()
+        principal_cache.invalidate(user_id)
+        await self.db.refresh(db_user)
+        return db_user
@@ -1,9 +1,421 @@
-from typing import Optional, List
+from datetime import datetime
+from typing import Any, Dict, Optional, List, Sequence, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import func
+from sqlalchemy import ColumnElement, Delete, Float, Insert, Result, Row, Select, Update, case, cast, delete, func, insert, literal, literal_column, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from app.models.task import Task, TaskStatus, TaskPriority
-from app.schemas.task import TaskCreate, TaskUpdate
+from app.models.task_counter import TaskCounter
+from app.schemas.task import TaskCreate, TaskUpdate, TaskFilter, TaskSortField, SortOrder
+from app.core.cache import owner_versions
+from app.core.replicas import primary_read, primary_write, replica_read
+from app.repositories.task_counter_repository import (
+    TaskCounterRepository,
+    counter_deltas,
+    merge_deltas,
+)
+
+
+SORT_COLUMNS = {
+    TaskSortField.CREATED_AT: Task.created_at,
+    TaskSortField.UPDATED_AT: Task.updated_at,
+    TaskSortField.DUE_DATE: Task.due_date,
+    # Rank explicitly: stored enum labels do not sort by urgency
+    TaskSortField.PRIORITY: case(
+        (Task.priority == TaskPriority.LOW, 0),
+        (Task.priority == TaskPriority.MEDIUM, 1),
+        else_=2
+    ),
+    TaskSortField.TITLE: Task.title,
+}
+
+# Generated tsvector over title (weight A) and description (weight B), from
+# migration 005; not mapped on Task so that loading tasks never fetches it
+SEARCH_VECTOR = literal_column("tasks.search_vector", TSVECTOR)
+# Text search configuration search_vector is built with
+SEARCH_CONFIG = "english"
+# Dialects with search_vector; others match words with LIKE
+FULL_TEXT_SEARCH_DIALECTS = {"postgresql"}
+
+
+def build_filter_conditions(owner_id: int, filters: TaskFilter) -> List[ColumnElement]:
+    """
+    Build the WHERE conditions for an owner's filtered task list.
+
+    Args:
+        owner_id: The owner's user ID
+        filters: Task filters; every provided filter is combined with AND
+
+    Returns:
+        List of SQL conditions
+    """
+    conditions = [Task.owner_id == owner_id]
+    if filters.status is not None:
+        conditions.append(Task.status == filters.status)
+    if filters.priority is not None:
+        conditions.append(Task.priority == filters.priority)
+    if filters.is_completed is not None:
+        conditions.append(Task.is_completed == filters.is_completed)
+    if filters.due_after is not None:
+        conditions.append(Task.due_date >= filters.due_after)
+    if filters.due_before is not None:
+        conditions.append(Task.due_date < filters.due_before)
+    if filters.created_after is not None:
+        conditions.append(Task.created_at >= filters.created_after)
+    if filters.created_before is not None:
+        conditions.append(Task.created_at < filters.created_before)
+    return conditions
+
+
+def counter_total(owner_id: int, filters: TaskFilter) -> Optional[ColumnElement]:
+    """
+    Total for filters that a single task_counters column already answers.
+
+    Args:
+        owner_id: The owner's user ID
+        filters: Task filters
+
+    Returns:
+        Scalar subquery over task_counters, or None if the filters need a count
+    """
+    ranged = (filters.due_after, filters.due_before, filters.created_after, filters.created_before)
+    selective = [f for f in (filters.status, filters.priority, filters.is_completed) if f is not None]
+    if any(value is not None for value in ranged) or len(selective) > 1:
+        return None
+
+    if filters.status is not None:
+        column = TaskCounter.__table__.c[filters.status.value]
+    elif filters.priority is not None:
+        column = TaskCounter.__table__.c[f"{filters.priority.value}_priority"]
+    elif filters.is_completed is True:
+        column = TaskCounter.completed
+    elif filters.is_completed is False:
+        column = TaskCounter.total - TaskCounter.completed
+    else:
+        column = TaskCounter.total
+
+    subquery = select(column).where(TaskCounter.owner_id == owner_id).scalar_subquery()
+    return func.coalesce(subquery, 0)
+
+
+def build_list_query(
+    owner_id: int,
+    filters: TaskFilter,
+    skip: int,
+    limit: int,
+    cursor: Optional[Tuple[datetime, int]] = None,
+    columns: Optional[Sequence[str]] = None
+) -> Select:
+    """
+    Build a single statement returning a page of tasks and the matching total.
+
+    Each row is (Task, total). The total comes from task_counters when the
+    filters map onto a counter, from COUNT(*) OVER() for offset pages, and
+    from a count subquery for cursor pages (where the window would only see
+    rows after the cursor).
+
+    Args:
+        owner_id: The owner's user ID
+        filters: Task filters and ordering
+        skip: Number of records to skip (ignored when a cursor is given)
+        limit: Maximum number of records to return
+        cursor: Optional (created_at, id) keyset position; requires sort_by=created_at
+        columns: Optional task columns to select instead of whole Task rows
+
+    Returns:
+        Select of (Task, total) rows, or of the columns followed by total
+    """
+    conditions = build_filter_conditions(owner_id, filters)
+
+    total = counter_total(owner_id, filters)
+    if total is None and cursor is not None:
+        total = (
+            select(func.count()).select_from(Task).where(*conditions)
+            .correlate(None).scalar_subquery()
+        )
+    elif total is None:
+        total = func.count().over()
+
+    selected = [Task] if columns is None else [Task.__table__.c[name] for name in columns]
+    stmt = select(*selected, total.label("total")).where(*conditions)
+
+    descending = filters.order == SortOrder.DESC
+    if cursor is not None:
+        position = tuple_(Task.created_at, Task.id)
+        stmt = stmt.where(position < tuple_(*cursor) if descending else position > tuple_(*cursor))
+        skip = 0
+
+    sort_column = SORT_COLUMNS[filters.sort_by]
+    sort_key = sort_column.desc() if descending else sort_column.asc()
+    # Only due_date is nullable; other keys keep matching the index order
+    if filters.sort_by == TaskSortField.DUE_DATE:
+        sort_key = sort_key.nulls_last()
+    tiebreak = Task.id.desc() if descending else Task.id.asc()
+    return stmt.order_by(sort_key, tiebreak).offset(skip).limit(limit)
+
+
+def build_count_query(owner_id: int, filters: TaskFilter) -> Select:
+    """Count every task matching the filters."""
+    return select(func.count()).select_from(Task).where(*build_filter_conditions(owner_id, filters))
+
+
+def build_owned_columns(task_id: int, owner_id: int, columns: Sequence[str]) -> Select:
+    """Select some columns of one task, only if the owner matches."""
+    return select(*(Task.__table__.c[name] for name in columns)).where(
+        Task.id == task_id, Task.owner_id == owner_id
+    )
+
+
+def build_export_query(owner_id: int, batch_size: int) -> Select:
+    """
+    Select every task of an owner, oldest first, from a server-side cursor.
+
+    Core columns rather than Task entities: rows are not tracked by the
+    session, so memory stays bounded by one batch however many tasks there are.
+    """
+    return (
+        select(*Task.__table__.c)
+        .where(Task.owner_id == owner_id)
+        .order_by(Task.created_at, Task.id)
+        .execution_options(stream_results=True, yield_per=batch_size)
+    )
+
+
+def build_due_query(
+    owner_id: int,
+    limit: int,
+    due_after: Optional[datetime] = None,
+    due_before: Optional[datetime] = None,
+    cursor: Optional[Tuple[datetime, int]] = None
+) -> Select:
+    """
+    Build a page of an owner's incomplete tasks with a due date, soonest first.
+
+    Every condition and the ordering match the partial index
+    ix_tasks_owner_due_incomplete (migration 006), so a page is one range
+    scan of the owner's open tasks, in index order, without a sort.
+
+    Args:
+        owner_id: The owner's user ID
+        limit: Maximum number of records to return
+        due_after: Optional lower bound (inclusive) on due_date
+        due_before: Optional upper bound (exclusive) on due_date
+        cursor: Optional (due_date, id) keyset position to continue after
+
+    Returns:
+        Select of Task rows ordered by due_date, then id
+    """
+    conditions = [Task.owner_id == owner_id, Task.is_completed == False, Task.due_date.is_not(None)]
+    if due_after is not None:
+        conditions.append(Task.due_date >= due_after)
+    if due_before is not None:
+        conditions.append(Task.due_date < due_before)
+    if cursor is not None:
+        conditions.append(tuple_(Task.due_date, Task.id) > tuple_(*cursor))
+    return select(Task).where(*conditions).order_by(Task.due_date.asc(), Task.id.asc()).limit(limit)
+
+
+def build_search_query(
+    dialect_name: str,
+    owner_id: int,
+    q: str,
+    limit: int,
+    cursor: Optional[Tuple[float, int]] = None
+) -> Select:
+    """
+    Build a page of an owner's tasks matching a text query, best match first.
+
+    On PostgreSQL q is parsed by websearch_to_tsquery ("quoted phrases",
+    or, -word) and matched against search_vector through the
+    (owner_id, search_vector) GIN index, and matches are ranked with
+    ts_rank_cd. Elsewhere every word of q must occur in the title or the
+    description, and all matches rank 0.
+
+    Args:
+        dialect_name: Name of the session's database dialect
+        owner_id: The owner's user ID
+        q: Search text
+        limit: Maximum number of records to return
+        cursor: Optional (rank, id) keyset position to continue after
+
+    Returns:
+        Select of (Task, rank) rows ordered by rank, then id, descending
+    """
+    if dialect_name in FULL_TEXT_SEARCH_DIALECTS:
+        query = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+        conditions = [SEARCH_VECTOR.bool_op("@@")(query)]
+        # ts_rank_cd returns a real; in double precision the rank a cursor
+        # carries through JSON compares equal to the row it came from
+        rank = cast(func.ts_rank_cd(SEARCH_VECTOR, query), Float(53))
+    else:
+        conditions = [
+            or_(Task.title.icontains(word, autoescape=True), Task.description.icontains(word, autoescape=True))
+            for word in q.split()
+        ]
+        rank = literal(0.0, Float)
+
+    stmt = select(Task, rank.label("rank")).where(Task.owner_id == owner_id, *conditions)
+    if cursor is not None:
+        stmt = stmt.where(tuple_(rank, Task.id) < tuple_(*cursor))
+    return stmt.order_by(rank.desc(), Task.id.desc()).limit(limit)
+
+
+# Dialects whose UPDATE ... FROM can return columns of the FROM subquery;
+# SQLite's RETURNING may only reference the table being updated
+PRIOR_VALUES_RETURNING_DIALECTS = {"postgresql"}
+
+
+def insert_values(task_create: TaskCreate, owner_id: int) -> Dict[str, Any]:
+    """Column values for a new task."""
+    return {
+        "title": task_create.title,
+        "description": task_create.description,
+        "status": task_create.status,
+        "priority": task_create.priority,
+        "due_date": task_create.due_date,
+        "owner_id": owner_id,
+        "is_completed": task_create.status == TaskStatus.DONE,
+    }
+
+
+def build_insert(task_create: TaskCreate, owner_id: int) -> Insert:
+    """Build an INSERT ... RETURNING for a new task, including server defaults."""
+    return insert(Task).values(**insert_values(task_create, owner_id)).returning(Task)
+
+
+def build_bulk_insert() -> Insert:
+    """
+    Build a multi-row INSERT ... RETURNING for a list of insert_values().
+
+    Executed with a parameter list, the rows are sent as batched multi-row
+    VALUES and returned in parameter order.
+    """
+    return insert(Task).returning(Task, sort_by_parameter_order=True)
+
+
+def build_prior_values(task_id: int, owner_id: int) -> Select:
+    """Lock an owned task and select the fields the counters depend on."""
+    return (
+        select(Task.id, Task.status, Task.priority, Task.is_completed)
+        .where(Task.id == task_id, Task.owner_id == owner_id)
+        .with_for_update()
+    )
+
+
+def build_owned_update(
+    task_id: int,
+    owner_id: int,
+    values: Dict[str, Any],
+    with_prior: bool = False
+) -> Update:
+    """
+    Build an owner-scoped UPDATE ... RETURNING for a single task.
+
+    Args:
+        task_id: The task's ID
+        owner_id: The owner's user ID
+        values: Column values or SQL expressions to set
+        with_prior: Also return the pre-update status, priority and
+            is_completed as old_* columns (UPDATE ... FROM a locked subquery)
+
+    Returns:
+        Update returning the Task (and old_* columns when with_prior is set)
+    """
+    stmt = update(Task).values(**values)
+    if not with_prior:
+        return stmt.where(Task.id == task_id, Task.owner_id == owner_id).returning(Task)
+
+    prior = build_prior_values(task_id, owner_id).subquery("prior")
+    return stmt.where(Task.id == prior.c.id).returning(
+        Task,
+        prior.c.status.label("old_status"),
+        prior.c.priority.label("old_priority"),
+        prior.c.is_completed.label("old_is_completed")
+    )
+
+
+def build_owned_tasks(task_ids: List[int], owner_id: int) -> Select:
+    """Lock and load the owned tasks among task_ids, refreshing any loaded copies."""
+    return (
+        select(Task)
+        .where(Task.owner_id == owner_id, Task.id.in_(task_ids))
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+
+
+def build_bulk_update(owner_id: int, changes: Dict[int, Dict[str, Any]]) -> Update:
+    """
+    Build one owner-scoped UPDATE ... RETURNING applying per-task values.
+
+    Each changed column is set with a CASE on the task ID, so tasks that do
+    not change a column keep their current value.
+
+    Args:
+        owner_id: The owner's user ID
+        changes: Mapping of task ID to the column values to set on it
+
+    Returns:
+        Update returning the updated Task objects; "fetch" synchronization
+        refreshes tasks already loaded in the session from the RETURNING rows
+    """
+    columns = {field for values in changes.values() for field in values}
+    assignments = {}
+    for field in sorted(columns):
+        column = Task.__table__.c[field]
+        assignments[field] = case(
+            {
+                task_id: literal(values[field], column.type)
+                for task_id, values in changes.items() if field in values
+            },
+            value=Task.id,
+            else_=column
+        )
+    return (
+        update(Task)
+        .where(Task.owner_id == owner_id, Task.id.in_(list(changes)))
+        .values(**assignments)
+        .returning(Task)
+        .execution_options(synchronize_session="fetch")
+    )
+
+
+def build_owned_delete(task_id: int, owner_id: int) -> Delete:
+    """Build an owner-scoped DELETE returning the fields the counters depend on."""
+    return (
+        delete(Task)
+        .where(Task.id == task_id, Task.owner_id == owner_id)
+        .returning(Task.status, Task.priority, Task.is_completed)
+    )
+
+
+def build_owned_bulk_delete(task_ids: List[int], owner_id: int) -> Delete:
+    """Build an owner-scoped multi-row DELETE returning IDs and counter fields."""
+    return (
+        delete(Task)
+        .where(Task.owner_id == owner_id, Task.id.in_(task_ids))
+        .returning(Task.id, Task.status, Task.priority, Task.is_completed)
+    )
+
+
+def update_values(task_update: TaskUpdate) -> Dict[str, Any]:
+    """Column values for the fields set on an update; status drives is_completed."""
+    # Only TaskUpdate's own fields; a bulk item's id selects the task, it is not a change
+    values = task_update.model_dump(exclude_unset=True, include=set(TaskUpdate.model_fields))
+    if "status" in values:
+        values["is_completed"] = (values["status"] == TaskStatus.DONE)
+    return values
+
+
+def incomplete_values() -> Dict[str, Any]:
+    """SET values for marking a task incomplete; DONE tasks fall back to TODO."""
+    return {
+        "is_completed": False,
+        "status": case(
+            (Task.status == TaskStatus.DONE, literal(TaskStatus.TODO, Task.status.type)),
+            else_=Task.status
+        ),
+    }
 
 
 class TaskRepository:
@@ -21,7 +433,23 @@ class TaskRepository:
             db: SQLAlchemy database session
         """
         self.db = db
+        self.counters = TaskCounterRepository(db)
+    
+    @staticmethod
+    def _counter_deltas(task: Task, sign: int = 1) -> Dict[str, int]:
+        """
+        Counter changes contributed by a task in its current state.
+        
+        Args:
+            task: The task
+            sign: 1 when the task is added, -1 when it is removed
+        
+        Returns:
+            Mapping of counter field to delta
+        """
+        return counter_deltas(task.status, task.priority, task.is_completed, sign)
     
+    @replica_read
     def get_by_id(self, task_id: int, owner_id: int) -> Optional[Task]:
         """
         Get a task by ID for a specific user.
@@ -38,119 +466,154 @@ class TaskRepository:
             Task.owner_id == owner_id
         ).first()
     
-    def get_all(self, owner_id: int, skip: int = 0, limit: int = 100) -> List[Task]:
+    @replica_read
+    def get_columns_by_id(self, task_id: int, owner_id: int, columns: List[str]) -> Optional[Row]:
         """
-        Get all tasks for a specific user with pagination.
+        Get some columns of a task by ID for a specific user.
         
         Args:
+            task_id: The task's ID
             owner_id: The owner's user ID
-            skip: Number of records to skip
-            limit: Maximum number of records to return
+            columns: Task columns to select
             
         Returns:
-            List of Task objects
+            Row of the columns if found and owned by user, None otherwise
         """
-        return self.db.query(Task).filter(
-            Task.owner_id == owner_id
-        ).order_by(Task.created_at.desc()).offset(skip).limit(limit).all()
+        return self.db.execute(build_owned_columns(task_id, owner_id, columns)).first()
     
-    def get_by_status(
+    @replica_read
+    def get_filtered(
         self,
         owner_id: int,
-        status: TaskStatus,
+        filters: TaskFilter,
         skip: int = 0,
-        limit: int = 100
-    ) -> List[Task]:
+        limit: int = 100,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        columns: Optional[List[str]] = None
+    ) -> Tuple[List[Any], int]:
         """
-        Get tasks by status for a specific user.
+        Get a filtered, sorted page of tasks and the matching total in one query.
         
         Args:
             owner_id: The owner's user ID
-            status: Task status to filter by
+            filters: Task filters and ordering
             skip: Number of records to skip
             limit: Maximum number of records to return
+            cursor: Optional (created_at, id) keyset position to continue after
+            columns: Optional task columns to fetch instead of whole tasks
             
         Returns:
-            List of Task objects with the specified status
+            Tuple of (tasks, total number of matching tasks); with columns,
+            the tasks are rows of just those columns
         """
-        return self.db.query(Task).filter(
-            Task.owner_id == owner_id,
-            Task.status == status
-        ).order_by(Task.created_at.desc()).offset(skip).limit(limit).all()
+        rows = self.db.execute(build_list_query(owner_id, filters, skip, limit, cursor, columns)).all()
+        if rows:
+            tasks = rows if columns is not None else [row.Task for row in rows]
+            return tasks, rows[0].total
+        
+        # An empty page past the end carries no total; count separately
+        if skip == 0 and cursor is None:
+            return [], 0
+        return [], self.db.scalar(build_count_query(owner_id, filters))
     
-    def get_by_priority(
+    @replica_read
+    def stream_all(self, owner_id: int, batch_size: int) -> Result:
+        """
+        Stream every task of a user from a server-side cursor.
+        
+        The query runs before this returns, so it is routed like any other
+        read; rows are then fetched batch_size at a time as the result is consumed.
+        
+        Args:
+            owner_id: The owner's user ID
+            batch_size: Rows fetched per round trip
+            
+        Returns:
+            Result whose partitions() yield lists of at most batch_size rows
+        """
+        return self.db.execute(build_export_query(owner_id, batch_size))
+    
+    @replica_read
+    def get_due(
         self,
         owner_id: int,
-        priority: TaskPriority,
-        skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        due_after: Optional[datetime] = None,
+        due_before: Optional[datetime] = None,
+        cursor: Optional[Tuple[datetime, int]] = None
     ) -> List[Task]:
         """
-        Get tasks by priority for a specific user.
+        Get a page of a user's incomplete tasks with a due date, soonest first.
         
         Args:
             owner_id: The owner's user ID
-            priority: Task priority to filter by
-            skip: Number of records to skip
             limit: Maximum number of records to return
+            due_after: Optional lower bound (inclusive) on due_date
+            due_before: Optional upper bound (exclusive) on due_date
+            cursor: Optional (due_date, id) keyset position to continue after
             
         Returns:
-            List of Task objects with the specified priority
+            List of tasks
         """
-        return self.db.query(Task).filter(
-            Task.owner_id == owner_id,
-            Task.priority == priority
-        ).order_by(Task.created_at.desc()).offset(skip).limit(limit).all()
+        return list(self.db.scalars(build_due_query(owner_id, limit, due_after, due_before, cursor)))
     
-    def count(self, owner_id: int) -> int:
+    @replica_read
+    def search(
+        self,
+        owner_id: int,
+        q: str,
+        limit: int = 20,
+        cursor: Optional[Tuple[float, int]] = None
+    ) -> List[Row]:
         """
-        Count total tasks for a specific user.
+        Get a page of a user's tasks matching a text query, best match first.
         
         Args:
             owner_id: The owner's user ID
+            q: Search text
+            limit: Maximum number of records to return
+            cursor: Optional (rank, id) keyset position to continue after
             
         Returns:
-            Total number of tasks
+            Rows of (Task, rank)
         """
-        return self.db.query(func.count(Task.id)).filter(
-            Task.owner_id == owner_id
-        ).scalar()
+        dialect_name = self.db.get_bind().dialect.name
+        return self.db.execute(build_search_query(dialect_name, owner_id, q, limit, cursor)).all()
     
-    def count_by_status(self, owner_id: int, status: TaskStatus) -> int:
+    @replica_read
+    def get_stats(self, owner_id: int) -> Dict[str, int]:
         """
-        Count tasks by status for a specific user.
+        Get all task counts for a specific user from the counters table.
         
         Args:
             owner_id: The owner's user ID
-            status: Task status to count
             
         Returns:
-            Number of tasks with the specified status
+            Dictionary with total, todo, in_progress, done, completed,
+            high_priority, medium_priority and low_priority counts
         """
-        return self.db.query(func.count(Task.id)).filter(
-            Task.owner_id == owner_id,
-            Task.status == status
-        ).scalar()
+        return self.counters.get_counts(owner_id)
     
-    def count_completed(self, owner_id: int) -> int:
+    @primary_read
+    def get_version(self, owner_id: int) -> int:
         """
-        Count completed tasks for a specific user.
+        Get the version of a specific user's tasks, for ETags.
         
         Args:
             owner_id: The owner's user ID
             
         Returns:
-            Number of completed tasks
+            Number incremented by every write to the user's tasks
         """
-        return self.db.query(func.count(Task.id)).filter(
-            Task.owner_id == owner_id,
-            Task.is_completed == True
-        ).scalar()
+        return self.counters.get_version(owner_id)
     
+    @primary_write
     def create(self, task_create: TaskCreate, owner_id: int) -> Task:
         """
         Create a new task for a specific user.
         
+        Uses INSERT ... RETURNING so server defaults come back without a refresh.
+        
         Args:
             task_create: Task creation schema with task data
             owner_id: The owner's user ID
@@ -158,22 +621,49 @@ class TaskRepository:
         Returns:
             Created Task object
         """
-        db_task = Task(
-            title=task_create.title,
-            description=task_create.description,
-            status=task_create.status,
-            priority=task_create.priority,
-            due_date=task_create.due_date,
-            owner_id=owner_id,
-            is_completed=(task_create.status == TaskStatus.DONE)
-        )
+        db_task = self.db.scalars(build_insert(task_create, owner_id)).one()
+        self.counters.increment(owner_id, self._counter_deltas(db_task))
         
-        self.db.add(db_task)
+        # Detach so the commit does not expire the returned state
+        self.db.expunge(db_task)
         self.db.commit()
-        self.db.refresh(db_task)
+        owner_versions.bump(owner_id)
+        return db_task
+    
+    def _update_owned(self, task_id: int, owner_id: int, values: Dict[str, Any]) -> Optional[Task]:
+        """
+        Update an owned task with UPDATE ... RETURNING and adjust its counters.
+        
+        Args:
+            task_id: The task's ID
+            owner_id: The owner's user ID
+            values: Column values or SQL expressions to set
+            
+        Returns:
+            Updated Task object, None if task not found or not owned by user
+        """
+        if self.db.get_bind().dialect.name in PRIOR_VALUES_RETURNING_DIALECTS:
+            row = self.db.execute(build_owned_update(task_id, owner_id, values, with_prior=True)).first()
+            if row is None:
+                return None
+            before = counter_deltas(row.old_status, row.old_priority, row.old_is_completed, sign=-1)
+        else:
+            prior = self.db.execute(build_prior_values(task_id, owner_id)).first()
+            if prior is None:
+                return None
+            before = counter_deltas(prior.status, prior.priority, prior.is_completed, sign=-1)
+            row = self.db.execute(build_owned_update(task_id, owner_id, values)).one()
+        
+        db_task = row.Task
+        self.counters.increment(owner_id, merge_deltas(before, self._counter_deltas(db_task)))
         
+        # Detach so the commit does not expire the returned state
+        self.db.expunge(db_task)
+        self.db.commit()
+        owner_versions.bump(owner_id)
         return db_task
     
+    @primary_write
     def update(self, task_id: int, task_update: TaskUpdate, owner_id: int) -> Optional[Task]:
         """
         Update a task for a specific user.
@@ -186,24 +676,14 @@ class TaskRepository:
         Returns:
             Updated Task object if successful, None if task not found or not owned by user
         """
-        db_task = self.get_by_id(task_id, owner_id)
-        if not db_task:
-            return None
-        
-        # Update only provided fields
-        update_data = task_update.model_dump(exclude_unset=True)
-        
-        for field, value in update_data.items():
-            setattr(db_task, field, value)
+        # Update only provided fields; status also updates is_completed
+        values = update_values(task_update)
+        if not values:
+            return self.get_by_id(task_id, owner_id)
         
-        # Auto-update is_completed based on status
-        if "status" in update_data:
-            db_task.is_completed = (update_data["status"] == TaskStatus.DONE)
-        
-        self.db.commit()
-        self.db.refresh(db_task)
-        return db_task
+        return self._update_owned(task_id, owner_id, values)
     
+    @primary_write
     def delete(self, task_id: int, owner_id: int) -> bool:
         """
         Delete a task for a specific user.
@@ -215,14 +695,97 @@ class TaskRepository:
         Returns:
             True if deleted successfully, False if task not found or not owned by user
         """
-        db_task = self.get_by_id(task_id, owner_id)
-        if not db_task:
+        row = self.db.execute(build_owned_delete(task_id, owner_id)).first()
+        if row is None:
             return False
         
-        self.db.delete(db_task)
+        self.counters.increment(owner_id, counter_deltas(row.status, row.priority, row.is_completed, sign=-1))
         self.db.commit()
+        owner_versions.bump(owner_id)
         return True
     
+    @primary_write
+    def bulk_create(self, task_creates: List[TaskCreate], owner_id: int) -> List[Task]:
+        """
+        Create several tasks for a specific user in one transaction.
+        
+        Args:
+            task_creates: Task creation schemas, in request order
+            owner_id: The owner's user ID
+            
+        Returns:
+            Created Task objects, in the same order
+        """
+        db_tasks = self.db.scalars(
+            build_bulk_insert(),
+            [insert_values(task_create, owner_id) for task_create in task_creates]
+        ).all()
+        self.counters.increment(owner_id, merge_deltas(*(self._counter_deltas(task) for task in db_tasks)))
+        
+        # Detach so the commit does not expire the returned state
+        for db_task in db_tasks:
+            self.db.expunge(db_task)
+        self.db.commit()
+        owner_versions.bump(owner_id)
+        return list(db_tasks)
+    
+    @primary_write
+    def bulk_update(self, task_updates: Dict[int, TaskUpdate], owner_id: int) -> Dict[int, Task]:
+        """
+        Update several tasks for a specific user with a single UPDATE statement.
+        
+        Args:
+            task_updates: Mapping of task ID to the update for that task
+            owner_id: The owner's user ID
+            
+        Returns:
+            Mapping of task ID to the updated Task, for the tasks owned by the user
+        """
+        db_tasks = {task.id: task for task in self.db.scalars(build_owned_tasks(list(task_updates), owner_id))}
+        changes = {}
+        for task_id in db_tasks:
+            values = update_values(task_updates[task_id])
+            if values:
+                changes[task_id] = values
+        
+        if changes:
+            # Counter deltas must be taken before RETURNING refreshes the tasks
+            before = [self._counter_deltas(db_tasks[task_id], sign=-1) for task_id in changes]
+            updated = self.db.scalars(build_bulk_update(owner_id, changes)).all()
+            after = [self._counter_deltas(task) for task in updated]
+            self.counters.increment(owner_id, merge_deltas(*before, *after))
+        
+        # Detach so the commit does not expire the returned state
+        for db_task in db_tasks.values():
+            self.db.expunge(db_task)
+        self.db.commit()
+        if changes:
+            owner_versions.bump(owner_id)
+        return db_tasks
+    
+    @primary_write
+    def bulk_delete(self, task_ids: List[int], owner_id: int) -> List[int]:
+        """
+        Delete several tasks for a specific user with a single DELETE statement.
+        
+        Args:
+            task_ids: IDs of the tasks to delete
+            owner_id: The owner's user ID
+            
+        Returns:
+            IDs of the tasks that were deleted
+        """
+        rows = self.db.execute(build_owned_bulk_delete(task_ids, owner_id)).all()
+        if rows:
+            self.counters.increment(owner_id, merge_deltas(*(
+                counter_deltas(row.status, row.priority, row.is_completed, sign=-1) for row in rows
+            )))
+        self.db.commit()
+        if rows:
+            owner_versions.bump(owner_id)
+        return [row.id for row in rows]
+    
+    @primary_write
     def mark_as_completed(self, task_id: int, owner_id: int) -> Optional[Task]:
         """
         Mark a task as completed for a specific user.
@@ -234,16 +797,13 @@ class TaskRepository:
         Returns:
             Updated Task object if successful, None if task not found or not owned by user
         """
-        db_task = self.get_by_id(task_id, owner_id)
-        if not db_task:
-            return None
-        
-        db_task.is_completed = True
-        db_task.status = TaskStatus.DONE
-        self.db.commit()
-        self.db.refresh(db_task)
-        return db_task
+        return self._update_owned(
+            task_id,
+            owner_id,
+            {"is_completed": True, "status": TaskStatus.DONE}
+        )
     
+    @primary_write
     def mark_as_incomplete(self, task_id: int, owner_id: int) -> Optional[Task]:
         """
         Mark a task as incomplete for a specific user.
@@ -255,14 +815,4 @@ class TaskRepository:
         Returns:
             Updated Task object if successful, None if task not found or not owned by user
         """
-        db_task = self.get_by_id(task_id, owner_id)
-        if not db_task:
-            return None
-        
-        db_task.is_completed = False
-        if db_task.status == TaskStatus.DONE:
-            db_task.status = TaskStatus.TODO
-        self.db.commit()
-        self.db.refresh(db_task)
-        return db_task
-
+        return self._update_owned(task_id, owner_id, incomplete_values())
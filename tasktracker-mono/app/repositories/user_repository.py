@@ -1,9 +1,11 @@
 from typing import Optional, List
+from sqlalchemy import delete, update
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 from app.core.security import get_password_hash
+from app.core.principal_cache import principal_cache
 
 
 class UserRepository:
@@ -70,19 +72,21 @@ class UserRepository:
         """
         return self.db.query(User).offset(skip).limit(limit).all()
     
-    def create(self, user_create: UserCreate) -> Optional[User]:
+    def create(self, user_create: UserCreate, hashed_password: Optional[str] = None) -> Optional[User]:
         """
         Create a new user.
         
         Args:
             user_create: User creation schema with user data
+            hashed_password: Precomputed password hash; hashed here when omitted
             
         Returns:
             Created User object if successful, None if username/email already exists
         """
         try:
             # Hash the password
-            hashed_password = get_password_hash(user_create.password)
+            if hashed_password is None:
+                hashed_password = get_password_hash(user_create.password)
             
             # Create user object
             db_user = User(
@@ -130,12 +134,30 @@ class UserRepository:
         
         try:
             self.db.commit()
+            principal_cache.invalidate(user_id)
             self.db.refresh(db_user)
             return db_user
         except IntegrityError:
             self.db.rollback()
             return None
     
+    def update_password_hash(self, user_id: int, hashed_password: str) -> bool:
+        """
+        Replace a user's password hash, e.g. after a scheme or cost upgrade.
+        
+        Args:
+            user_id: The user's ID
+            hashed_password: The new password hash
+            
+        Returns:
+            True if updated, False if user not found
+        """
+        result = self.db.execute(
+            update(User).where(User.id == user_id).values(hashed_password=hashed_password)
+        )
+        self.db.commit()
+        return result.rowcount > 0
+    
     def delete(self, user_id: int) -> bool:
         """
         Delete a user.
@@ -146,13 +168,11 @@ class UserRepository:
         Returns:
             True if deleted successfully, False if user not found
         """
-        db_user = self.get_by_id(user_id)
-        if not db_user:
-            return False
-        
-        self.db.delete(db_user)
+        # Single DELETE; tasks and counters go with it via ON DELETE CASCADE
+        result = self.db.execute(delete(User).where(User.id == user_id))
         self.db.commit()
-        return True
+        principal_cache.invalidate(user_id)
+        return result.rowcount > 0
     
     def activate(self, user_id: int) -> Optional[User]:
         """
@@ -170,6 +190,7 @@ class UserRepository:
         
         db_user.is_active = True
         self.db.commit()
+        principal_cache.invalidate(user_id)
         self.db.refresh(db_user)
         return db_user
     
@@ -189,6 +210,7 @@ class UserRepository:
         
         db_user.is_active = False
         self.db.commit()
+        principal_cache.invalidate(user_id)
         self.db.refresh(db_user)
         return db_user
 
@@ -1,5 +1,15 @@
 from app.routers.users import router as auth_router
 from app.routers.tasks import router as task_router
 from app.routers.stats import router as stats_router
+from app.routers.async_users import router as async_auth_router
+from app.routers.async_tasks import router as async_task_router
+from app.routers.async_stats import router as async_stats_router
 
-__all__ = ["auth_router", "task_router", "stats_router"]
+__all__ = [
+    "auth_router",
+    "task_router",
+    "stats_router",
+    "async_auth_router",
+    "async_task_router",
+    "async_stats_router",
+]
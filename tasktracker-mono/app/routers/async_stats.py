@@ -0,0 +1,44 @@
+from fastapi import APIRouter, Depends, Header
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import get_async_db
+from app.core.dependencies import get_current_active_user_async
+from app.core.conditional import etag_headers, etag_matches, not_modified, owner_etag
+from app.core.responses import model_response
+from app.services.async_stats_service import AsyncStatsService
+from app.schemas.stats import StatsResponse
+from app.models.user import User
+
+router = APIRouter(prefix="/stats", tags=["Statistics"])
+
+
+@router.get(
+    "/",
+    response_model=StatsResponse,
+    summary="Get user statistics",
+    description="Get statistics for the authenticated user including total tasks and completion percentage."
+)
+async def get_stats(
+    if_none_match: Optional[str] = Header(None, description="ETag of a cached copy; answered with 304 while it is current"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+) -> StatsResponse:
+    """
+    Get statistics for the authenticated user.
+
+    Args:
+        if_none_match: Optional ETag of the client's cached copy
+        db: Async database session
+        current_user: Authenticated user
+
+    Returns:
+        StatsResponse with aggregated statistics, or 304 Not Modified
+    """
+    stats_service = AsyncStatsService(db)
+    version = await stats_service.get_version(current_user.id)
+    etag = owner_etag(current_user.id, version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    stats = await stats_service.get_user_stats(current_user.id, version)
+
+    return model_response(StatsResponse(**stats), headers=etag_headers(etag))
@@ -0,0 +1,602 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
+from starlette.status import HTTP_400_BAD_REQUEST
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from datetime import datetime, timezone
+from typing import Optional, Union
+from app.core.database import get_async_db, get_async_session_factory
+from app.core.dependencies import get_current_active_user_async
+from app.core.conditional import etag_headers, etag_matches, not_modified, owner_etag
+from app.core.responses import model_response
+from app.services.async_task_service import AsyncTaskService, stream_export
+from app.services.task_service import EXPORT_MEDIA_TYPES
+from app.schemas.task import TASK_FIELDS, TaskCreate, TaskUpdate, TaskOut, PartialTaskOut, TaskListResponse, PartialTaskListResponse, TaskSearchResponse, TaskDueResponse, TaskStats, TaskFilter, TaskSortField, SortOrder, ExportFormat, TaskBulkCreate, TaskBulkUpdate, TaskBulkDelete, TaskBulkResponse
+from app.models.user import User
+from app.models.task import TaskStatus, TaskPriority
+from app.utils.fieldsets import InvalidFieldsError, parse_fields
+from app.utils.pagination import InvalidCursorError
+
+router = APIRouter(prefix="/tasks", tags=["Tasks"])
+
+
+@router.post(
+    "/",
+    response_model=TaskOut,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create a new task",
+    description="Create a new task for the authenticated user."
+)
+async def create_task(
+    task_create: TaskCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+) -> TaskOut:
+    """
+    Create a new task.
+
+    Args:
+        task_create: Task creation data
+        db: Async database session
+        current_user: Authenticated user
+
+    Returns:
+        Created task
+    """
+    task_service = AsyncTaskService(db)
+    task = await task_service.create_task(task_create, current_user.id)
+    return model_response(task, status_code=status.HTTP_201_CREATED)
+
+
+@router.get(
+    "/",
+    response_model=Union[TaskListResponse, PartialTaskListResponse],
+    summary="Get all tasks",
+    description="Get all tasks for the authenticated user with optional filtering and pagination."
+)
+async def get_tasks(
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    status: Optional[TaskStatus] = Query(None, description="Filter by status"),
+    priority: Optional[TaskPriority] = Query(None, description="Filter by priority"),
+    is_completed: Optional[bool] = Query(None, description="Filter by completion status"),
+    due_after: Optional[datetime] = Query(None, description="Only tasks due on or after this time"),
+    due_before: Optional[datetime] = Query(None, description="Only tasks due before this time"),
+    created_after: Optional[datetime] = Query(None, description="Only tasks created on or after this time"),
+    created_before: Optional[datetime] = Query(None, description="Only tasks created before this time"),
+    sort_by: TaskSortField = Query(TaskSortField.CREATED_AT, description="Sort key"),
+    order: SortOrder = Query(SortOrder.DESC, description="Sort direction"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor; takes precedence over skip"),
+    fields: Optional[str] = Query(None, description="Comma-separated task fields to return, e.g. id,title,status; default all"),
+    if_none_match: Optional[str] = Header(None, description="ETag of a cached copy; answered with 304 while it is current"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+) -> Union[TaskListResponse, PartialTaskListResponse]:
+    """
+    Get all tasks for the authenticated user.
+
+    Args:
+        skip: Number of records to skip (pagination)
+        limit: Maximum number of records to return (pagination)
+        status: Optional status filter
+        priority: Optional priority filter
+        is_completed: Optional completion filter
+        due_after: Optional lower bound (inclusive) on due_date
+        due_before: Optional upper bound (exclusive) on due_date
+        created_after: Optional lower bound (inclusive) on created_at
+        created_before: Optional upper bound (exclusive) on created_at
+        sort_by: Sort key
+        order: Sort direction
+        cursor: Optional keyset cursor from a previous page (sort_by=created_at only)
+        fields: Optional sparse fieldset; only these task fields are fetched and returned
+        if_none_match: Optional ETag of the client's cached copy
+        db: Async database session
+        current_user: Authenticated user
+
+    Returns:
+        TaskListResponse with tasks and pagination info, or 304 Not Modified
+
+    Raises:
+        HTTPException: If the cursor is malformed or combined with another sort key,
+            or a requested field is unknown
+    """
+    try:
+        field_names = parse_fields(fields, TASK_FIELDS)
+    except InvalidFieldsError as e:
+        raise HTTPException(
+            status_code=HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    task_service = AsyncTaskService(db)
+    version = await task_service.get_version(current_user.id)
+    etag = owner_etag(current_user.id, version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    try:
+        page = await task_service.get_tasks(
+            owner_id=current_user.id,
+            skip=skip,
+            limit=limit,
+            filters=TaskFilter(
+                status=status,
+                priority=priority,
+                is_completed=is_completed,
+                due_after=due_after,
+                due_before=due_before,
+                created_after=created_after,
+                created_before=created_before,
+                sort_by=sort_by,
+                order=order
+            ),
+            cursor=cursor,
+            version=version,
+            fields=field_names
+        )
+    except InvalidCursorError as e:
+        # "status" is shadowed by the status filter in this handler
+        raise HTTPException(
+            status_code=HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    return model_response(page, headers=etag_headers(etag))
+
+
+@router.get(
+    "/stats",
+    response_model=TaskStats,
+    summary="Get task statistics",
+    description="Get task statistics for the authenticated user."
+)
+async def get_task_stats(
+    if_none_match: Optional[str] = Header(None, description="ETag of a cached copy; answered with 304 while it is current"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+) -> TaskStats:
+    """
+    Get task statistics for the authenticated user.
+
+    Args:
+        db: Async database session
+        current_user: Authenticated user
+
+    Returns:
+        Task statistics, or 304 Not Modified
+    """
+    task_service = AsyncTaskService(db)
+    version = await task_service.get_version(current_user.id)
+    etag = owner_etag(current_user.id, version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    return model_response(await task_service.get_task_stats(current_user.id), headers=etag_headers(etag))
+
+
+@router.get(
+    "/search",
+    response_model=TaskSearchResponse,
+    summary="Search tasks",
+    description="Full-text search over the authenticated user's task titles and descriptions, best match first."
+)
+async def search_tasks(
+    q: str = Query(..., min_length=1, max_length=200, description='Words to find; supports "quoted phrases", or, and -word'),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+) -> TaskSearchResponse:
+    """
+    Search the authenticated user's tasks by title and description.
+
+    Args:
+        q: Search text
+        limit: Maximum number of records to return
+        cursor: Optional cursor from a previous page of the same search
+        db: Async database session
+        current_user: Authenticated user
+
+    Returns:
+        TaskSearchResponse with the best matches first
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    task_service = AsyncTaskService(db)
+    try:
+        page = await task_service.search_tasks(current_user.id, q, limit, cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    return model_response(page)
+
+
+@router.get(
+    "/overdue",
+    response_model=TaskDueResponse,
+    summary="Get overdue tasks",
+    description="Incomplete tasks of the authenticated user whose due date has passed, oldest due date first."
+)
+async def get_overdue_tasks(
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+) -> TaskDueResponse:
+    """
+    Get the authenticated user's incomplete tasks that are past due.
+
+    Args:
+        limit: Maximum number of records to return
+        cursor: Optional cursor from a previous overdue page
+        db: Async database session
+        current_user: Authenticated user
+
+    Returns:
+        TaskDueResponse with the oldest due date first
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    task_service = AsyncTaskService(db)
+    try:
+        page = await task_service.get_overdue_tasks(current_user.id, limit, cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    return model_response(page)
+
+
+@router.get(
+    "/due",
+    response_model=TaskDueResponse,
+    summary="Get tasks by due date",
+    description="Incomplete tasks of the authenticated user due in [after, before), soonest first. after defaults to now."
+)
+async def get_due_tasks(
+    after: Optional[datetime] = Query(None, description="Only tasks due on or after this time; default now"),
+    before: Optional[datetime] = Query(None, description="Only tasks due before this time"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+) -> TaskDueResponse:
+    """
+    Get the authenticated user's incomplete tasks due in a time window.
+
+    Args:
+        after: Optional lower bound on due_date, default now
+        before: Optional upper bound on due_date
+        limit: Maximum number of records to return
+        cursor: Optional cursor from a previous page with the same bounds
+        db: Async database session
+        current_user: Authenticated user
+
+    Returns:
+        TaskDueResponse with the soonest due date first
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    task_service = AsyncTaskService(db)
+    try:
+        page = await task_service.get_due_tasks(current_user.id, after or datetime.now(timezone.utc), before, limit, cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    return model_response(page)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export all tasks",
+    description="Stream every task of the authenticated user as NDJSON or CSV."
+)
+async def export_tasks(
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format", description="Export format"),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_async_session_factory),
+    current_user: User = Depends(get_current_active_user_async)
+) -> StreamingResponse:
+    """
+    Export all tasks of the authenticated user.
+
+    Rows are streamed from a server-side cursor EXPORT_BATCH_SIZE at a
+    time, so memory use does not grow with the number of tasks.
+
+    Args:
+        export_format: ndjson (one task object per line) or csv (header, then one task per record)
+        session_factory: Factory for the export's own database session
+        current_user: Authenticated user
+
+    Returns:
+        The export, streamed as an attachment
+    """
+    return StreamingResponse(
+        stream_export(session_factory, current_user.id, export_format),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="tasks.{export_format.value}"'}
+    )
+
+
+@router.post(
+    "/bulk",
+    response_model=TaskBulkResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create tasks in bulk",
+    description="Create up to BULK_MAX_ITEMS tasks for the authenticated user in one transaction."
+)
+async def bulk_create_tasks(
+    bulk_create: TaskBulkCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+) -> TaskBulkResponse:
+    """
+    Create several tasks.
+
+    Args:
+        bulk_create: Tasks to create
+        db: Async database session
+        current_user: Authenticated user
+
+    Returns:
+        Per-item results with the created tasks
+    """
+    task_service = AsyncTaskService(db)
+    results = await task_service.bulk_create_tasks(bulk_create, current_user.id)
+    return model_response(results, status_code=status.HTTP_201_CREATED)
+
+
+@router.patch(
+    "/bulk",
+    response_model=TaskBulkResponse,
+    summary="Update tasks in bulk",
+    description="Update up to BULK_MAX_ITEMS tasks for the authenticated user in one transaction. "
+                "Set status to done to complete a task."
+)
+async def bulk_update_tasks(
+    bulk_update: TaskBulkUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+) -> TaskBulkResponse:
+    """
+    Update several tasks.
+
+    Args:
+        bulk_update: Per-task updates
+        db: Async database session
+        current_user: Authenticated user
+
+    Returns:
+        Per-item results; missing or repeated task IDs fail individually
+    """
+    task_service = AsyncTaskService(db)
+    results = await task_service.bulk_update_tasks(bulk_update, current_user.id)
+    return model_response(results)
+
+
+@router.delete(
+    "/bulk",
+    response_model=TaskBulkResponse,
+    summary="Delete tasks in bulk",
+    description="Delete up to BULK_MAX_ITEMS tasks for the authenticated user in one transaction."
+)
+async def bulk_delete_tasks(
+    bulk_delete: TaskBulkDelete,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+) -> TaskBulkResponse:
+    """
+    Delete several tasks.
+
+    Args:
+        bulk_delete: IDs of the tasks to delete
+        db: Async database session
+        current_user: Authenticated user
+
+    Returns:
+        Per-item results; missing or repeated task IDs fail individually
+    """
+    task_service = AsyncTaskService(db)
+    results = await task_service.bulk_delete_tasks(bulk_delete, current_user.id)
+    return model_response(results)
+
+
+@router.get(
+    "/{task_id}",
+    response_model=Union[TaskOut, PartialTaskOut],
+    summary="Get task by ID",
+    description="Get a specific task by ID for the authenticated user."
+)
+async def get_task(
+    task_id: int,
+    fields: Optional[str] = Query(None, description="Comma-separated task fields to return, e.g. id,title,status; default all"),
+    if_none_match: Optional[str] = Header(None, description="ETag of a cached copy; answered with 304 while it is current"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+) -> Union[TaskOut, PartialTaskOut]:
+    """
+    Get a task by ID.
+
+    Args:
+        task_id: Task ID
+        fields: Optional sparse fieldset; only these task fields are fetched and returned
+        if_none_match: Optional ETag of the client's cached copy
+        db: Async database session
+        current_user: Authenticated user
+
+    Returns:
+        Task data, or 304 Not Modified
+
+    Raises:
+        HTTPException: If a requested field is unknown, or task not found or not owned by user
+    """
+    try:
+        field_names = parse_fields(fields, TASK_FIELDS)
+    except InvalidFieldsError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    task_service = AsyncTaskService(db)
+    version = await task_service.get_version(current_user.id)
+    etag = owner_etag(current_user.id, version)
+    if etag_matches(if_none_match, etag, wildcard=False):
+        return not_modified(etag)
+    task = await task_service.get_task(task_id, current_user.id, field_names)
+
+    if not task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found"
+        )
+
+    return model_response(task, headers=etag_headers(etag))
+
+
+@router.put(
+    "/{task_id}",
+    response_model=TaskOut,
+    summary="Update task",
+    description="Update a task for the authenticated user."
+)
+async def update_task(
+    task_id: int,
+    task_update: TaskUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+) -> TaskOut:
+    """
+    Update a task.
+
+    Args:
+        task_id: Task ID
+        task_update: Task update data
+        db: Async database session
+        current_user: Authenticated user
+
+    Returns:
+        Updated task
+
+    Raises:
+        HTTPException: If task not found or not owned by user
+    """
+    task_service = AsyncTaskService(db)
+    task = await task_service.update_task(task_id, task_update, current_user.id)
+
+    if not task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found"
+        )
+
+    return model_response(task)
+
+
+@router.delete(
+    "/{task_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Delete task",
+    description="Delete a task for the authenticated user."
+)
+async def delete_task(
+    task_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+) -> None:
+    """
+    Delete a task.
+
+    Args:
+        task_id: Task ID
+        db: Async database session
+        current_user: Authenticated user
+
+    Raises:
+        HTTPException: If task not found or not owned by user
+    """
+    task_service = AsyncTaskService(db)
+    success = await task_service.delete_task(task_id, current_user.id)
+
+    if not success:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found"
+        )
+
+
+@router.patch(
+    "/{task_id}/complete",
+    response_model=TaskOut,
+    summary="Mark task as completed",
+    description="Mark a task as completed for the authenticated user."
+)
+async def mark_task_completed(
+    task_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+) -> TaskOut:
+    """
+    Mark a task as completed.
+
+    Args:
+        task_id: Task ID
+        db: Async database session
+        current_user: Authenticated user
+
+    Returns:
+        Updated task
+
+    Raises:
+        HTTPException: If task not found or not owned by user
+    """
+    task_service = AsyncTaskService(db)
+    task = await task_service.mark_as_completed(task_id, current_user.id)
+
+    if not task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found"
+        )
+
+    return model_response(task)
+
+
+@router.patch(
+    "/{task_id}/incomplete",
+    response_model=TaskOut,
+    summary="Mark task as incomplete",
+    description="Mark a task as incomplete for the authenticated user."
+)
+async def mark_task_incomplete(
+    task_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+) -> TaskOut:
+    """
+    Mark a task as incomplete.
+
+    Args:
+        task_id: Task ID
+        db: Async database session
+        current_user: Authenticated user
+
+    Returns:
+        Updated task
+
+    Raises:
+        HTTPException: If task not found or not owned by user
+    """
+    task_service = AsyncTaskService(db)
+    task = await task_service.mark_as_incomplete(task_id, current_user.id)
+
+    if not task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found"
+        )
+
+    return model_response(task)
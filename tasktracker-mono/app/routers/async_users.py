@@ -0,0 +1,117 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import get_async_db
+from app.core.dependencies import get_current_active_user_async
+from app.services.async_user_service import AsyncAuthService
+from app.schemas.user import UserCreate, UserLogin, UserResponse, Token
+from app.models.user import User
+from app.core.password_hasher import PasswordHasherError
+
+router = APIRouter(prefix="/auth", tags=["Authentication"])
+
+
+@router.post(
+    "/register",
+    response_model=UserResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Register a new user",
+    description="Create a new user account with email, username, and password."
+)
+async def register(
+    user_create: UserCreate,
+    db: AsyncSession = Depends(get_async_db)
+) -> UserResponse:
+    """
+    Register a new user.
+
+    Args:
+        user_create: User registration data (email, username, password, full_name)
+        db: Async database session
+
+    Returns:
+        Created user information (without password)
+
+    Raises:
+        HTTPException: If username or email already exists, or password hashing is saturated
+    """
+    auth_service = AsyncAuthService(db)
+    try:
+        user = await auth_service.register(user_create)
+    except PasswordHasherError as e:
+        raise HTTPException(
+            status_code=e.status_code,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)}
+        )
+
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Username or email already registered"
+        )
+
+    return user
+
+
+@router.post(
+    "/login",
+    response_model=Token,
+    summary="Login user",
+    description="Authenticate user and return access token."
+)
+async def login(
+    user_login: UserLogin,
+    db: AsyncSession = Depends(get_async_db)
+) -> Token:
+    """
+    Login user and generate access token.
+
+    Args:
+        user_login: User login credentials (username, password)
+        db: Async database session
+
+    Returns:
+        Access token for authenticated requests
+
+    Raises:
+        HTTPException: If credentials are invalid, user is inactive, or password hashing is saturated
+    """
+    auth_service = AsyncAuthService(db)
+    try:
+        token = await auth_service.login(user_login)
+    except PasswordHasherError as e:
+        raise HTTPException(
+            status_code=e.status_code,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)}
+        )
+
+    if token is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect username or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return token
+
+
+@router.get(
+    "/me",
+    response_model=UserResponse,
+    summary="Get current user",
+    description="Get information about the currently authenticated user."
+)
+async def get_me(
+    current_user: User = Depends(get_current_active_user_async)
+) -> UserResponse:
+    """
+    Get current authenticated user information.
+
+    Args:
+        current_user: Current authenticated user (from JWT token)
+
+    Returns:
+        Current user information (without password)
+    """
+    return UserResponse.model_validate(current_user)
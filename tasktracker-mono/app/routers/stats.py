@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header
+from typing import Optional
 from sqlalchemy.orm import Session
 from app.core.database import get_db
 from app.core.dependencies import get_current_active_user
+from app.core.conditional import etag_headers, etag_matches, not_modified, owner_etag
+from app.core.responses import model_response
 from app.services.stats_service import StatsService
 from app.schemas.stats import StatsResponse
 from app.models.user import User
@@ -16,6 +19,7 @@ router = APIRouter(prefix="/stats", tags=["Statistics"])
     description="Get statistics for the authenticated user including total tasks and completion percentage."
 )
 def get_stats(
+    if_none_match: Optional[str] = Header(None, description="ETag of a cached copy; answered with 304 while it is current"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ) -> StatsResponse:
@@ -28,14 +32,19 @@ def get_stats(
     - Completion percentage
     
     Args:
+        if_none_match: Optional ETag of the client's cached copy
         db: Database session
         current_user: Authenticated user
         
     Returns:
-        StatsResponse with aggregated statistics
+        StatsResponse with aggregated statistics, or 304 Not Modified
     """
     stats_service = StatsService(db)
-    stats = stats_service.get_user_stats(current_user.id)
+    version = stats_service.get_version(current_user.id)
+    etag = owner_etag(current_user.id, version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    stats = stats_service.get_user_stats(current_user.id, version)
     
-    return StatsResponse(**stats)
+    return model_response(StatsResponse(**stats), headers=etag_headers(etag))
 
@@ -5,6 +5,7 @@ from app.core.dependencies import get_current_active_user
 from app.services.user_service import AuthService
 from app.schemas.user import UserCreate, UserLogin, UserResponse, Token
 from app.models.user import User
+from app.core.password_hasher import PasswordHasherError
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -16,7 +17,7 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
     summary="Register a new user",
     description="Create a new user account with email, username, and password."
 )
-def register(
+async def register(
     user_create: UserCreate,
     db: Session = Depends(get_db)
 ) -> UserResponse:
@@ -31,12 +32,19 @@ def register(
         Created user information (without password)
         
     Raises:
-        HTTPException: If username or email already exists
+        HTTPException: If username or email already exists, or password hashing is saturated
     """
     auth_service = AuthService(db)
     
     # Attempt to register user
-    user = auth_service.register(user_create)
+    try:
+        user = await auth_service.register(user_create)
+    except PasswordHasherError as e:
+        raise HTTPException(
+            status_code=e.status_code,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)}
+        )
     
     if user is None:
         raise HTTPException(
@@ -53,7 +61,7 @@ def register(
     summary="Login user",
     description="Authenticate user and return access token."
 )
-def login(
+async def login(
     user_login: UserLogin,
     db: Session = Depends(get_db)
 ) -> Token:
@@ -68,12 +76,19 @@ def login(
         Access token for authenticated requests
         
     Raises:
-        HTTPException: If credentials are invalid or user is inactive
+        HTTPException: If credentials are invalid, user is inactive, or password hashing is saturated
     """
     auth_service = AuthService(db)
     
     # Attempt to login
-    token = auth_service.login(user_login)
+    try:
+        token = await auth_service.login(user_login)
+    except PasswordHasherError as e:
+        raise HTTPException(
+            status_code=e.status_code,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)}
+        )
     
     if token is None:
         raise HTTPException(
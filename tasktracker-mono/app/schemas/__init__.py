@@ -13,7 +13,17 @@ from app.schemas.task import (
     TaskCreate,
     TaskUpdate,
     TaskOut,
+    TaskOutList,
     TaskListResponse,
+    TaskSortField,
+    SortOrder,
+    TaskFilter,
+    TaskBulkCreate,
+    TaskBulkUpdateItem,
+    TaskBulkUpdate,
+    TaskBulkDelete,
+    TaskBulkItemResult,
+    TaskBulkResponse,
     TaskStats,
 )
 from app.schemas.stats import (
@@ -35,7 +45,17 @@ __all__ = [
     "TaskCreate",
     "TaskUpdate",
     "TaskOut",
+    "TaskOutList",
     "TaskListResponse",
+    "TaskSortField",
+    "SortOrder",
+    "TaskFilter",
+    "TaskBulkCreate",
+    "TaskBulkUpdateItem",
+    "TaskBulkUpdate",
+    "TaskBulkDelete",
+    "TaskBulkItemResult",
+    "TaskBulkResponse",
     "TaskStats",
     # Stats schemas
     "StatsResponse",
@@ -1,6 +1,8 @@
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, RootModel, TypeAdapter
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional
+import enum
+from app.core.config import settings
 from app.models.task import TaskStatus, TaskPriority
 
 
@@ -42,6 +44,10 @@ class TaskOut(TaskBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+# Validates a page of ORM rows in a single pydantic-core call
+TaskOutList = TypeAdapter(List[TaskOut])
+
+
 # Schema for task list response with pagination info
 class TaskListResponse(BaseModel):
     """Schema for paginated task list response."""
@@ -49,6 +55,113 @@ class TaskListResponse(BaseModel):
     total: int
     skip: int
     limit: int
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, null on the last page")
+
+
+class TaskSearchResponse(BaseModel):
+    """Schema for a page of search results, best match first."""
+    tasks: list[TaskOut]
+    limit: int
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, null on the last page")
+
+
+class TaskDueResponse(BaseModel):
+    """Schema for a page of incomplete tasks, soonest due first."""
+    tasks: list[TaskOut]
+    limit: int
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, null on the last page")
+
+
+# Task fields a sparse fieldset (fields=id,title,status) may select, in response order
+TASK_FIELDS = tuple(TaskOut.model_fields)
+
+# Task with only the fields of a sparse fieldset
+PartialTaskOut = RootModel[Dict[str, Any]]
+
+
+class PartialTaskListResponse(BaseModel):
+    """Paginated task list with only the requested fields of each task."""
+    tasks: List[Dict[str, Any]]
+    total: int
+    skip: int
+    limit: int
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, null on the last page")
+
+
+class TaskSortField(str, enum.Enum):
+    CREATED_AT = "created_at"
+    UPDATED_AT = "updated_at"
+    DUE_DATE = "due_date"
+    PRIORITY = "priority"
+    TITLE = "title"
+
+
+class SortOrder(str, enum.Enum):
+    ASC = "asc"
+    DESC = "desc"
+
+
+# Formats of a full task export
+class ExportFormat(str, enum.Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+# Schema for task list filtering and ordering
+class TaskFilter(BaseModel):
+    """Filters for task listing; all provided filters are combined."""
+    status: Optional[TaskStatus] = Field(None, description="Filter by status")
+    priority: Optional[TaskPriority] = Field(None, description="Filter by priority")
+    is_completed: Optional[bool] = Field(None, description="Filter by completion status")
+    due_after: Optional[datetime] = Field(None, description="Due on or after this time")
+    due_before: Optional[datetime] = Field(None, description="Due before this time")
+    created_after: Optional[datetime] = Field(None, description="Created on or after this time")
+    created_before: Optional[datetime] = Field(None, description="Created before this time")
+    sort_by: TaskSortField = Field(default=TaskSortField.CREATED_AT, description="Sort key")
+    order: SortOrder = Field(default=SortOrder.DESC, description="Sort direction")
+
+
+# Schemas for bulk task operations
+class TaskBulkCreate(BaseModel):
+    """Schema for creating several tasks in one request."""
+    items: List[TaskCreate] = Field(
+        ..., min_length=1, max_length=settings.BULK_MAX_ITEMS, description="Tasks to create"
+    )
+
+
+class TaskBulkUpdateItem(TaskUpdate):
+    """Schema for one task in a bulk update; status=done completes the task."""
+    id: int = Field(..., description="ID of the task to update")
+
+
+class TaskBulkUpdate(BaseModel):
+    """Schema for updating several tasks in one request."""
+    items: List[TaskBulkUpdateItem] = Field(
+        ..., min_length=1, max_length=settings.BULK_MAX_ITEMS, description="Task updates"
+    )
+
+
+class TaskBulkDelete(BaseModel):
+    """Schema for deleting several tasks in one request."""
+    ids: List[int] = Field(
+        ..., min_length=1, max_length=settings.BULK_MAX_ITEMS, description="IDs of the tasks to delete"
+    )
+
+
+class TaskBulkItemResult(BaseModel):
+    """Outcome of one item of a bulk request, in request order."""
+    index: int
+    id: Optional[int] = None
+    ok: bool
+    task: Optional[TaskOut] = None
+    error: Optional[str] = None
+
+
+class TaskBulkResponse(BaseModel):
+    """Schema for bulk operation results."""
+    results: List[TaskBulkItemResult]
+    succeeded: int
+    failed: int
 
 
 # Schema for task statistics
@@ -1,5 +1,15 @@
 from app.services.user_service import AuthService
 from app.services.task_service import TaskService
 from app.services.stats_service import StatsService
+from app.services.async_user_service import AsyncAuthService
+from app.services.async_task_service import AsyncTaskService
+from app.services.async_stats_service import AsyncStatsService
 
-__all__ = ["AuthService", "TaskService", "StatsService"]
+__all__ = [
+    "AuthService",
+    "TaskService",
+    "StatsService",
+    "AsyncAuthService",
+    "AsyncTaskService",
+    "AsyncStatsService",
+]
@@ -0,0 +1,50 @@
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.repositories.async_task_repository import AsyncTaskRepository
+from app.services.stats_service import completion_stats, user_stats_cache
+
+
+class AsyncStatsService:
+    """
+    Async service for statistics operations.
+    Mirrors StatsService on top of AsyncTaskRepository.
+    """
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize the service with an async database session.
+
+        Args:
+            db: SQLAlchemy async database session
+        """
+        self.db = db
+        self.task_repository = AsyncTaskRepository(db)
+
+    async def get_version(self, owner_id: int) -> int:
+        """
+        Get the version of a specific user's tasks.
+
+        Args:
+            owner_id: The authenticated user's ID
+
+        Returns:
+            Number incremented by every task write, for ETags
+        """
+        return await self.task_repository.get_version(owner_id)
+
+    async def get_user_stats(self, owner_id: int, version: Optional[int] = None) -> dict:
+        """
+        Get statistics for a specific user.
+
+        Args:
+            owner_id: The authenticated user's ID
+            version: Task version already sent as the ETag; cached stats are
+                only reused if they were computed at or after that version
+
+        Returns:
+            Dictionary with total_tasks and completed_percentage
+        """
+        async def compute() -> dict:
+            return completion_stats(await self.task_repository.get_stats(owner_id))
+
+        return await user_stats_cache.aget_or_compute(owner_id, str(version), compute)
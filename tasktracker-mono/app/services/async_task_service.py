@@ -0,0 +1,425 @@
+from datetime import datetime, timezone
+from typing import AsyncIterator, Dict, List, Optional, Union
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from app.core.config import settings
+from app.repositories.async_task_repository import AsyncTaskRepository
+from app.schemas.task import TaskCreate, TaskUpdate, TaskOut, TaskOutList, TaskListResponse, TaskSearchResponse, TaskDueResponse, PartialTaskOut, PartialTaskListResponse, TaskStats, TaskFilter, TaskSortField, TaskBulkCreate, TaskBulkUpdate, TaskBulkDelete, TaskBulkItemResult, TaskBulkResponse, TASK_FIELDS, ExportFormat
+from app.services.task_service import bulk_response, encode_csv, encode_export_batch, page_columns, partial_task_list_cache, task_list_cache, task_list_params
+from app.utils.pagination import InvalidCursorError, encode_cursor, decode_cursor, encode_search_cursor, decode_search_cursor
+
+
+async def stream_export(
+    session_factory: async_sessionmaker[AsyncSession],
+    owner_id: int,
+    export_format: ExportFormat
+) -> AsyncIterator[bytes]:
+    """Stream every task of a user in its own session; mirrors task_service.stream_export."""
+    async with session_factory() as db:
+        result = await AsyncTaskRepository(db).stream_all(owner_id, settings.EXPORT_BATCH_SIZE)
+        if export_format == ExportFormat.CSV:
+            yield encode_csv([TASK_FIELDS])
+        async for rows in result.partitions():
+            yield encode_export_batch(rows, export_format)
+
+
+class AsyncTaskService:
+    """
+    Async service for task operations.
+    Mirrors TaskService on top of AsyncTaskRepository.
+    All operations are scoped to the authenticated user.
+    """
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize the service with an async database session.
+
+        Args:
+            db: SQLAlchemy async database session
+        """
+        self.db = db
+        self.task_repository = AsyncTaskRepository(db)
+
+    async def create_task(self, task_create: TaskCreate, owner_id: int) -> TaskOut:
+        """
+        Create a new task for the authenticated user.
+
+        Args:
+            task_create: Task creation data
+            owner_id: The authenticated user's ID
+
+        Returns:
+            Created task
+        """
+        db_task = await self.task_repository.create(task_create, owner_id)
+        return TaskOut.model_validate(db_task)
+
+    async def get_task(
+        self,
+        task_id: int,
+        owner_id: int,
+        fields: Optional[List[str]] = None
+    ) -> Optional[Union[TaskOut, PartialTaskOut]]:
+        """
+        Get a task by ID for the authenticated user.
+
+        Args:
+            task_id: The task's ID
+            owner_id: The authenticated user's ID
+            fields: Optional sparse fieldset; only these columns are fetched and returned
+
+        Returns:
+            Task if found and owned by user, None otherwise
+        """
+        if fields is not None:
+            row = await self.task_repository.get_columns_by_id(task_id, owner_id, fields)
+            return PartialTaskOut(row._asdict()) if row else None
+        db_task = await self.task_repository.get_by_id(task_id, owner_id)
+        if not db_task:
+            return None
+        return TaskOut.model_validate(db_task)
+
+    async def get_version(self, owner_id: int) -> int:
+        """
+        Get the version of the authenticated user's tasks.
+
+        Args:
+            owner_id: The authenticated user's ID
+
+        Returns:
+            Number incremented by every task write, for ETags
+        """
+        return await self.task_repository.get_version(owner_id)
+
+    async def get_tasks(
+        self,
+        owner_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[TaskFilter] = None,
+        cursor: Optional[str] = None,
+        version: Optional[int] = None,
+        fields: Optional[List[str]] = None
+    ) -> Union[TaskListResponse, PartialTaskListResponse]:
+        """
+        Get tasks for the authenticated user with optional filtering and sorting.
+
+        Args:
+            owner_id: The authenticated user's ID
+            skip: Number of records to skip (pagination)
+            limit: Maximum number of records to return (pagination)
+            filters: Optional filters and ordering; all provided filters are combined
+            cursor: Optional next_cursor of a previous page; takes precedence over skip
+            version: Task version already sent as the ETag; a cached page is
+                only reused if it was computed at or after that version
+            fields: Optional sparse fieldset; only these columns are fetched and returned
+
+        Returns:
+            TaskListResponse with tasks, the matching total and the next page's cursor;
+            a PartialTaskListResponse for a sparse fieldset
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or used with a non-default sort
+        """
+        filters = filters or TaskFilter()
+        cache = task_list_cache if fields is None else partial_task_list_cache
+        return await cache.aget_or_compute(
+            owner_id,
+            task_list_params(skip, limit, filters, cursor, version, fields),
+            lambda: self._list_tasks(owner_id, skip, limit, filters, cursor, fields)
+        )
+
+    async def _list_tasks(
+        self,
+        owner_id: int,
+        skip: int,
+        limit: int,
+        filters: TaskFilter,
+        cursor: Optional[str],
+        fields: Optional[List[str]] = None
+    ) -> Union[TaskListResponse, PartialTaskListResponse]:
+        """Query a task-list page; get_tasks() without the cache."""
+        keyset = filters.sort_by == TaskSortField.CREATED_AT
+
+        after = decode_cursor(cursor) if cursor else None
+        if after is not None:
+            if not keyset:
+                raise InvalidCursorError("Cursor pagination requires sort_by=created_at")
+            skip = 0
+
+        # Fetch one extra row to know whether another page exists
+        columns = page_columns(fields) if fields is not None else None
+        tasks, total = await self.task_repository.get_filtered(owner_id, filters, skip, limit + 1, after, columns)
+
+        next_cursor = None
+        if len(tasks) > limit:
+            tasks = tasks[:limit]
+            if keyset:
+                next_cursor = encode_cursor(tasks[-1].created_at, tasks[-1].id)
+
+        if fields is not None:
+            return PartialTaskListResponse(
+                tasks=[{name: getattr(row, name) for name in fields} for row in tasks],
+                total=total,
+                skip=skip,
+                limit=limit,
+                next_cursor=next_cursor
+            )
+        return TaskListResponse(
+            tasks=TaskOutList.validate_python(tasks, from_attributes=True),
+            total=total,
+            skip=skip,
+            limit=limit,
+            next_cursor=next_cursor
+        )
+
+    async def search_tasks(
+        self,
+        owner_id: int,
+        q: str,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> TaskSearchResponse:
+        """
+        Search the authenticated user's tasks by title and description.
+
+        Args:
+            owner_id: The authenticated user's ID
+            q: Search text
+            limit: Maximum number of records to return
+            cursor: Optional next_cursor of a previous page of the same search
+
+        Returns:
+            TaskSearchResponse with the best matches first and the next page's cursor
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        after = decode_search_cursor(cursor) if cursor else None
+        # Fetch one extra row to know whether another page exists
+        rows = await self.task_repository.search(owner_id, q, limit + 1, after)
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_search_cursor(rows[-1].rank, rows[-1].Task.id)
+
+        return TaskSearchResponse(
+            tasks=TaskOutList.validate_python([row.Task for row in rows], from_attributes=True),
+            limit=limit,
+            next_cursor=next_cursor
+        )
+
+    async def get_due_tasks(
+        self,
+        owner_id: int,
+        due_after: Optional[datetime] = None,
+        due_before: Optional[datetime] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> TaskDueResponse:
+        """
+        Get the authenticated user's incomplete tasks with a due date, soonest first.
+
+        Args:
+            owner_id: The authenticated user's ID
+            due_after: Optional lower bound (inclusive) on due_date
+            due_before: Optional upper bound (exclusive) on due_date
+            limit: Maximum number of records to return
+            cursor: Optional next_cursor of a previous page with the same bounds
+
+        Returns:
+            TaskDueResponse with the page and the next page's cursor
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        after = decode_cursor(cursor) if cursor else None
+        # Fetch one extra row to know whether another page exists
+        tasks = await self.task_repository.get_due(owner_id, limit + 1, due_after, due_before, after)
+
+        next_cursor = None
+        if len(tasks) > limit:
+            tasks = tasks[:limit]
+            next_cursor = encode_cursor(tasks[-1].due_date, tasks[-1].id)
+
+        return TaskDueResponse(
+            tasks=TaskOutList.validate_python(tasks, from_attributes=True),
+            limit=limit,
+            next_cursor=next_cursor
+        )
+
+    async def get_overdue_tasks(
+        self,
+        owner_id: int,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> TaskDueResponse:
+        """
+        Get the authenticated user's incomplete tasks that are past due, oldest due date first.
+
+        Args:
+            owner_id: The authenticated user's ID
+            limit: Maximum number of records to return
+            cursor: Optional next_cursor of a previous overdue page
+
+        Returns:
+            TaskDueResponse with the page and the next page's cursor
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        return await self.get_due_tasks(owner_id, due_before=datetime.now(timezone.utc), limit=limit, cursor=cursor)
+
+    async def update_task(
+        self,
+        task_id: int,
+        task_update: TaskUpdate,
+        owner_id: int
+    ) -> Optional[TaskOut]:
+        """
+        Update a task for the authenticated user.
+
+        Args:
+            task_id: The task's ID
+            task_update: Task update data
+            owner_id: The authenticated user's ID
+
+        Returns:
+            Updated task if successful, None if task not found or not owned by user
+        """
+        db_task = await self.task_repository.update(task_id, task_update, owner_id)
+        if not db_task:
+            return None
+        return TaskOut.model_validate(db_task)
+
+    async def delete_task(self, task_id: int, owner_id: int) -> bool:
+        """
+        Delete a task for the authenticated user.
+
+        Args:
+            task_id: The task's ID
+            owner_id: The authenticated user's ID
+
+        Returns:
+            True if deleted successfully, False if task not found or not owned by user
+        """
+        return await self.task_repository.delete(task_id, owner_id)
+
+    async def mark_as_completed(self, task_id: int, owner_id: int) -> Optional[TaskOut]:
+        """
+        Mark a task as completed for the authenticated user.
+
+        Args:
+            task_id: The task's ID
+            owner_id: The authenticated user's ID
+
+        Returns:
+            Updated task if successful, None if task not found or not owned by user
+        """
+        db_task = await self.task_repository.mark_as_completed(task_id, owner_id)
+        if not db_task:
+            return None
+        return TaskOut.model_validate(db_task)
+
+    async def mark_as_incomplete(self, task_id: int, owner_id: int) -> Optional[TaskOut]:
+        """
+        Mark a task as incomplete for the authenticated user.
+
+        Args:
+            task_id: The task's ID
+            owner_id: The authenticated user's ID
+
+        Returns:
+            Updated task if successful, None if task not found or not owned by user
+        """
+        db_task = await self.task_repository.mark_as_incomplete(task_id, owner_id)
+        if not db_task:
+            return None
+        return TaskOut.model_validate(db_task)
+
+    async def bulk_create_tasks(self, bulk_create: TaskBulkCreate, owner_id: int) -> TaskBulkResponse:
+        """
+        Create several tasks for the authenticated user in one transaction.
+
+        Args:
+            bulk_create: Tasks to create
+            owner_id: The authenticated user's ID
+
+        Returns:
+            TaskBulkResponse with one result per item, in request order
+        """
+        db_tasks = await self.task_repository.bulk_create(bulk_create.items, owner_id)
+        return bulk_response([
+            TaskBulkItemResult(index=index, id=db_task.id, ok=True, task=TaskOut.model_validate(db_task))
+            for index, db_task in enumerate(db_tasks)
+        ])
+
+    async def bulk_update_tasks(self, bulk_update: TaskBulkUpdate, owner_id: int) -> TaskBulkResponse:
+        """
+        Update several tasks for the authenticated user in one transaction.
+
+        Items for missing, foreign or repeated task IDs fail individually;
+        the remaining items are still applied.
+
+        Args:
+            bulk_update: Per-task updates
+            owner_id: The authenticated user's ID
+
+        Returns:
+            TaskBulkResponse with one result per item, in request order
+        """
+        task_updates: Dict[int, TaskUpdate] = {}
+        for item in bulk_update.items:
+            task_updates.setdefault(item.id, item)
+
+        db_tasks = await self.task_repository.bulk_update(task_updates, owner_id)
+
+        results = []
+        for index, item in enumerate(bulk_update.items):
+            if task_updates[item.id] is not item:
+                results.append(TaskBulkItemResult(index=index, id=item.id, ok=False, error="Duplicate task ID"))
+            elif item.id not in db_tasks:
+                results.append(TaskBulkItemResult(index=index, id=item.id, ok=False, error="Task not found"))
+            else:
+                task = TaskOut.model_validate(db_tasks[item.id])
+                results.append(TaskBulkItemResult(index=index, id=item.id, ok=True, task=task))
+        return bulk_response(results)
+
+    async def bulk_delete_tasks(self, bulk_delete: TaskBulkDelete, owner_id: int) -> TaskBulkResponse:
+        """
+        Delete several tasks for the authenticated user in one transaction.
+
+        Args:
+            bulk_delete: IDs of the tasks to delete
+            owner_id: The authenticated user's ID
+
+        Returns:
+            TaskBulkResponse with one result per ID, in request order
+        """
+        task_ids = list(dict.fromkeys(bulk_delete.ids))
+        deleted = set(await self.task_repository.bulk_delete(task_ids, owner_id))
+
+        results = []
+        seen = set()
+        for index, task_id in enumerate(bulk_delete.ids):
+            if task_id in seen:
+                results.append(TaskBulkItemResult(index=index, id=task_id, ok=False, error="Duplicate task ID"))
+            elif task_id not in deleted:
+                results.append(TaskBulkItemResult(index=index, id=task_id, ok=False, error="Task not found"))
+            else:
+                results.append(TaskBulkItemResult(index=index, id=task_id, ok=True))
+            seen.add(task_id)
+        return bulk_response(results)
+
+    async def get_task_stats(self, owner_id: int) -> TaskStats:
+        """
+        Get task statistics for the authenticated user.
+
+        Args:
+            owner_id: The authenticated user's ID
+
+        Returns:
+            TaskStats with counts by status and priority
+        """
+        # All counts come from the owner's task_counters row, kept current on every write
+        return TaskStats(**await self.task_repository.get_stats(owner_id))
@@ -0,0 +1,97 @@
+from typing import Optional
+from datetime import timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.repositories.async_user_repository import AsyncUserRepository
+from app.schemas.user import UserCreate, UserLogin, UserResponse, Token
+from app.core.password_hasher import password_hasher
+from app.core.security import create_access_token
+from app.core.config import settings
+
+
+class AsyncAuthService:
+    """
+    Async service for authentication operations.
+    Mirrors AuthService on top of AsyncUserRepository.
+    """
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize the service with an async database session.
+
+        Args:
+            db: SQLAlchemy async database session
+        """
+        self.db = db
+        self.user_repository = AsyncUserRepository(db)
+
+    async def register(self, user_create: UserCreate) -> Optional[UserResponse]:
+        """
+        Register a new user.
+
+        Args:
+            user_create: User registration data
+
+        Returns:
+            UserResponse if registration successful, None if username/email already exists
+        """
+        if await self.user_repository.get_by_email(user_create.email):
+            return None
+
+        if await self.user_repository.get_by_username(user_create.username):
+            return None
+
+        db_user = await self.user_repository.create(user_create)
+        if not db_user:
+            return None
+
+        return UserResponse.model_validate(db_user)
+
+    async def login(self, user_login: UserLogin) -> Optional[Token]:
+        """
+        Authenticate a user and generate access token.
+
+        Args:
+            user_login: User login credentials
+
+        Returns:
+            Token object if authentication successful, None otherwise
+        """
+        db_user = await self.user_repository.get_by_username(user_login.username)
+        if not db_user:
+            return None
+
+        if not db_user.is_active:
+            return None
+
+        # Hashing is CPU-bound, keep it off the event loop and the threadpool
+        verified, new_hash = await password_hasher.verify_and_update(user_login.password, db_user.hashed_password)
+        if not verified:
+            return None
+
+        # Upgrade hashes made with an older scheme or cost
+        if new_hash is not None:
+            await self.user_repository.update_password_hash(db_user.id, new_hash)
+
+        access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        access_token = create_access_token(
+            data={"sub": str(db_user.id)},
+            expires_delta=access_token_expires
+        )
+
+        return Token(access_token=access_token, token_type="bearer")
+
+    async def get_user_by_id(self, user_id: int) -> Optional[UserResponse]:
+        """
+        Get user by ID.
+
+        Args:
+            user_id: The user's ID
+
+        Returns:
+            UserResponse if user found, None otherwise
+        """
+        db_user = await self.user_repository.get_by_id(user_id)
+        if not db_user:
+            return None
+
+        return UserResponse.model_validate(db_user)
@@ -1,6 +1,30 @@
+from typing import Optional
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
+from app.core.cache import ResultCache
 from app.repositories.task_repository import TaskRepository
 
+# Per-user statistics, invalidated by every write to the owner's tasks
+user_stats_cache: ResultCache[dict] = ResultCache("user_stats", TypeAdapter(dict))
+
+
+def completion_stats(stats: dict) -> dict:
+    """Derive the stats response from the owner's task counts."""
+    total_tasks = stats["total"]
+    completed_tasks = stats["completed"]
+    
+    # Calculate completion percentage
+    if total_tasks > 0:
+        completed_percentage = round((completed_tasks / total_tasks) * 100, 2)
+    else:
+        completed_percentage = 0.0
+    
+    return {
+        "total_tasks": total_tasks,
+        "completed_tasks": completed_tasks,
+        "completed_percentage": completed_percentage
+    }
+
 
 class StatsService:
     """
@@ -18,31 +42,31 @@ class StatsService:
         self.db = db
         self.task_repository = TaskRepository(db)
     
-    def get_user_stats(self, owner_id: int) -> dict:
+    def get_version(self, owner_id: int) -> int:
+        """
+        Get the version of a specific user's tasks.
+        
+        Args:
+            owner_id: The authenticated user's ID
+            
+        Returns:
+            Number incremented by every task write, for ETags
+        """
+        return self.task_repository.get_version(owner_id)
+    
+    def get_user_stats(self, owner_id: int, version: Optional[int] = None) -> dict:
         """
         Get statistics for a specific user.
         
         Args:
             owner_id: The authenticated user's ID
+            version: Task version already sent as the ETag; cached stats are
+                only reused if they were computed at or after that version
             
         Returns:
             Dictionary with total_tasks and completed_percentage
         """
-        # Get total tasks count
-        total_tasks = self.task_repository.count(owner_id)
-        
-        # Get completed tasks count
-        completed_tasks = self.task_repository.count_completed(owner_id)
-        
-        # Calculate completion percentage
-        if total_tasks > 0:
-            completed_percentage = round((completed_tasks / total_tasks) * 100, 2)
-        else:
-            completed_percentage = 0.0
-        
-        return {
-            "total_tasks": total_tasks,
-            "completed_tasks": completed_tasks,
-            "completed_percentage": completed_percentage
-        }
-
+        # Get total and completed task counts in one query
+        return user_stats_cache.get_or_compute(
+            owner_id, str(version), lambda: completion_stats(self.task_repository.get_stats(owner_id))
+        )
@@ -1,10 +1,12 @@
 from typing import Optional
 from datetime import timedelta
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from app.repositories.user_repository import UserRepository
 from app.schemas.user import UserCreate, UserLogin, UserResponse, Token
 from app.models.user import User
-from app.core.security import verify_password, create_access_token
+from app.core.password_hasher import password_hasher
+from app.core.security import create_access_token
 from app.core.config import settings
 
 
@@ -12,6 +14,9 @@ class AuthService:
     """
     Service for authentication operations.
     Handles business logic for user registration and login.
+    
+    Registration and login are async: database calls run in the threadpool
+    and password hashing runs in the password hasher's process pool.
     """
     
     def __init__(self, db: Session):
@@ -24,7 +29,7 @@ class AuthService:
         self.db = db
         self.user_repository = UserRepository(db)
     
-    def register(self, user_create: UserCreate) -> Optional[UserResponse]:
+    async def register(self, user_create: UserCreate) -> Optional[UserResponse]:
         """
         Register a new user.
         
@@ -33,24 +38,28 @@ class AuthService:
             
         Returns:
             UserResponse if registration successful, None if username/email already exists
+            
+        Raises:
+            PasswordHasherError: If the password hasher is saturated or unavailable
         """
         # Check if email already exists
-        if self.user_repository.get_by_email(user_create.email):
+        if await run_in_threadpool(self.user_repository.get_by_email, user_create.email):
             return None
         
         # Check if username already exists
-        if self.user_repository.get_by_username(user_create.username):
+        if await run_in_threadpool(self.user_repository.get_by_username, user_create.username):
             return None
         
         # Create user
-        db_user = self.user_repository.create(user_create)
+        hashed_password = await password_hasher.hash(user_create.password)
+        db_user = await run_in_threadpool(self.user_repository.create, user_create, hashed_password)
         if not db_user:
             return None
         
         # Return user response (without password)
         return UserResponse.model_validate(db_user)
     
-    def login(self, user_login: UserLogin) -> Optional[Token]:
+    async def login(self, user_login: UserLogin) -> Optional[Token]:
         """
         Authenticate a user and generate access token.
         
@@ -59,20 +68,14 @@ class AuthService:
             
         Returns:
             Token object if authentication successful, None otherwise
+            
+        Raises:
+            PasswordHasherError: If the password hasher is saturated or unavailable
         """
-        # Get user by username
-        db_user = self.user_repository.get_by_username(user_login.username)
+        db_user = await self.authenticate_user(user_login.username, user_login.password)
         if not db_user:
             return None
         
-        # Check if user is active
-        if not db_user.is_active:
-            return None
-        
-        # Verify password
-        if not verify_password(user_login.password, db_user.hashed_password):
-            return None
-        
         # Create access token
         access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = create_access_token(
@@ -82,7 +85,7 @@ class AuthService:
         
         return Token(access_token=access_token, token_type="bearer")
     
-    def authenticate_user(self, username: str, password: str) -> Optional[User]:
+    async def authenticate_user(self, username: str, password: str) -> Optional[User]:
         """
         Authenticate a user by username and password.
         
@@ -92,17 +95,28 @@ class AuthService:
             
         Returns:
             User object if authentication successful, None otherwise
+            
+        Raises:
+            PasswordHasherError: If the password hasher is saturated or unavailable
         """
-        db_user = self.user_repository.get_by_username(username)
+        # Get user by username
+        db_user = await run_in_threadpool(self.user_repository.get_by_username, username)
         if not db_user:
             return None
         
+        # Check if user is active
         if not db_user.is_active:
             return None
         
-        if not verify_password(password, db_user.hashed_password):
+        # Verify password
+        verified, new_hash = await password_hasher.verify_and_update(password, db_user.hashed_password)
+        if not verified:
             return None
         
+        # Upgrade hashes made with an older scheme or cost
+        if new_hash is not None:
+            await run_in_threadpool(self.user_repository.update_password_hash, db_user.id, new_hash)
+        
         return db_user
     
     def get_user_by_id(self, user_id: int) -> Optional[UserResponse]:
@@ -0,0 +1,28 @@
+from typing import List, Optional, Sequence
+
+
+class InvalidFieldsError(ValueError):
+    """Raised when a sparse fieldset names an unknown field."""
+
+
+def parse_fields(fields: Optional[str], allowed: Sequence[str]) -> Optional[List[str]]:
+    """
+    Parse a sparse fieldset such as "id,title,status".
+
+    Args:
+        fields: Comma-separated field names; None or blank selects every field
+        allowed: Selectable field names, in response order
+
+    Returns:
+        The requested names in response order, None for every field
+
+    Raises:
+        InvalidFieldsError: If a name is not in allowed
+    """
+    if fields is None or not fields.strip():
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested.difference(allowed)
+    if unknown:
+        raise InvalidFieldsError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return [name for name in allowed if name in requested]
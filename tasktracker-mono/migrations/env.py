@@ -11,7 +11,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 # Import the Base and all models
 from app.core.database import Base
 from app.core.config import settings
-from app.models import User, Task  # Import all models here
+from app.models import User, Task, TaskCounter  # Import all models here
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,57 @@
+"""Per-owner task counters
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'task_counters',
+        sa.Column('owner_id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('total', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('todo', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('in_progress', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('done', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('completed', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('high_priority', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('medium_priority', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('low_priority', sa.Integer(), nullable=False, server_default='0'),
+        sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('owner_id')
+    )
+
+    # Backfill from existing tasks
+    op.execute("""
+        INSERT INTO task_counters (owner_id, total, todo, in_progress, done, completed,
+                                   high_priority, medium_priority, low_priority)
+        SELECT
+            owner_id,
+            count(*),
+            count(*) FILTER (WHERE status = 'TODO'),
+            count(*) FILTER (WHERE status = 'IN_PROGRESS'),
+            count(*) FILTER (WHERE status = 'DONE'),
+            count(*) FILTER (WHERE is_completed),
+            count(*) FILTER (WHERE priority = 'HIGH'),
+            count(*) FILTER (WHERE priority = 'MEDIUM'),
+            count(*) FILTER (WHERE priority = 'LOW')
+        FROM tasks
+        GROUP BY owner_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('task_counters')
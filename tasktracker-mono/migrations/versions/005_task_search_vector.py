@@ -0,0 +1,60 @@
+"""Full-text search vector and GIN index for tasks
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Title words rank above description words; 'english' must match SEARCH_CONFIG in the repository
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    # Maintained by PostgreSQL on every insert and update. Adding a stored
+    # generated column rewrites the table under an exclusive lock.
+    op.add_column(
+        'tasks',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+            nullable=True
+        )
+    )
+    # btree_gin lets owner_id share the GIN index, so a search only reads
+    # the owner's postings instead of filtering every matching task
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_owner_search',
+            'tasks',
+            ['owner_id', 'search_vector'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tasks_owner_search', table_name='tasks', postgresql_concurrently=True, if_exists=True)
+    op.drop_column('tasks', 'search_vector')
@@ -0,0 +1,39 @@
+"""Partial due-date index for the overdue and due-soon views
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        # Open tasks with a due date only, in (due_date, id) keyset order;
+        # completed and undated tasks never enter the index
+        op.create_index(
+            'ix_tasks_owner_due_incomplete',
+            'tasks',
+            ['owner_id', 'due_date', 'id'],
+            unique=False,
+            postgresql_where=sa.text('is_completed = false AND due_date IS NOT NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tasks_owner_due_incomplete', table_name='tasks', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,80 @@
+import re
+import pytest
+from contextlib import contextmanager
+from typing import Any, List, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.core.cache import owner_versions
+from app.core.principal_cache import principal_cache
+from app.core.timing import current_timing
+from app.core.token_cache import verified_token_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_auth_caches():
+    """Test databases reuse user IDs, so never carry auth state across tests."""
+    principal_cache.clear()
+    verified_token_cache.clear()
+    yield
+    principal_cache.clear()
+    verified_token_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_result_cache():
+    """Owner versions and cached results would otherwise outlive each test's database."""
+    if owner_versions.backend is not None:
+        owner_versions.backend.clear()
+    yield
+    if owner_versions.backend is not None:
+        owner_versions.backend.clear()
+
+
+class QueryRecorder:
+    """Records the SQL statements every engine executes while active, with the request that issued each."""
+
+    def __init__(self):
+        # (request, statement) pairs in execution order
+        self.statements: List[Tuple[str, str]] = []
+
+    def record(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        timing = current_timing.get()
+        request = f"{timing.method} {timing.path}" if timing is not None else "no request"
+        self.statements.append((request, re.sub(r"\s+", " ", statement).strip()))
+
+    def __enter__(self) -> "QueryRecorder":
+        event.listen(Engine, "before_cursor_execute", self.record)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        event.remove(Engine, "before_cursor_execute", self.record)
+
+    def report(self) -> str:
+        """The recorded statements, numbered, one per line."""
+        return "\n".join(
+            f"  {number}. [{request}] {statement}"
+            for number, (request, statement) in enumerate(self.statements, start=1)
+        )
+
+
+@pytest.fixture
+def query_budget():
+    """
+    Assert the SQL statements a block issues stay within a budget.
+
+    Usage:
+        with query_budget(2):
+            client.get("/api/v1/tasks/stats", headers=headers)
+
+    A block over its budget fails the test with the statements it issued.
+    """
+    @contextmanager
+    def budget(max_queries: int):
+        with QueryRecorder() as recorder:
+            yield recorder
+        if len(recorder.statements) > max_queries:
+            pytest.fail(
+                f"{len(recorder.statements)} SQL statements issued, budget {max_queries}:\n{recorder.report()}",
+                pytrace=False
+            )
+    return budget
@@ -0,0 +1,270 @@
+import json
+from datetime import datetime, timedelta, timezone
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+from app.core.config import settings
+from app.core.database import Base, get_async_db, get_async_session_factory
+from app.routers import async_auth_router, async_task_router, async_stats_router
+
+# Test database URLs (use SQLite for testing); the sync engine only manages the schema
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_async.db"
+SQLALCHEMY_ASYNC_DATABASE_URL = "sqlite+aiosqlite:///./test_async.db"
+
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False}
+)
+# NullPool: each TestClient runs its own event loop, so connections must not be reused
+async_engine = create_async_engine(SQLALCHEMY_ASYNC_DATABASE_URL, poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+    class_=AsyncSession,
+)
+
+# Application wired the way app.main wires it when DB_ASYNC is enabled
+app = FastAPI()
+app.include_router(async_auth_router, prefix=settings.API_V1_PREFIX)
+app.include_router(async_task_router, prefix=settings.API_V1_PREFIX)
+app.include_router(async_stats_router, prefix=settings.API_V1_PREFIX)
+
+
+@pytest.fixture(scope="function")
+def client():
+    """Create a test client backed by a fresh async database."""
+    Base.metadata.create_all(bind=engine)
+
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as db:
+            yield db
+
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_async_session_factory] = lambda: TestingAsyncSessionLocal
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="function")
+def auth_headers(client):
+    """Register a user and return authorization headers."""
+    client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "asyncuser@example.com",
+            "username": "asyncuser",
+            "password": "testpass123"
+        }
+    )
+    response = client.post(
+        "/api/v1/auth/login",
+        json={
+            "username": "asyncuser",
+            "password": "testpass123"
+        }
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def test_async_register_duplicate(client, auth_headers):
+    """Test that the async register route rejects duplicate usernames."""
+    response = client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "other@example.com",
+            "username": "asyncuser",
+            "password": "testpass123"
+        }
+    )
+    assert response.status_code == 400
+
+
+def test_async_login_wrong_password(client, auth_headers):
+    """Test that the async login route rejects bad credentials."""
+    response = client.post(
+        "/api/v1/auth/login",
+        json={"username": "asyncuser", "password": "wrongpassword"}
+    )
+    assert response.status_code == 401
+
+
+def test_async_get_me(client, auth_headers):
+    """Test resolving the current user through the async dependency."""
+    response = client.get("/api/v1/auth/me", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["username"] == "asyncuser"
+
+
+def test_async_task_lifecycle(client, auth_headers):
+    """Test create, read, update, complete and delete through async routes."""
+    response = client.post(
+        "/api/v1/tasks/",
+        json={"title": "Async Task", "priority": "high"},
+        headers=auth_headers
+    )
+    assert response.status_code == 201
+    task_id = response.json()["id"]
+
+    response = client.get(f"/api/v1/tasks/{task_id}", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["title"] == "Async Task"
+
+    response = client.put(
+        f"/api/v1/tasks/{task_id}",
+        json={"status": "in_progress"},
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert response.json()["status"] == "in_progress"
+
+    response = client.patch(f"/api/v1/tasks/{task_id}/complete", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["is_completed"] is True
+
+    response = client.patch(f"/api/v1/tasks/{task_id}/incomplete", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["status"] == "todo"
+
+    response = client.delete(f"/api/v1/tasks/{task_id}", headers=auth_headers)
+    assert response.status_code == 204
+
+    response = client.get(f"/api/v1/tasks/{task_id}", headers=auth_headers)
+    assert response.status_code == 404
+
+
+def test_async_list_and_stats(client, auth_headers):
+    """Test listing tasks and reading statistics through async routes."""
+    for i, status in enumerate(["todo", "in_progress", "done"]):
+        client.post(
+            "/api/v1/tasks/",
+            json={"title": f"Task {i}", "status": status},
+            headers=auth_headers
+        )
+
+    response = client.get("/api/v1/tasks/?status=done", headers=auth_headers)
+    assert response.status_code == 200
+    assert len(response.json()["tasks"]) == 1
+
+    response = client.get("/api/v1/tasks/stats", headers=auth_headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 3
+    assert data["done"] == 1
+
+    response = client.get("/api/v1/stats/", headers=auth_headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_tasks"] == 3
+    assert data["completed_tasks"] == 1
+
+
+def test_async_bulk_operations(client, auth_headers):
+    """Test bulk create, update and delete through async routes."""
+    response = client.post(
+        "/api/v1/tasks/bulk",
+        json={"items": [{"title": "Bulk A"}, {"title": "Bulk B", "priority": "low"}]},
+        headers=auth_headers
+    )
+    assert response.status_code == 201
+    first, second = (result["id"] for result in response.json()["results"])
+
+    response = client.patch(
+        "/api/v1/tasks/bulk",
+        json={"items": [{"id": first, "status": "done"}, {"id": 99999, "title": "Missing"}]},
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["succeeded"] == 1
+    assert data["results"][0]["task"]["is_completed"] is True
+    assert data["results"][1]["error"] == "Task not found"
+
+    response = client.request("DELETE", "/api/v1/tasks/bulk", json={"ids": [second]}, headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["succeeded"] == 1
+
+    data = client.get("/api/v1/tasks/stats", headers=auth_headers).json()
+    assert data["total"] == 1
+    assert data["completed"] == 1
+    assert data["low_priority"] == 0
+
+
+def test_async_conditional_requests(client, auth_headers):
+    """Test ETags and 304 responses through async routes."""
+    task_id = client.post("/api/v1/tasks/", json={"title": "Async Task"}, headers=auth_headers).json()["id"]
+
+    for path in ["/api/v1/tasks/", f"/api/v1/tasks/{task_id}", "/api/v1/tasks/stats", "/api/v1/stats/"]:
+        etag = client.get(path, headers=auth_headers).headers["etag"]
+        response = client.get(path, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+
+    response = client.get("/api/v1/tasks/424242", headers={**auth_headers, "If-None-Match": "*"})
+    assert response.status_code == 404
+
+    client.patch(f"/api/v1/tasks/{task_id}/complete", headers=auth_headers)
+    response = client.get("/api/v1/tasks/stats", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["completed"] == 1
+
+
+def test_async_sparse_fieldsets(client, auth_headers):
+    """Test sparse fieldsets through async routes."""
+    task_id = client.post("/api/v1/tasks/", json={"title": "Async Task"}, headers=auth_headers).json()["id"]
+
+    response = client.get("/api/v1/tasks/?fields=id,title", headers=auth_headers)
+    assert response.json()["tasks"] == [{"title": "Async Task", "id": task_id}]
+
+    response = client.get(f"/api/v1/tasks/{task_id}?fields=status", headers=auth_headers)
+    assert response.json() == {"status": "todo"}
+
+    response = client.get("/api/v1/tasks/?fields=nope", headers=auth_headers)
+    assert response.status_code == 400
+
+
+def test_async_export(client, auth_headers):
+    """Test the streamed task export through async routes."""
+    client.post("/api/v1/tasks/bulk", json={"items": [{"title": f"Task {i}"} for i in range(3)]}, headers=auth_headers)
+
+    response = client.get("/api/v1/tasks/export", headers=auth_headers)
+    assert response.status_code == 200
+    assert sorted(json.loads(line)["title"] for line in response.content.splitlines()) == ["Task 0", "Task 1", "Task 2"]
+
+    response = client.get("/api/v1/tasks/export?format=csv", headers=auth_headers)
+    assert response.text.splitlines()[0].startswith("title,description,status")
+    assert len(response.text.splitlines()) == 4
+
+
+def test_async_search(client, auth_headers):
+    """Test task search through async routes."""
+    client.post("/api/v1/tasks/bulk", json={"items": [{"title": "Buy milk"}, {"title": "Walk dog"}]}, headers=auth_headers)
+
+    response = client.get("/api/v1/tasks/search?q=milk", headers=auth_headers)
+    assert response.status_code == 200
+    assert [task["title"] for task in response.json()["tasks"]] == ["Buy milk"]
+
+
+def test_async_due_views(client, auth_headers):
+    """Test the overdue and due-soon views through async routes."""
+    now = datetime.now(timezone.utc)
+    items = [
+        {"title": "Tomorrow", "due_date": (now + timedelta(days=1)).isoformat()},
+        {"title": "Yesterday", "due_date": (now - timedelta(days=1)).isoformat()},
+        {"title": "Next week", "due_date": (now + timedelta(days=7)).isoformat()},
+    ]
+    client.post("/api/v1/tasks/bulk", json={"items": items}, headers=auth_headers)
+
+    response = client.get("/api/v1/tasks/overdue", headers=auth_headers)
+    assert [task["title"] for task in response.json()["tasks"]] == ["Yesterday"]
+
+    response = client.get("/api/v1/tasks/due", params={"limit": 1}, headers=auth_headers)
+    data = response.json()
+    assert [task["title"] for task in data["tasks"]] == ["Tomorrow"]
+    response = client.get("/api/v1/tasks/due", params={"limit": 1, "cursor": data["next_cursor"]}, headers=auth_headers)
+    assert [task["title"] for task in response.json()["tasks"]] == ["Next week"]
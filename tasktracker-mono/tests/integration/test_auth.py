@@ -4,6 +4,11 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from app.main import app
 from app.core.database import Base, get_db
+from app.core.password_hasher import password_hasher
+from app.core.principal_cache import principal_cache
+from app.core.token_cache import verified_token_cache
+from app.core.security import create_password_context, pwd_context
+from app.repositories.user_repository import UserRepository
 
 # Test database URL (use SQLite for testing)
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
@@ -163,3 +168,150 @@ def test_get_current_user_unauthorized(client):
     response = client.get("/api/v1/auth/me")
     assert response.status_code == 401
 
+
+
+def test_principal_cache_serves_repeat_requests(client, db):
+    """Test that repeat requests skip the user lookup until the user changes."""
+    client.post(
+        "/api/v1/auth/register",
+        json={"email": "cached@example.com", "username": "cached", "password": "testpass123"}
+    )
+    token = client.post(
+        "/api/v1/auth/login",
+        json={"username": "cached", "password": "testpass123"}
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    
+    hits, misses = principal_cache.hits, principal_cache.misses
+    first = client.get("/api/v1/auth/me", headers=headers)
+    second = client.get("/api/v1/auth/me", headers=headers)
+    assert first.json() == second.json()
+    assert principal_cache.misses == misses + 1
+    assert principal_cache.hits == hits + 1
+    
+    # Deactivation must take effect on the next request
+    UserRepository(db).deactivate(first.json()["id"])
+    response = client.get("/api/v1/tasks/", headers=headers)
+    assert response.status_code == 403
+    assert principal_cache.misses == misses + 2
+    
+    metrics = client.get("/metrics").text
+    assert f"principal_cache_hits_total {principal_cache.hits}" in metrics
+    assert f"principal_cache_misses_total {principal_cache.misses}" in metrics
+
+
+def test_verified_token_cache(client):
+    """Test that a token is verified once and tampered tokens are still rejected."""
+    client.post(
+        "/api/v1/auth/register",
+        json={"email": "tokens@example.com", "username": "tokens", "password": "testpass123"}
+    )
+    token = client.post(
+        "/api/v1/auth/login",
+        json={"username": "tokens", "password": "testpass123"}
+    ).json()["access_token"]
+    
+    hits, misses = verified_token_cache.hits, verified_token_cache.misses
+    for _ in range(3):
+        assert client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {token}"}).status_code == 200
+    assert verified_token_cache.misses == misses + 1
+    assert verified_token_cache.hits == hits + 2
+    
+    tampered = token[:-2] + ("AA" if token[-2:] != "AA" else "BB")
+    response = client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {tampered}"})
+    assert response.status_code == 401
+
+
+def test_password_hasher_rejects_when_saturated(client, monkeypatch):
+    """Test that a full hash queue returns 429 with Retry-After and is counted."""
+    response = client.post(
+        "/api/v1/auth/register",
+        json={"email": "hasher@example.com", "username": "hasher", "password": "testpass123"}
+    )
+    assert response.status_code == 201
+    
+    rejected = password_hasher.rejected
+    monkeypatch.setattr(password_hasher, "max_pending", 0)
+    response = client.post(
+        "/api/v1/auth/login",
+        json={"username": "hasher", "password": "testpass123"}
+    )
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == str(password_hasher.retry_after)
+    assert password_hasher.rejected == rejected + 1
+    
+    monkeypatch.setattr(password_hasher, "max_pending", 64)
+    response = client.post(
+        "/api/v1/auth/login",
+        json={"username": "hasher", "password": "testpass123"}
+    )
+    assert response.status_code == 200
+    
+    metrics = client.get("/metrics").text
+    assert f"password_hash_rejected_total {password_hasher.rejected}" in metrics
+    assert "password_hash_queue_depth 0" in metrics
+    assert 'password_verify_seconds_bucket{le="+Inf"}' in metrics
+
+
+def test_login_upgrades_outdated_password_hash(client, db):
+    """Test that a successful login rehashes a password stored with an outdated cost."""
+    response = client.post(
+        "/api/v1/auth/register",
+        json={"email": "rehash@example.com", "username": "rehash", "password": "testpass123"}
+    )
+    user_id = response.json()["id"]
+    
+    legacy_context = create_password_context("bcrypt", 4, 3, 65536, 4)
+    legacy_hash = legacy_context.hash("testpass123")
+    assert pwd_context.needs_update(legacy_hash)
+    UserRepository(db).update_password_hash(user_id, legacy_hash)
+    
+    response = client.post(
+        "/api/v1/auth/login",
+        json={"username": "rehash", "password": "testpass123"}
+    )
+    assert response.status_code == 200
+    
+    db.expire_all()
+    upgraded_hash = UserRepository(db).get_by_id(user_id).hashed_password
+    assert upgraded_hash != legacy_hash
+    assert not pwd_context.needs_update(upgraded_hash)
+    
+    # The upgraded hash still accepts the password
+    response = client.post(
+        "/api/v1/auth/login",
+        json={"username": "rehash", "password": "testpass123"}
+    )
+    assert response.status_code == 200
+
+
+def test_auth_endpoint_query_budgets(client, query_budget):
+    """Test that each auth endpoint answers as expected within its SQL statement budget."""
+    user = {"email": "budget@example.com", "username": "budget", "password": "testpass123"}
+    with query_budget(4):
+        response = client.post("/api/v1/auth/register", json=user)
+    assert response.status_code == 201
+    assert response.json()["username"] == "budget"
+    
+    with query_budget(1):
+        response = client.post("/api/v1/auth/register", json=user)
+    assert response.status_code == 400
+    
+    with query_budget(1):
+        response = client.post(
+            "/api/v1/auth/login",
+            json={"username": "budget", "password": "testpass123"}
+        )
+    assert response.status_code == 200
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    
+    with query_budget(1):
+        response = client.get("/api/v1/auth/me", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["username"] == "budget"
+    
+    # Served from the principal cache
+    with query_budget(0):
+        response = client.get("/api/v1/auth/me", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["username"] == "budget"
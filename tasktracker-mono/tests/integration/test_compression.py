@@ -0,0 +1,130 @@
+import asyncio
+import zlib
+import brotli
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.main import app
+from app.core.compression import CompressionMiddleware, negotiate
+from app.core.database import Base, get_db
+
+# Test database URL (use SQLite for testing)
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_compression.db"
+
+# Create test engine
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False}
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db():
+    """Create a fresh database for each test."""
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="function")
+def client(db):
+    """Create a test client with database dependency override."""
+    def override_get_db():
+        try:
+            yield db
+        finally:
+            pass
+
+    app.dependency_overrides[get_db] = override_get_db
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="function")
+def headers(client):
+    """Register a user with a page of tasks well over the compression threshold."""
+    credentials = {"username": "gzipuser", "password": "testpass123"}
+    client.post("/api/v1/auth/register", json={"email": "gzipuser@example.com", **credentials})
+    token = client.post("/api/v1/auth/login", json=credentials).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    items = [{"title": f"Task {i}", "description": "Some details about the task"} for i in range(50)]
+    client.post("/api/v1/tasks/bulk", json={"items": items}, headers=headers)
+    return headers
+
+
+def test_negotiate():
+    """Test Accept-Encoding negotiation with q-values and wildcards."""
+    codings = ("br", "gzip")
+    assert negotiate("gzip, deflate, br", codings) == "br"
+    assert negotiate("br;q=0.5, gzip", codings) == "gzip"
+    assert negotiate("deflate", codings) is None
+    assert negotiate("*;q=0.1, br;q=0", codings) == "gzip"
+    assert negotiate("", codings) is None
+
+
+@pytest.mark.parametrize("coding", ["br", "gzip"])
+def test_large_responses_compressed(client, headers, coding):
+    """Test that large responses use the negotiated coding and small ones are sent as is."""
+    plain = client.get("/api/v1/tasks/", headers={**headers, "Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["vary"] == "Accept-Encoding"
+
+    response = client.get("/api/v1/tasks/", headers={**headers, "Accept-Encoding": coding})
+    assert response.headers["content-encoding"] == coding
+    assert int(response.headers["content-length"]) < len(plain.content) / 2
+    assert response.json() == plain.json()
+    # Strong ETags differ per coding
+    assert response.headers["etag"] == plain.headers["etag"][:-1] + f'-{coding}"'
+
+    response = client.get("/health", headers={"Accept-Encoding": coding})
+    assert "content-encoding" not in response.headers
+
+
+def test_compressed_etag_revalidates(client, headers):
+    """Test that a coding-suffixed ETag is answered with a 304 carrying the same tag."""
+    etag = client.get("/api/v1/tasks/", headers={**headers, "Accept-Encoding": "gzip"}).headers["etag"]
+
+    response = client.get("/api/v1/tasks/", headers={**headers, "Accept-Encoding": "gzip", "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+    client.post("/api/v1/tasks/", json={"title": "One more"}, headers=headers)
+    response = client.get("/api/v1/tasks/", headers={**headers, "Accept-Encoding": "gzip", "If-None-Match": etag})
+    assert response.status_code == 200
+    assert len(response.json()["tasks"]) == 51
+
+
+@pytest.mark.parametrize("coding", ["br", "gzip"])
+def test_streamed_chunks_flushed(coding):
+    """Test that each streamed chunk reaches the client compressed before the body ends."""
+    lines = [b'{"id": %d, "title": "Streamed task"}\n' % i for i in range(3)]
+    decoder = brotli.Decompressor() if coding == "br" else zlib.decompressobj(zlib.MAX_WBITS | 16)
+    decode = decoder.process if coding == "br" else decoder.decompress
+    received = []
+
+    async def stream(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/x-ndjson")]})
+        for i, line in enumerate(lines):
+            await send({"type": "http.response.body", "body": line, "more_body": True})
+            assert b"".join(received) == b"".join(lines[:i + 1])
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            assert (b"content-encoding", coding.encode()) in message["headers"]
+        else:
+            received.append(decode(message["body"]))
+
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [(b"accept-encoding", coding.encode())]}
+    asyncio.run(CompressionMiddleware(stream)(scope, receive, send))
+    assert b"".join(received) == b"".join(lines)
@@ -0,0 +1,126 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.main import app
+from app.core.database import Base, get_db
+from app.repositories.task_counter_repository import TaskCounterRepository
+
+# Test database URL (use SQLite for testing)
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_conditional.db"
+
+# Create test engine
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False}
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+ETAGGED_PATHS = ["/api/v1/tasks/", "/api/v1/tasks/stats", "/api/v1/stats/"]
+
+
+@pytest.fixture(scope="function")
+def db():
+    """Create a fresh database for each test."""
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="function")
+def client(db):
+    """Create a test client with database dependency override."""
+    def override_get_db():
+        try:
+            yield db
+        finally:
+            pass
+
+    app.dependency_overrides[get_db] = override_get_db
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+def register(client, username):
+    """Register a user and return authorization headers."""
+    credentials = {"username": username, "password": "testpass123"}
+    client.post("/api/v1/auth/register", json={"email": f"{username}@example.com", **credentials})
+    token = client.post("/api/v1/auth/login", json=credentials).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_matching_etag_answered_with_304(client):
+    """Test that every ETag'd read answers its own ETag with a bodiless 304."""
+    headers = register(client, "etaguser")
+    task_id = client.post("/api/v1/tasks/", json={"title": "First"}, headers=headers).json()["id"]
+
+    for path in ETAGGED_PATHS + [f"/api/v1/tasks/{task_id}"]:
+        response = client.get(path, headers=headers)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert etag.startswith('"')
+        assert response.headers["cache-control"] == "private, no-cache"
+
+        response = client.get(path, headers={**headers, "If-None-Match": f'"stale", W/{etag}'})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+
+
+def test_wildcard_does_not_match_missing_task(client):
+    """Test that If-None-Match: * on a task that does not exist is a 404, not a 304."""
+    headers = register(client, "etaguser")
+    task_id = client.post("/api/v1/tasks/", json={"title": "First"}, headers=headers).json()["id"]
+
+    response = client.get("/api/v1/tasks/424242", headers={**headers, "If-None-Match": "*"})
+    assert response.status_code == 404
+
+    response = client.get(f"/api/v1/tasks/{task_id}", headers={**headers, "If-None-Match": "*"})
+    assert response.status_code == 200
+    assert response.json()["title"] == "First"
+
+    # Collections always exist
+    response = client.get("/api/v1/tasks/", headers={**headers, "If-None-Match": "*"})
+    assert response.status_code == 304
+
+def test_etag_changes_on_every_write(client):
+    """Test that a write the counts do not reflect still changes the owner's ETag."""
+    headers = register(client, "etaguser")
+    task_id = client.post("/api/v1/tasks/", json={"title": "First"}, headers=headers).json()["id"]
+    etag = client.get("/api/v1/tasks/", headers=headers).headers["etag"]
+
+    client.put(f"/api/v1/tasks/{task_id}", json={"title": "Renamed"}, headers=headers)
+    for path in ETAGGED_PATHS:
+        response = client.get(path, headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+    assert response.json()["total_tasks"] == 1
+
+    response = client.get("/api/v1/tasks/", headers={**headers, "If-None-Match": etag})
+    assert response.json()["tasks"][0]["title"] == "Renamed"
+
+    # Another user's copy never validates
+    other = register(client, "otheruser")
+    response = client.get("/api/v1/tasks/", headers={**other, "If-None-Match": response.headers["etag"]})
+    assert response.status_code == 200
+    assert response.json()["tasks"] == []
+
+
+def test_counter_rebuild_changes_etag(client, db):
+    """Test that rebuilding the counters advances the version instead of resetting it."""
+    headers = register(client, "etaguser")
+    client.post("/api/v1/tasks/", json={"title": "First"}, headers=headers)
+    etag = client.get("/api/v1/tasks/stats", headers=headers).headers["etag"]
+
+    TaskCounterRepository(db).rebuild()
+
+    response = client.get("/api/v1/tasks/stats", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["total"] == 1
@@ -0,0 +1,110 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.main import app
+from app.core.database import Base, get_db
+from app.models.task import Task, TaskStatus
+
+# Test database URL (use SQLite for testing)
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_due_views.db"
+
+# Create test engine
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False}
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db():
+    """Create a fresh database for each test."""
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="function")
+def client(db):
+    """Create a test client with database dependency override."""
+    def override_get_db():
+        try:
+            yield db
+        finally:
+            pass
+
+    app.dependency_overrides[get_db] = override_get_db
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+def register(client, username):
+    """Register and log in a user, returning auth headers and the user ID."""
+    credentials = {"username": username, "password": "testpass123"}
+    client.post("/api/v1/auth/register", json={"email": f"{username}@example.com", **credentials})
+    token = client.post("/api/v1/auth/login", json=credentials).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    return headers, client.get("/api/v1/auth/me", headers=headers).json()["id"]
+
+
+@pytest.fixture(scope="function")
+def headers(client, db):
+    """A user with open tasks due from three days ago to in three days, plus tasks the views skip."""
+    headers, owner_id = register(client, "dueuser")
+    _, other_id = register(client, "otherdueuser")
+    now = datetime.now(timezone.utc)
+    for days in [2, -1, 3, -3, 1, -2]:
+        db.add(Task(title=f"Due {days:+d}", owner_id=owner_id, due_date=now + timedelta(days=days)))
+    db.add(Task(title="Done", owner_id=owner_id, due_date=now - timedelta(days=5), status=TaskStatus.DONE, is_completed=True))
+    db.add(Task(title="Undated", owner_id=owner_id))
+    db.add(Task(title="Not mine", owner_id=other_id, due_date=now - timedelta(days=4)))
+    db.commit()
+    return headers
+
+
+def titles(response):
+    assert response.status_code == 200
+    return [task["title"] for task in response.json()["tasks"]]
+
+
+def test_overdue_tasks(client, headers):
+    """Test that overdue lists only the user's open, past-due tasks, oldest due date first."""
+    assert titles(client.get("/api/v1/tasks/overdue", headers=headers)) == ["Due -3", "Due -2", "Due -1"]
+
+
+def test_due_tasks(client, headers):
+    """Test the due window bounds and that it starts at now by default."""
+    assert titles(client.get("/api/v1/tasks/due", headers=headers)) == ["Due +1", "Due +2", "Due +3"]
+
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    params = {"after": (now - timedelta(days=2, hours=12)).isoformat(), "before": (now + timedelta(days=2, hours=12)).isoformat()}
+    response = client.get("/api/v1/tasks/due", params=params, headers=headers)
+    assert titles(response) == ["Due -2", "Due -1", "Due +1", "Due +2"]
+
+
+def test_due_keyset_pagination(client, headers):
+    """Test that cursor pages walk the due-date order without gaps or repeats."""
+    seen = []
+    cursor = None
+    while True:
+        params = {"after": "2000-01-01T00:00:00", "limit": 4}
+        if cursor:
+            params["cursor"] = cursor
+        data = client.get("/api/v1/tasks/due", params=params, headers=headers).json()
+        assert data["limit"] == 4
+        seen.extend(task["title"] for task in data["tasks"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == ["Due -3", "Due -2", "Due -1", "Due +1", "Due +2", "Due +3"]
+
+    response = client.get("/api/v1/tasks/overdue?cursor=not-a-cursor", headers=headers)
+    assert response.status_code == 400
@@ -0,0 +1,111 @@
+import csv
+import io
+import json
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.main import app
+from app.core.config import settings
+from app.core.database import Base, get_db, get_session_factory
+from app.schemas.task import TASK_FIELDS, ExportFormat
+from app.services.task_service import stream_export
+
+# Test database URL (use SQLite for testing)
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_export.db"
+
+# Create test engine
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False}
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db():
+    """Create a fresh database for each test."""
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="function")
+def client(db, monkeypatch):
+    """Create a test client with database dependency overrides and a small export batch."""
+    def override_get_db():
+        try:
+            yield db
+        finally:
+            pass
+
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 2)
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: TestingSessionLocal
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+def register(client, username, task_count):
+    """Register a user with some tasks and return authorization headers."""
+    credentials = {"username": username, "password": "testpass123"}
+    client.post("/api/v1/auth/register", json={"email": f"{username}@example.com", **credentials})
+    token = client.post("/api/v1/auth/login", json=credentials).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    items = [{"title": f"{username} task {i}", "description": f"Line one, \"quoted\"\nline {i}"} for i in range(task_count)]
+    client.post("/api/v1/tasks/bulk", json={"items": items}, headers=headers)
+    return headers
+
+
+def test_export_ndjson(client):
+    """Test that the NDJSON export holds every task of the user, one object per line."""
+    headers = register(client, "exporter", 5)
+    register(client, "otheruser", 3)
+
+    response = client.get("/api/v1/tasks/export", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["content-disposition"] == 'attachment; filename="tasks.ndjson"'
+
+    lines = response.content.splitlines()
+    tasks = [json.loads(line) for line in lines]
+    assert sorted(task["title"] for task in tasks) == [f"exporter task {i}" for i in range(5)]
+    assert all(tuple(task) == TASK_FIELDS for task in tasks)
+    assert tasks == client.get("/api/v1/tasks/?sort_by=created_at&order=asc", headers=headers).json()["tasks"]
+
+
+def test_export_csv(client):
+    """Test that the CSV export has a header line and round-trips awkward values."""
+    headers = register(client, "exporter", 3)
+
+    response = client.get("/api/v1/tasks/export?format=csv", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/csv; charset=utf-8"
+
+    reader = csv.DictReader(io.StringIO(response.text))
+    assert tuple(reader.fieldnames) == TASK_FIELDS
+    records = list(reader)
+    assert len(records) == 3
+    assert records[0]["description"] == 'Line one, "quoted"\nline 0'
+    assert records[0]["status"] == "todo"
+
+    response = client.get("/api/v1/tasks/export?format=xml", headers=headers)
+    assert response.status_code == 422
+
+
+def test_export_streams_one_chunk_per_batch(client):
+    """Test that rows are encoded batch by batch rather than all at once."""
+    register(client, "exporter", 5)
+    owner_id = 1
+
+    chunks = list(stream_export(TestingSessionLocal, owner_id, ExportFormat.CSV))
+    # Header, then batches of 2, 2 and 1 tasks
+    assert len(chunks) == 4
+    assert [chunk.count(b"exporter task") for chunk in chunks] == [0, 2, 2, 1]
+
+    assert list(stream_export(TestingSessionLocal, 999, ExportFormat.NDJSON)) == []
@@ -0,0 +1,65 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, exc, text
+from sqlalchemy.pool import QueuePool
+from app.main import app
+from app.core.pool_metrics import PoolMetrics
+
+# A one-connection pool, so a second checkout has to wait
+engine = create_engine(
+    "sqlite:///./test_pool.db",
+    poolclass=QueuePool,
+    pool_size=1,
+    max_overflow=0,
+    pool_timeout=0.1,
+    connect_args={"check_same_thread": False}
+)
+
+
+@pytest.fixture(scope="function")
+def pool_metrics():
+    """Telemetry attached to a fresh test pool."""
+    engine.dispose()
+    yield PoolMetrics(engine.pool)
+    engine.dispose()
+
+
+def test_checkouts_and_timeouts(pool_metrics):
+    """Test checked-out counts, wait observations and timeouts of a saturated pool."""
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        assert pool_metrics.checked_out == 1
+
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+
+    assert pool_metrics.checked_out == 0
+    assert pool_metrics.checkouts == 1
+    assert pool_metrics.timeouts == 1
+    assert pool_metrics.connects == 1
+
+    buckets, total, count = pool_metrics.wait_seconds.snapshot()
+    assert count == 2
+    # The timed-out checkout waited the full pool_timeout
+    assert total >= 0.1
+
+
+def test_connection_lifetime(pool_metrics):
+    """Test that closing pooled connections records their lifetime."""
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    assert pool_metrics.lifetime_seconds.snapshot()[2] == 0
+
+    engine.dispose()
+    assert pool_metrics.lifetime_seconds.snapshot()[2] == 1
+
+
+def test_pool_metrics_exposed():
+    """Test that /metrics reports the application's pool."""
+    with TestClient(app) as client:
+        metrics = client.get("/metrics").text
+    assert "db_pool_size 20" in metrics
+    assert "db_pool_checked_out 0" in metrics
+    assert "# TYPE db_pool_timeouts_total counter" in metrics
+    assert 'db_pool_checkout_wait_seconds_bucket{le="+Inf"}' in metrics
+    assert "db_pool_connection_lifetime_seconds_count" in metrics
@@ -0,0 +1,146 @@
+import pytest
+import threading
+import time
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.database import Base
+from app.core.replicas import REPLICA_ENGINE, ReplicaSet, RoutingSession
+from app.models.task import Task
+from app.repositories.task_repository import TaskRepository
+from app.schemas.task import TaskCreate, TaskFilter
+
+# Two SQLite files stand in for the primary and a streaming replica
+primary_engine = create_engine("sqlite:///./test_primary.db", connect_args={"check_same_thread": False})
+replica_engine = create_engine("sqlite:///./test_replica.db", connect_args={"check_same_thread": False})
+
+OWNER_ID = 1
+
+
+@pytest.fixture(scope="function")
+def replicas():
+    """Create both databases, each holding a task the other lacks."""
+    for engine, title in ((primary_engine, "On primary"), (replica_engine, "On replica")):
+        Base.metadata.create_all(bind=engine)
+        with sessionmaker(bind=engine)() as db:
+            TaskRepository(db).create(TaskCreate(title=title), OWNER_ID)
+    replica_set = ReplicaSet([replica_engine], max_lag_seconds=5.0, check_interval_seconds=0.0)
+    replica_set.check_lag()
+    yield replica_set
+    for engine in (primary_engine, replica_engine):
+        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="function")
+def make_session(replicas):
+    """Session factory routing through the test replica set."""
+    return sessionmaker(class_=RoutingSession, bind=primary_engine, replicas=replicas)
+
+
+def titles(repository):
+    tasks, _ = repository.get_filtered(OWNER_ID, TaskFilter())
+    return [task.title for task in tasks]
+
+
+def test_reads_use_replica_until_session_writes(make_session, replicas):
+    """Test that read-only methods use the replica and a write pins the session to the primary."""
+    with make_session() as db:
+        repository = TaskRepository(db)
+        assert titles(repository) == ["On replica"]
+        assert repository.get_stats(OWNER_ID)["total"] == 1
+
+        # Undecorated queries stay on the primary
+        assert [task.title for task in db.query(Task).all()] == ["On primary"]
+
+        # Read-your-writes: after a write, reads in the session go to the primary
+        repository.create(TaskCreate(title="Written"), OWNER_ID)
+        assert sorted(titles(repository)) == ["On primary", "Written"]
+        assert repository.get_stats(OWNER_ID)["total"] == 2
+
+    with make_session() as db:
+        assert titles(TaskRepository(db)) == ["On replica"]
+    assert replicas.replica_reads == 3
+
+
+def test_session_reads_stay_on_one_replica(make_session, replicas):
+    """Test that a session keeps reading from the replica it started on while others rotate."""
+    replicas.engines.append(create_engine("sqlite:///./test_replica.db", connect_args={"check_same_thread": False}))
+    replicas.check_lag()
+
+    with make_session() as db:
+        repository = TaskRepository(db)
+        repository.get_filtered(OWNER_ID, TaskFilter())
+        first = db.info[REPLICA_ENGINE]
+        repository.get_stats(OWNER_ID)
+        assert db.info[REPLICA_ENGINE] is first
+
+    with make_session() as db:
+        TaskRepository(db).get_filtered(OWNER_ID, TaskFilter())
+        assert db.info[REPLICA_ENGINE] is not first
+    assert replicas.replica_reads == 3
+
+
+def test_versions_read_from_primary(make_session, replicas):
+    """Test that ETag versions come from the primary and keep the session's reads there."""
+    with sessionmaker(bind=primary_engine)() as db:
+        TaskRepository(db).create(TaskCreate(title="Not replicated"), OWNER_ID)
+
+    with make_session() as db:
+        repository = TaskRepository(db)
+        assert repository.get_version(OWNER_ID) == 2
+        assert sorted(titles(repository)) == ["Not replicated", "On primary"]
+    assert replicas.replica_reads == 0
+
+
+def test_unchecked_replicas_not_used(monkeypatch):
+    """Test that reads go to the primary until a replica's lag has been measured."""
+    release = threading.Event()
+
+    def held_lag(engine, timeout_seconds):
+        release.wait(5)
+        return 0.0
+
+    monkeypatch.setattr(ReplicaSet, "measure_lag", staticmethod(held_lag))
+    replicas = ReplicaSet([replica_engine], max_lag_seconds=5.0, check_interval_seconds=3600.0)
+    assert replicas.choose() is None
+    assert replicas.primary_fallbacks == 1
+
+    release.set()
+    replicas.check_lag()
+    assert replicas.choose() is replica_engine
+
+
+def test_lagging_replica_falls_back_to_primary(make_session, replicas, monkeypatch):
+    """Test that replicas beyond the lag limit are skipped unless fallback is disabled."""
+    monkeypatch.setattr(ReplicaSet, "measure_lag", staticmethod(lambda engine, timeout_seconds: 30.0))
+    replicas.check_lag()
+
+    with make_session() as db:
+        assert titles(TaskRepository(db)) == ["On primary"]
+    assert replicas.primary_fallbacks == 1
+    assert replicas.max_lag() == 30.0
+
+    replicas.fallback_to_primary = False
+    with make_session() as db:
+        assert titles(TaskRepository(db)) == ["On replica"]
+
+
+def test_lag_check_does_not_block_reads(make_session, replicas, monkeypatch):
+    """Test that reads use the last measured lags while a slow lag check runs in the background."""
+    release = threading.Event()
+
+    def slow_lag(engine, timeout_seconds):
+        release.wait(5)
+        return 30.0
+
+    monkeypatch.setattr(ReplicaSet, "measure_lag", staticmethod(slow_lag))
+    start = time.monotonic()
+    with make_session() as db:
+        assert titles(TaskRepository(db)) == ["On replica"]
+    assert time.monotonic() - start < 1.0
+
+    release.set()
+    deadline = time.monotonic() + 5
+    while replicas.max_lag() != 30.0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    with make_session() as db:
+        assert titles(TaskRepository(db)) == ["On primary"]
@@ -0,0 +1,108 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import sessionmaker
+from app.main import app
+from app.core.cache import CacheBackend, CacheUnavailableError, owner_versions
+from app.core.database import Base, get_db
+from app.models.task import Task
+from app.services.stats_service import user_stats_cache
+from app.services.task_service import task_list_cache
+
+# Test database URL (use SQLite for testing)
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_cache.db"
+
+# Create test engine
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False}
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+class UnavailableBackend(CacheBackend):
+    """Backend whose server is down."""
+
+    def get(self, key, *args, **kwargs):
+        raise CacheUnavailableError("connection refused")
+
+    set = add = incr = get
+
+
+@pytest.fixture(scope="function")
+def db():
+    """Create a fresh database for each test."""
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="function")
+def client(db):
+    """Create a test client with database dependency override."""
+    def override_get_db():
+        try:
+            yield db
+        finally:
+            pass
+
+    app.dependency_overrides[get_db] = override_get_db
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="function")
+def headers(client):
+    """Register a user and return authorization headers."""
+    credentials = {"username": "cacheuser", "password": "testpass123"}
+    client.post("/api/v1/auth/register", json={"email": "cacheuser@example.com", **credentials})
+    token = client.post("/api/v1/auth/login", json=credentials).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def titles(client, headers):
+    response = client.get("/api/v1/tasks/", headers=headers)
+    assert response.status_code == 200
+    return [task["title"] for task in response.json()["tasks"]]
+
+
+def test_results_cached_until_owner_writes(client, db, headers):
+    """Test that task lists and stats are served from the cache until a task write bumps the owner's version."""
+    client.post("/api/v1/tasks/", json={"title": "First"}, headers=headers)
+    hits = task_list_cache.hits
+    stats_hits = user_stats_cache.hits
+
+    assert titles(client, headers) == ["First"]
+    assert client.get("/api/v1/stats/", headers=headers).json()["total_tasks"] == 1
+
+    # A change bypassing the repository is not seen while the cached results live
+    db.execute(update(Task).values(title="Renamed"))
+    db.commit()
+    assert titles(client, headers) == ["First"]
+    assert client.get("/api/v1/stats/", headers=headers).json()["total_tasks"] == 1
+    assert task_list_cache.hits == hits + 1
+    assert user_stats_cache.hits == stats_hits + 1
+
+    # Any write through the repository invalidates both
+    client.post("/api/v1/tasks/", json={"title": "Second"}, headers=headers)
+    assert sorted(titles(client, headers)) == ["Renamed", "Second"]
+    assert client.get("/api/v1/stats/", headers=headers).json()["total_tasks"] == 2
+    assert task_list_cache.hits == hits + 1
+
+
+def test_unavailable_cache_falls_back_to_database(client, headers, monkeypatch):
+    """Test that requests still succeed, uncached, while the cache backend is down."""
+    monkeypatch.setattr(owner_versions, "backend", UnavailableBackend())
+    errors = task_list_cache.errors
+    invalidation_errors = owner_versions.errors
+
+    assert client.post("/api/v1/tasks/", json={"title": "First"}, headers=headers).status_code == 201
+    assert titles(client, headers) == ["First"]
+    assert titles(client, headers) == ["First"]
+    assert task_list_cache.errors == errors + 2
+    assert owner_versions.errors == invalidation_errors + 1
@@ -0,0 +1,125 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+from app.main import app
+from app.core.database import Base, get_db
+from app.repositories.task_repository import build_search_query
+
+# Test database URL (use SQLite for testing)
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_search.db"
+
+# Create test engine
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False}
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db():
+    """Create a fresh database for each test."""
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="function")
+def client(db):
+    """Create a test client with database dependency override."""
+    def override_get_db():
+        try:
+            yield db
+        finally:
+            pass
+
+    app.dependency_overrides[get_db] = override_get_db
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+def register(client, username, items):
+    """Register a user with some tasks and return authorization headers."""
+    credentials = {"username": username, "password": "testpass123"}
+    client.post("/api/v1/auth/register", json={"email": f"{username}@example.com", **credentials})
+    token = client.post("/api/v1/auth/login", json=credentials).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    client.post("/api/v1/tasks/bulk", json={"items": items}, headers=headers)
+    return headers
+
+
+def titles(response):
+    return [task["title"] for task in response.json()["tasks"]]
+
+
+def test_search_matches_title_and_description(client):
+    """Test that every word must match, in the title or description, and only the owner's tasks."""
+    headers = register(client, "searcher", [
+        {"title": "Buy milk", "description": "From the corner shop"},
+        {"title": "Call the shop", "description": "Ask about MILK delivery"},
+        {"title": "Buy bread"},
+        {"title": "50% discount", "description": "Use the voucher"},
+    ])
+    register(client, "otheruser", [{"title": "Buy milk too"}])
+
+    response = client.get("/api/v1/tasks/search?q=milk", headers=headers)
+    assert response.status_code == 200
+    assert sorted(titles(response)) == ["Buy milk", "Call the shop"]
+
+    response = client.get("/api/v1/tasks/search?q=buy+shop", headers=headers)
+    assert titles(response) == ["Buy milk"]
+
+    # LIKE wildcards in the query are matched literally
+    response = client.get("/api/v1/tasks/search?q=0%25", headers=headers)
+    assert titles(response) == ["50% discount"]
+
+    response = client.get("/api/v1/tasks/search?q=", headers=headers)
+    assert response.status_code == 422
+
+
+def test_search_keyset_pagination(client):
+    """Test walking every search page with keyset cursors."""
+    headers = register(client, "searcher", [{"title": f"Report {i}"} for i in range(5)] + [{"title": "Other"}])
+
+    seen = []
+    cursor = None
+    while True:
+        url = "/api/v1/tasks/search?q=report&limit=2"
+        if cursor:
+            url += f"&cursor={cursor}"
+        data = client.get(url, headers=headers).json()
+        assert len(data["tasks"]) <= 2
+        seen.extend(task["title"] for task in data["tasks"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == [f"Report {i}" for i in reversed(range(5))]
+
+    response = client.get("/api/v1/tasks/search?q=report&cursor=bad", headers=headers)
+    assert response.status_code == 400
+
+
+def test_postgresql_search_uses_vector():
+    """Test that PostgreSQL searches match and rank on search_vector."""
+    sql = str(build_search_query("postgresql", 1, "milk", 20, (0.5, 10)).compile(dialect=postgresql.dialect()))
+    assert "tasks.search_vector @@ websearch_to_tsquery" in sql
+    assert "ts_rank_cd(tasks.search_vector" in sql
+    assert "LIKE" not in sql
+
+
+def test_postgresql_search_rank_in_double_precision():
+    """Test that the rank is selected, ordered and compared with the cursor as double precision."""
+    sql = str(build_search_query("postgresql", 1, "milk", 20, (0.1, 10)).compile(dialect=postgresql.dialect()))
+    rank = "CAST(ts_rank_cd(tasks.search_vector, websearch_to_tsquery(%(websearch_to_tsquery_1)s, %(websearch_to_tsquery_2)s)) AS FLOAT(53))"
+    assert sql.count(rank) == 3
+    assert f"{rank} AS rank" in sql
+    assert f"({rank}, tasks.id) < (" in sql
+    assert f"ORDER BY {rank} DESC, tasks.id DESC" in sql
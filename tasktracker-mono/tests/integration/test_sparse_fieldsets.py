@@ -0,0 +1,136 @@
+import pytest
+from datetime import datetime, timedelta
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from app.main import app
+from app.core.database import Base, get_db
+from app.models.task import Task
+from app.schemas.task import TASK_FIELDS
+
+# Test database URL (use SQLite for testing)
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_fieldsets.db"
+
+# Create test engine
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False}
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db():
+    """Create a fresh database for each test."""
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="function")
+def client(db):
+    """Create a test client with database dependency override."""
+    def override_get_db():
+        try:
+            yield db
+        finally:
+            pass
+
+    app.dependency_overrides[get_db] = override_get_db
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="function")
+def headers(client):
+    """Register a user with three tasks."""
+    credentials = {"username": "fielduser", "password": "testpass123"}
+    client.post("/api/v1/auth/register", json={"email": "fielduser@example.com", **credentials})
+    token = client.post("/api/v1/auth/login", json=credentials).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    items = [{"title": f"Task {i}", "description": f"Details {i}", "priority": "high"} for i in range(3)]
+    client.post("/api/v1/tasks/bulk", json={"items": items}, headers=headers)
+    return headers
+
+
+@pytest.fixture(scope="function")
+def task_selects():
+    """SELECT statements run against the tasks table during the test."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("SELECT") and "FROM tasks" in statement:
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
+
+
+def test_list_returns_only_requested_fields(client, headers, task_selects):
+    """Test that a sparse list page selects and returns only the requested columns."""
+    response = client.get("/api/v1/tasks/?fields=title,priority,id", headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 3
+    # Fields come back in response order whatever the request order
+    assert [list(task) for task in data["tasks"]] == [[name for name in TASK_FIELDS if name in ("id", "title", "priority")]] * 3
+    assert data["tasks"][0]["priority"] == "high"
+
+    page_query = task_selects[-1]
+    assert "tasks.title" in page_query
+    assert "tasks.description" not in page_query
+
+    # The full page is unaffected by the cached sparse one
+    full = client.get("/api/v1/tasks/", headers=headers).json()
+    assert full["tasks"][0]["description"].startswith("Details")
+
+
+def test_get_task_returns_only_requested_fields(client, headers, task_selects):
+    """Test that a sparse task read selects and returns only the requested columns."""
+    task_id = client.get("/api/v1/tasks/", headers=headers).json()["tasks"][0]["id"]
+
+    response = client.get(f"/api/v1/tasks/{task_id}?fields=status,due_date", headers=headers)
+    assert response.status_code == 200
+    assert response.json() == {"status": "todo", "due_date": None}
+    assert "tasks.description" not in task_selects[-1]
+
+    response = client.get("/api/v1/tasks/99999?fields=title", headers=headers)
+    assert response.status_code == 404
+
+
+def test_unknown_field_rejected(client, headers):
+    """Test that an unknown field name is a 400 on both endpoints."""
+    for path in ["/api/v1/tasks/?fields=id,owner_secret", "/api/v1/tasks/1?fields=password"]:
+        response = client.get(path, headers=headers)
+        assert response.status_code == 400
+        assert "Unknown fields" in response.json()["detail"]
+
+
+def test_sparse_cursor_pagination(client, db, headers):
+    """Test that cursor pages work when the fieldset omits the cursor columns."""
+    owner_id = client.get("/api/v1/auth/me", headers=headers).json()["id"]
+    base = datetime(2024, 1, 1, 12, 0, 0)
+    for i, minutes in enumerate([0, 1, 1]):
+        db.add(Task(title=f"Dated {i}", owner_id=owner_id, created_at=base + timedelta(minutes=minutes)))
+    db.commit()
+
+    seen = []
+    cursor = None
+    while True:
+        url = "/api/v1/tasks/?fields=title&limit=2&created_before=2025-01-01T00:00:00"
+        if cursor:
+            url += f"&cursor={cursor}"
+        data = client.get(url, headers=headers).json()
+        assert all(list(task) == ["title"] for task in data["tasks"])
+        seen.extend(task["title"] for task in data["tasks"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == ["Dated 2", "Dated 1", "Dated 0"]
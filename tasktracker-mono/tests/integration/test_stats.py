@@ -301,3 +301,20 @@ def test_stats_response_schema(client, auth_token):
     assert 0.0 <= data["completed_percentage"] <= 100.0
     assert data["completed_tasks"] <= data["total_tasks"]
 
+
+
+def test_stats_query_budget(client, auth_token, query_budget):
+    """Test that the stats endpoint succeeds within its SQL statement budget."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    client.post("/api/v1/tasks/", json={"title": "Budget", "status": "done"}, headers=headers)
+    
+    with query_budget(2):
+        response = client.get("/api/v1/stats/", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["completed_tasks"] == 1
+    
+    # Served from the stats cache
+    with query_budget(1):
+        response = client.get("/api/v1/stats/", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["completed_tasks"] == 1
@@ -1,10 +1,15 @@
 import pytest
+from datetime import datetime, timedelta
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 from app.main import app
+from app.core.config import settings
 from app.core.database import Base, get_db
-from app.models.task import TaskStatus, TaskPriority
+from app.models.task import Task, TaskStatus, TaskPriority
+from app.models.task_counter import TaskCounter
+from app.repositories.task_counter_repository import TaskCounterRepository
+from app.repositories.user_repository import UserRepository
 
 # Test database URL (use SQLite for testing)
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test_tasks.db"
@@ -153,6 +158,72 @@ def test_get_tasks_with_pagination(client, auth_token):
     assert data["limit"] == 2
 
 
+def test_get_tasks_with_cursor(client, db, auth_token):
+    """Test walking every page with keyset cursors."""
+    owner_id = client.get(
+        "/api/v1/auth/me",
+        headers={"Authorization": f"Bearer {auth_token}"}
+    ).json()["id"]
+    
+    # Insert tasks with known timestamps, two of them sharing a created_at
+    base = datetime(2024, 1, 1, 12, 0, 0)
+    for i, minutes in enumerate([0, 1, 2, 2, 3]):
+        db.add(Task(
+            title=f"Task {i+1}",
+            owner_id=owner_id,
+            created_at=base + timedelta(minutes=minutes)
+        ))
+    db.commit()
+    
+    seen = []
+    cursor = None
+    while True:
+        url = "/api/v1/tasks/?limit=2"
+        if cursor:
+            url += f"&cursor={cursor}"
+        response = client.get(url, headers={"Authorization": f"Bearer {auth_token}"})
+        assert response.status_code == 200
+        data = response.json()
+        seen.extend(task["title"] for task in data["tasks"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+    
+    # Newest first, ties broken by id, no task repeated or skipped
+    assert seen == ["Task 5", "Task 4", "Task 3", "Task 2", "Task 1"]
+
+
+def test_get_tasks_with_cursor_default_timestamps(client, auth_token):
+    """Test walking cursor pages over tasks that take created_at from the database default."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    items = [{"title": f"Task {i+1}"} for i in range(5)]
+    client.post("/api/v1/tasks/bulk", json={"items": items}, headers=headers)
+    
+    seen = []
+    cursor = None
+    for _ in range(5):
+        url = "/api/v1/tasks/?limit=2"
+        if cursor:
+            url += f"&cursor={cursor}"
+        data = client.get(url, headers=headers).json()
+        seen.extend(task["title"] for task in data["tasks"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+    
+    assert cursor is None
+    assert sorted(seen) == sorted(item["title"] for item in items)
+
+
+def test_get_tasks_with_invalid_cursor(client, auth_token):
+    """Test that a malformed cursor is rejected."""
+    response = client.get(
+        "/api/v1/tasks/?cursor=not-a-cursor",
+        headers={"Authorization": f"Bearer {auth_token}"}
+    )
+    assert response.status_code == 400
+
+
 def test_get_tasks_by_status(client, auth_token):
     """Test filtering tasks by status."""
     # Create tasks with different statuses
@@ -183,6 +254,93 @@ def test_get_tasks_by_status(client, auth_token):
     assert data["tasks"][0]["status"] == "todo"
 
 
+def test_get_tasks_with_combined_filters(client, auth_token):
+    """Test that filters combine and total counts only matching tasks."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    for status, priority in [("todo", "high"), ("todo", "high"), ("todo", "low"), ("done", "high")]:
+        client.post(
+            "/api/v1/tasks/",
+            json={"title": f"{status} {priority}", "status": status, "priority": priority},
+            headers=headers
+        )
+    
+    response = client.get("/api/v1/tasks/?status=todo&priority=high&limit=1", headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["tasks"]) == 1
+    assert data["total"] == 2
+    assert data["tasks"][0]["status"] == "todo"
+    assert data["tasks"][0]["priority"] == "high"
+    
+    # Single filters are answered from the counters
+    data = client.get("/api/v1/tasks/?is_completed=false", headers=headers).json()
+    assert data["total"] == 3
+    
+    # A page past the end still reports the total
+    data = client.get("/api/v1/tasks/?status=todo&priority=high&skip=10", headers=headers).json()
+    assert data["tasks"] == []
+    assert data["total"] == 2
+
+
+def test_get_tasks_with_date_ranges_and_sort(client, db, auth_token):
+    """Test due/created ranges and non-default sort keys."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    owner_id = client.get("/api/v1/auth/me", headers=headers).json()["id"]
+    
+    base = datetime(2024, 1, 1, 12, 0, 0)
+    for i, (priority, due_days) in enumerate([
+        (TaskPriority.LOW, 1),
+        (TaskPriority.HIGH, 5),
+        (TaskPriority.MEDIUM, 10),
+        (TaskPriority.HIGH, None),
+    ]):
+        db.add(Task(
+            title=f"Task {i+1}",
+            owner_id=owner_id,
+            priority=priority,
+            due_date=base + timedelta(days=due_days) if due_days else None,
+            created_at=base + timedelta(minutes=i)
+        ))
+    db.commit()
+    
+    response = client.get(
+        "/api/v1/tasks/",
+        params={"due_after": (base + timedelta(days=2)).isoformat(), "sort_by": "due_date", "order": "asc"},
+        headers=headers
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [task["title"] for task in data["tasks"]] == ["Task 2", "Task 3"]
+    assert data["total"] == 2
+    assert data["next_cursor"] is None
+    
+    data = client.get(
+        "/api/v1/tasks/",
+        params={"created_before": (base + timedelta(minutes=2)).isoformat()},
+        headers=headers
+    ).json()
+    assert [task["title"] for task in data["tasks"]] == ["Task 2", "Task 1"]
+    
+    # Priority sorts by urgency, ties broken by id
+    data = client.get("/api/v1/tasks/?sort_by=priority", headers=headers).json()
+    assert [task["title"] for task in data["tasks"]] == ["Task 4", "Task 2", "Task 3", "Task 1"]
+
+
+def test_get_tasks_cursor_requires_created_at_sort(client, auth_token):
+    """Test that cursors are rejected for other sort keys."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    for i in range(3):
+        client.post("/api/v1/tasks/", json={"title": f"Task {i}"}, headers=headers)
+    cursor = client.get("/api/v1/tasks/?limit=1", headers=headers).json()["next_cursor"]
+    
+    response = client.get(f"/api/v1/tasks/?cursor={cursor}&sort_by=title", headers=headers)
+    assert response.status_code == 400
+    
+    # Cursor pages keep reporting the filtered total
+    data = client.get(f"/api/v1/tasks/?cursor={cursor}&limit=1", headers=headers).json()
+    assert data["total"] == 3
+
+
 def test_get_task_by_id(client, auth_token):
     """Test getting a specific task by ID."""
     # Create a task
@@ -245,6 +403,24 @@ def test_update_task(client, auth_token):
     assert data["priority"] == "high"
 
 
+def test_update_task_without_changes(client, auth_token):
+    """Test that an empty update returns the task unchanged."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    created = client.post(
+        "/api/v1/tasks/",
+        json={"title": "Unchanged", "status": "done"},
+        headers=headers
+    ).json()
+    
+    response = client.put(f"/api/v1/tasks/{created['id']}", json={}, headers=headers)
+    assert response.status_code == 200
+    assert response.json() == created
+    
+    # A missing task is still not found
+    response = client.put("/api/v1/tasks/99999", json={}, headers=headers)
+    assert response.status_code == 404
+
+
 def test_update_nonexistent_task(client, auth_token):
     """Test updating a task that doesn't exist."""
     response = client.put(
@@ -371,6 +547,279 @@ def test_get_task_stats(client, auth_token):
     assert data["low_priority"] == 1
 
 
+def test_get_task_stats_beyond_page_limit(client, db, auth_token):
+    """Test that stats count every task, not just the first 1000."""
+    owner_id = client.get(
+        "/api/v1/auth/me",
+        headers={"Authorization": f"Bearer {auth_token}"}
+    ).json()["id"]
+    
+    db.add_all(
+        Task(title=f"Task {i}", owner_id=owner_id, priority=TaskPriority.HIGH)
+        for i in range(1005)
+    )
+    db.commit()
+    TaskCounterRepository(db).rebuild(owner_id)
+    
+    response = client.get(
+        "/api/v1/tasks/stats",
+        headers={"Authorization": f"Bearer {auth_token}"}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 1005
+    assert data["todo"] == 1005
+    assert data["completed"] == 0
+    assert data["high_priority"] == 1005
+    assert data["medium_priority"] == 0
+
+
+def test_bulk_create_tasks(client, auth_token):
+    """Test creating several tasks in one request."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    response = client.post(
+        "/api/v1/tasks/bulk",
+        json={"items": [
+            {"title": "Bulk 1", "priority": "high"},
+            {"title": "Bulk 2", "status": "done"},
+            {"title": "Bulk 3"},
+        ]},
+        headers=headers
+    )
+    assert response.status_code == 201
+    data = response.json()
+    assert data["succeeded"] == 3
+    assert data["failed"] == 0
+    assert [result["task"]["title"] for result in data["results"]] == ["Bulk 1", "Bulk 2", "Bulk 3"]
+    assert [result["index"] for result in data["results"]] == [0, 1, 2]
+    assert data["results"][1]["task"]["is_completed"] == True
+    
+    stats = client.get("/api/v1/tasks/stats", headers=headers).json()
+    assert stats["total"] == 3
+    assert stats["done"] == 1
+    assert stats["high_priority"] == 1
+
+
+def test_bulk_create_tasks_limits(client, auth_token):
+    """Test that empty and oversized bulk requests are rejected."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    response = client.post("/api/v1/tasks/bulk", json={"items": []}, headers=headers)
+    assert response.status_code == 422
+    
+    response = client.post(
+        "/api/v1/tasks/bulk",
+        json={"items": [{"title": f"Task {i}"} for i in range(settings.BULK_MAX_ITEMS + 1)]},
+        headers=headers
+    )
+    assert response.status_code == 422
+
+
+def test_bulk_update_tasks(client, auth_token):
+    """Test updating and completing several tasks with per-item results."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    created = client.post(
+        "/api/v1/tasks/bulk",
+        json={"items": [
+            {"title": "First", "priority": "low"},
+            {"title": "Second"},
+            {"title": "Third"},
+        ]},
+        headers=headers
+    ).json()
+    first, second, third = (result["id"] for result in created["results"])
+    
+    response = client.patch(
+        "/api/v1/tasks/bulk",
+        json={"items": [
+            {"id": first, "title": "First renamed", "priority": "high"},
+            {"id": second, "status": "done"},
+            {"id": 99999, "status": "done"},
+            {"id": first, "title": "Ignored"},
+            {"id": third},
+        ]},
+        headers=headers
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["succeeded"] == 3
+    assert data["failed"] == 2
+    
+    results = data["results"]
+    assert results[0]["task"]["title"] == "First renamed"
+    assert results[0]["task"]["priority"] == "high"
+    assert results[1]["task"]["status"] == "done"
+    assert results[1]["task"]["is_completed"] == True
+    assert results[2] == {"index": 2, "id": 99999, "ok": False, "task": None, "error": "Task not found"}
+    assert results[3]["error"] == "Duplicate task ID"
+    assert results[4]["task"]["title"] == "Third"
+    
+    assert client.get(f"/api/v1/tasks/{first}", headers=headers).json()["title"] == "First renamed"
+    stats = client.get("/api/v1/tasks/stats", headers=headers).json()
+    assert stats["total"] == 3
+    assert stats["todo"] == 2
+    assert stats["done"] == 1
+    assert stats["completed"] == 1
+    assert stats["high_priority"] == 1
+    assert stats["medium_priority"] == 2
+    assert stats["low_priority"] == 0
+
+
+def test_bulk_update_without_changes(client, db, auth_token):
+    """Test that a bulk item with only an id leaves the task and its ETag untouched."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    task_id = client.post("/api/v1/tasks/", json={"title": "Unchanged"}, headers=headers).json()["id"]
+    db.query(Task).filter(Task.id == task_id).update({"updated_at": datetime(2024, 1, 1, 12, 0, 0)})
+    db.commit()
+    etag = client.get("/api/v1/tasks/", headers=headers).headers["etag"]
+    
+    response = client.patch("/api/v1/tasks/bulk", json={"items": [{"id": task_id}]}, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["succeeded"] == 1
+    
+    assert client.get(f"/api/v1/tasks/{task_id}", headers=headers).json()["updated_at"].startswith("2024-01-01T12:00:00")
+    assert client.get("/api/v1/tasks/", headers=headers).headers["etag"] == etag
+
+
+def test_bulk_delete_tasks(client, auth_token):
+    """Test deleting several tasks with per-item results."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    created = client.post(
+        "/api/v1/tasks/bulk",
+        json={"items": [{"title": "Keep"}, {"title": "Drop", "status": "done"}, {"title": "Drop too"}]},
+        headers=headers
+    ).json()
+    keep, drop, drop_too = (result["id"] for result in created["results"])
+    
+    response = client.request(
+        "DELETE",
+        "/api/v1/tasks/bulk",
+        json={"ids": [drop, 99999, drop_too, drop]},
+        headers=headers
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["succeeded"] == 2
+    assert [result["ok"] for result in data["results"]] == [True, False, True, False]
+    assert data["results"][1]["error"] == "Task not found"
+    assert data["results"][3]["error"] == "Duplicate task ID"
+    
+    assert client.get(f"/api/v1/tasks/{keep}", headers=headers).status_code == 200
+    assert client.get(f"/api/v1/tasks/{drop}", headers=headers).status_code == 404
+    stats = client.get("/api/v1/tasks/stats", headers=headers).json()
+    assert stats["total"] == 1
+    assert stats["done"] == 0
+    assert stats["completed"] == 0
+
+
+def test_fast_json_responses_match_default_encoding(client, auth_token, monkeypatch):
+    """Test that pre-serialized task responses match FastAPI's own encoding."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    due_date = (datetime.utcnow() + timedelta(days=2)).isoformat()
+    client.post(
+        "/api/v1/tasks/bulk",
+        json={"items": [
+            {"title": "Plain"},
+            {"title": "Détails", "description": "Unicode ✓", "priority": "high", "due_date": due_date},
+            {"title": "Done", "status": "done"},
+        ]},
+        headers=headers
+    )
+    task_id = client.get("/api/v1/tasks/?limit=1", headers=headers).json()["tasks"][0]["id"]
+    
+    def fetch():
+        return [
+            client.get("/api/v1/tasks/?limit=2", headers=headers),
+            client.get("/api/v1/tasks/?sort_by=priority&order=asc", headers=headers),
+            client.get(f"/api/v1/tasks/{task_id}", headers=headers),
+            client.get("/api/v1/tasks/99999", headers=headers),
+            client.get("/api/v1/tasks/stats", headers=headers),
+        ]
+    
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+    fast = fetch()
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", False)
+    default = fetch()
+    
+    for fast_response, default_response in zip(fast, default):
+        assert fast_response.status_code == default_response.status_code
+        assert fast_response.headers["content-type"] == default_response.headers["content-type"]
+        assert fast_response.json() == default_response.json()
+    assert fast[0].json()["next_cursor"] is not None
+
+
+def test_task_counters_follow_writes(client, auth_token):
+    """Test that stats stay correct across create, update, complete and delete."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    first = client.post(
+        "/api/v1/tasks/",
+        json={"title": "First", "status": "todo", "priority": "high"},
+        headers=headers
+    ).json()
+    second = client.post(
+        "/api/v1/tasks/",
+        json={"title": "Second", "status": "in_progress", "priority": "low"},
+        headers=headers
+    ).json()
+    
+    client.put(f"/api/v1/tasks/{first['id']}", json={"priority": "medium"}, headers=headers)
+    client.patch(f"/api/v1/tasks/{second['id']}/complete", headers=headers)
+    
+    data = client.get("/api/v1/tasks/stats", headers=headers).json()
+    assert data["total"] == 2
+    assert data["todo"] == 1
+    assert data["in_progress"] == 0
+    assert data["done"] == 1
+    assert data["completed"] == 1
+    assert data["high_priority"] == 0
+    assert data["medium_priority"] == 1
+    assert data["low_priority"] == 1
+    
+    client.patch(f"/api/v1/tasks/{second['id']}/incomplete", headers=headers)
+    client.delete(f"/api/v1/tasks/{first['id']}", headers=headers)
+    
+    data = client.get("/api/v1/tasks/stats", headers=headers).json()
+    assert data["total"] == 1
+    assert data["todo"] == 1
+    assert data["done"] == 0
+    assert data["completed"] == 0
+    assert data["medium_priority"] == 0
+    assert data["low_priority"] == 1
+
+
+def test_rebuild_task_counters(client, db, auth_token):
+    """Test that a rebuild corrects counters after writes that bypassed them."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    client.post("/api/v1/tasks/", json={"title": "Tracked"}, headers=headers)
+    owner_id = client.get("/api/v1/auth/me", headers=headers).json()["id"]
+    
+    db.add(Task(title="Untracked", owner_id=owner_id, status=TaskStatus.DONE, is_completed=True))
+    db.commit()
+    assert client.get("/api/v1/tasks/stats", headers=headers).json()["total"] == 1
+    
+    TaskCounterRepository(db).rebuild()
+    
+    data = client.get("/api/v1/tasks/stats", headers=headers).json()
+    assert data["total"] == 2
+    assert data["done"] == 1
+    assert data["completed"] == 1
+
+
+def test_delete_user_cascades_to_tasks(client, db, auth_token):
+    """Test that deleting a user removes their tasks in the database."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    for i in range(3):
+        client.post("/api/v1/tasks/", json={"title": f"Task {i}"}, headers=headers)
+    owner_id = client.get("/api/v1/auth/me", headers=headers).json()["id"]
+    
+    # SQLite only enforces ON DELETE CASCADE with foreign keys enabled
+    db.execute(text("PRAGMA foreign_keys=ON"))
+    assert UserRepository(db).delete(owner_id) is True
+    
+    assert db.query(Task).filter(Task.owner_id == owner_id).count() == 0
+    assert db.query(TaskCounter).filter(TaskCounter.owner_id == owner_id).count() == 0
+    assert UserRepository(db).delete(owner_id) is False
+
+
 def test_user_can_only_access_own_tasks(client):
     """Test that users can only access their own tasks."""
     # Register and login user 1
@@ -418,3 +867,72 @@ def test_user_can_only_access_own_tasks(client):
     )
     assert response.status_code == 404  # Should not find the task
 
+
+
+def test_task_endpoint_query_budgets(client, auth_token, query_budget):
+    """Test that each task endpoint succeeds within its SQL statement budget."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    # Resolve the principal once so each budget covers the endpoint alone
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == 200
+    
+    with query_budget(2):
+        response = client.post("/api/v1/tasks/", json={"title": "Budget"}, headers=headers)
+    assert response.status_code == 201
+    task_id = response.json()["id"]
+    
+    with query_budget(3):
+        response = client.post("/api/v1/tasks/bulk", json={"items": [{"title": "A"}, {"title": "B"}]}, headers=headers)
+    assert response.status_code == 201
+    assert response.json()["succeeded"] == 2
+    
+    with query_budget(2):
+        response = client.get("/api/v1/tasks/", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["total"] == 3
+    
+    # Served from the page cache
+    with query_budget(1):
+        response = client.get("/api/v1/tasks/", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["total"] == 3
+    
+    with query_budget(2):
+        response = client.get(f"/api/v1/tasks/{task_id}", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["title"] == "Budget"
+    
+    with query_budget(3):
+        response = client.put(f"/api/v1/tasks/{task_id}", json={"priority": "high"}, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["priority"] == "high"
+    
+    with query_budget(3):
+        response = client.patch(f"/api/v1/tasks/{task_id}/complete", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["is_completed"] == True
+    
+    with query_budget(3):
+        response = client.patch(f"/api/v1/tasks/{task_id}/incomplete", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["is_completed"] == False
+    
+    with query_budget(2):
+        response = client.get("/api/v1/tasks/stats", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["high_priority"] == 1
+    
+    with query_budget(2):
+        response = client.delete(f"/api/v1/tasks/{task_id}", headers=headers)
+    assert response.status_code == 204
+
+
+def test_query_budget_reports_statements(client, auth_token, query_budget):
+    """Test that an exceeded budget fails with the statements that were issued."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    client.get("/api/v1/auth/me", headers=headers)
+    
+    with pytest.raises(pytest.fail.Exception, match="2 SQL statements issued, budget 1") as excinfo:
+        with query_budget(1):
+            client.get("/api/v1/tasks/stats", headers=headers)
+    assert "1. [GET /api/v1/tasks/stats] SELECT" in str(excinfo.value)
+    assert "FROM task_counters" in str(excinfo.value)
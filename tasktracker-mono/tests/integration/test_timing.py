@@ -0,0 +1,110 @@
+import logging
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.main import app
+from app.core.database import Base, get_db
+from app.core.timing import query_stats, track_queries
+
+# Test database URL (use SQLite for testing)
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_timing.db"
+
+# Create test engine; every statement counts as slow so the log can be checked
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False}
+)
+track_queries(engine, slow_query_seconds=1e-9)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db():
+    """Create a fresh database for each test."""
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="function")
+def client(db):
+    """Create a test client with database dependency override."""
+    def override_get_db():
+        try:
+            yield db
+        finally:
+            pass
+
+    app.dependency_overrides[get_db] = override_get_db
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="function")
+def headers(client):
+    """Register a user and return auth headers."""
+    credentials = {"username": "timinguser", "password": "testpass123"}
+    client.post("/api/v1/auth/register", json={"email": "timinguser@example.com", **credentials})
+    token = client.post("/api/v1/auth/login", json=credentials).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def server_timing(response):
+    """Parse Server-Timing into {name: {param: value}}."""
+    entries = {}
+    for entry in response.headers["server-timing"].split(","):
+        name, *params = entry.strip().split(";")
+        entries[name] = dict(param.split("=", 1) for param in params)
+    return entries
+
+
+def test_server_timing_header(client, headers):
+    """Test that responses report request and SQL time, leaving out SQL when none ran."""
+    response = client.get("/api/v1/tasks/stats", headers=headers)
+    timing = server_timing(response)
+    assert float(timing["app"]["dur"]) >= float(timing["app-db"]["dur"]) > 0
+    assert timing["app-db"]["desc"].endswith((' query"', ' queries"'))
+
+    assert list(server_timing(client.get("/health"))) == ["app"]
+
+
+def sample(metrics, name):
+    """Value of one sample in a /metrics body, 0 if absent."""
+    for line in metrics.splitlines():
+        if line.startswith(f"{name} "):
+            return float(line.rpartition(" ")[2])
+    return 0.0
+
+
+def test_request_metrics(client, headers):
+    """Test per-route request histograms and the SQL counters on /metrics."""
+    created = 'http_request_duration_seconds_count{method="POST",route="/api/v1/tasks/"}'
+    unmatched = 'http_request_duration_seconds_count{method="GET",route="unmatched"}'
+    before = client.get("/metrics").text
+
+    client.post("/api/v1/tasks/", json={"title": "Timed"}, headers=headers)
+    client.get("/api/v1/tasks/not-a-route/at-all", headers=headers)
+
+    metrics = client.get("/metrics").text
+    assert sample(metrics, created) == sample(before, created) + 1
+    assert sample(metrics, unmatched) == sample(before, unmatched) + 1
+    # Creating a task runs SQL, so the request is not in the zero-query bucket
+    no_queries = 'http_request_db_queries_bucket{method="POST",route="/api/v1/tasks/",le="0"}'
+    assert sample(metrics, no_queries) == sample(before, no_queries)
+    assert sample(metrics, "db_queries_total") == query_stats.queries > sample(before, "db_queries_total")
+
+
+def test_slow_query_log(client, headers, caplog):
+    """Test that statements over the threshold are logged with their request."""
+    slow_queries = query_stats.slow_queries
+    with caplog.at_level(logging.WARNING, logger="app.core.timing"):
+        client.get("/api/v1/tasks/", headers=headers)
+
+    assert query_stats.slow_queries > slow_queries
+    assert any("GET /api/v1/tasks/" in record.getMessage() and "SELECT" in record.getMessage() for record in caplog.records)
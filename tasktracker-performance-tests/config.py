@@ -39,6 +39,11 @@ TASK_WEIGHTS = {
     "delete": 3,     # 3% delete operations
 }
 
+# Bulk endpoint settings
+BULK_CONFIG = {
+    "batch_size": int(os.getenv("LOCUST_BULK_SIZE", "10")),  # Items per bulk request
+}
+
 # API Endpoints
 ENDPOINTS = {
     "register": "/auth/register",
@@ -48,6 +53,7 @@ ENDPOINTS = {
     "task_by_id": "/tasks/{id}",
     "task_complete": "/tasks/{id}/complete",
     "task_incomplete": "/tasks/{id}/incomplete",
+    "tasks_bulk": "/tasks/bulk",
     "stats": "/stats/",
 }
 
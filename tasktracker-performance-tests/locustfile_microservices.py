@@ -6,13 +6,14 @@ from locust import HttpUser, task, between, events
 from locust.runners import MasterRunner
 import random
 import logging
+from datetime import datetime, timedelta, timezone
 from utils import (
     generate_user_data, 
     generate_task_data, 
     generate_task_update,
     test_data_store
 )
-from config import ARCHITECTURES, TASK_WEIGHTS, USER_GENERATION
+from config import ARCHITECTURES, TASK_WEIGHTS, USER_GENERATION, BULK_CONFIG
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -30,7 +31,7 @@ class TaskTrackerUser(HttpUser):
     
     This user performs realistic operations through the API Gateway:
     - Logs in with existing credentials (User Service)
-    - Creates, reads, updates, and deletes tasks (Task Service)
+    - Creates, reads, updates, and deletes tasks, individually and in bulk (Task Service)
     - Checks statistics (Stats Service)
     - Performs operations with realistic frequency distribution
     """
@@ -112,6 +113,26 @@ class TaskTrackerUser(HttpUser):
                 name="[Tasks] Get Single"
             )
     
+    @task(int(TASK_WEIGHTS["read"] * 0.1))
+    def get_overdue_tasks(self):
+        """Get incomplete tasks past their due date."""
+        self.client.get(
+            f"{API_PREFIX}/tasks/overdue",
+            headers=self.headers,
+            name="[Tasks] Overdue"
+        )
+    
+    @task(int(TASK_WEIGHTS["read"] * 0.1))
+    def get_due_soon_tasks(self):
+        """Get incomplete tasks due within the next week."""
+        before = datetime.now(timezone.utc) + timedelta(days=7)
+        self.client.get(
+            f"{API_PREFIX}/tasks/due",
+            params={"before": before.isoformat()},
+            headers=self.headers,
+            name="[Tasks] Due Soon"
+        )
+    
     @task(TASK_WEIGHTS["write"])
     def create_task(self):
         """Create a new task."""
@@ -172,6 +193,41 @@ class TaskTrackerUser(HttpUser):
                 name="[Tasks] Mark Incomplete"
             )
     
+    @task(int(TASK_WEIGHTS["write"] * 0.1))
+    def bulk_import_and_triage(self):
+        """Create a batch of tasks, then complete half and delete the rest in bulk."""
+        response = self.client.post(
+            f"{API_PREFIX}/tasks/bulk",
+            json={"items": [generate_task_data() for _ in range(BULK_CONFIG["batch_size"])]},
+            headers=self.headers,
+            name="[Tasks] Bulk Create"
+        )
+        
+        if response.status_code != 201:
+            return
+        
+        task_ids = [result["id"] for result in response.json()["results"] if result["ok"]]
+        half = len(task_ids) // 2
+        if half == 0:  # Bulk requests need at least one item each
+            return
+        
+        self.client.patch(
+            f"{API_PREFIX}/tasks/bulk",
+            json={"items": [{"id": task_id, "status": "done"} for task_id in task_ids[:half]]},
+            headers=self.headers,
+            name="[Tasks] Bulk Complete"
+        )
+        
+        self.client.delete(
+            f"{API_PREFIX}/tasks/bulk",
+            json={"ids": task_ids[half:]},
+            headers=self.headers,
+            name="[Tasks] Bulk Delete"
+        )
+        
+        for task_id in task_ids[:half]:
+            test_data_store.add_task_id(self.username, task_id)
+    
     @task(TASK_WEIGHTS["delete"])
     def delete_task(self):
         """Delete a task."""
@@ -5,7 +5,7 @@ import random
 import string
 from typing import Dict, List
 from faker import Faker
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 fake = Faker()
 
@@ -31,10 +31,11 @@ def generate_task_data() -> Dict:
     statuses = ["todo", "in_progress", "done"]
     priorities = ["low", "medium", "high"]
     
-    # Some tasks have due dates, some don't
+    # Some tasks have due dates, some don't; about a quarter of those are
+    # already past due so the overdue view has rows to return
     due_date = None
     if random.random() > 0.3:  # 70% have due dates
-        due_date = (datetime.now() + timedelta(days=random.randint(1, 30))).isoformat()
+        due_date = (datetime.now(timezone.utc) + timedelta(days=random.randint(-10, 30))).isoformat()
     
     task = {
         "title": fake.sentence(nb_words=6)[:-1],  # Remove trailing period